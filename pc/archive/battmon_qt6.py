@@ -11,18 +11,20 @@ the Free Software Foundation; either version 2 of the License, or
 """
 
 import sys
-import subprocess
+import shutil
 import os
 import configparser
 import datetime
 import io
+import glob
+import re
 
 try:
     from PyQt6.QtWidgets import (QApplication, QSystemTrayIcon, QMenu, QMessageBox, 
                                  QWidget, QVBoxLayout, QHBoxLayout, QLabel, QProgressBar,
                                  QPushButton)
-    from PyQt6.QtCore import QTimer, Qt, pyqtSignal, QSize
-    from PyQt6.QtGui import QIcon, QPixmap, QPainter, QBrush, QColor, QPen, QFont, QAction, QPolygon
+    from PyQt6.QtCore import QTimer, Qt, pyqtSignal, QSize, QProcess, QLine
+    from PyQt6.QtGui import QIcon, QPixmap, QPainter, QBrush, QColor, QPen, QFont, QAction, QPolygon, QPainterPath
     QT6_AVAILABLE = True
 except ImportError:
     print("PyQt6 not found. Please install it with:")
@@ -32,22 +34,100 @@ except ImportError:
     sys.exit(1)
 
 ACPI_CMD = 'acpi'
-TIMEOUT = 2000  # milliseconds
+ICON_CACHE_MAX = 512  # (percentage, is_charging, size) entries kept before evicting the oldest
+SYSFS_BATTERY_GLOB = '/sys/class/power_supply/BAT*'
+# Matches acpi lines like "Battery 0: Discharging, 85%, 02:10:13 remaining"
+_ACPI_RE = re.compile(r'Battery \d+:\s*([^,]+),\s*(\d+)%(?:,\s*(\d{2}:\d{2}:\d{2}))?')
+TIMEOUT = 5000  # milliseconds - battery level changes over minutes, not seconds
 VERSION = '0.4.2'
 config = False
 config_path = os.path.expanduser('~/.battmon')
 
+def icon_geometry(size):
+    """Scaled battery icon dimensions for the given icon size"""
+    scale = size / 24.0
+    battery_x = int(1 * scale)
+    battery_y = int(6 * scale)  # Move up to use upper space
+    battery_width = int(20 * scale)  # Make wider
+    return dict(
+        battery_x=battery_x,
+        battery_y=battery_y,
+        battery_width=battery_width,
+        battery_height=int(10 * scale),  # Make taller
+        terminal_x=battery_x + battery_width,
+        terminal_y=battery_y + int(2 * scale),
+        terminal_width=int(2 * scale),
+        terminal_height=int(6 * scale),  # Make terminal taller too
+        background_height=int(16 * scale),
+        outline_pen=QPen(Qt.GlobalColor.black, max(1, int(2.5 * scale))),
+        bolt_pen=QPen(QColor(255, 235, 59), max(1, int(scale))),
+        bolt_outline_pen=QPen(Qt.GlobalColor.white, max(1, int(2 * scale))),
+        # Simplified lightning bolt, drawn as two line segments
+        bolt_lines=[
+            QLine(int(10 * scale), int(4 * scale), int(14 * scale), int(10 * scale)),
+            QLine(int(14 * scale), int(6 * scale), int(10 * scale), int(12 * scale)),
+        ],
+        font=QFont("Arial", max(8, int(10 * scale)), QFont.Weight.Bold),
+        text_y=int(23 * scale),  # Slightly lower to accommodate taller battery
+        # Stroked on both sides of the glyph edge, so twice the outline width
+        text_outline_pen=QPen(Qt.GlobalColor.black, max(1, int(3 * scale)) * 2),
+    )
+
+# Drawing tools shared by every icon render: (fill, background) brushes per color tier
+ICON_TIER_BRUSHES = (
+    (QBrush(QColor(76, 175, 80)), QBrush(QColor(200, 255, 200, 180))),   # Green (100-75%)
+    (QBrush(QColor(255, 235, 59)), QBrush(QColor(255, 255, 200, 180))),  # Yellow (74-50%)
+    (QBrush(QColor(255, 152, 0)), QBrush(QColor(255, 230, 180, 180))),   # Orange (49-30%)
+    (QBrush(QColor(244, 67, 54)), QBrush(QColor(255, 200, 200, 180))),   # Red (29-0%)
+)
+ICON_EMPTY_BRUSH = QBrush(QColor(240, 240, 240, 200))  # Light gray for empty area
+ICON_BOLT_BRUSH = QBrush(QColor(255, 235, 59))         # Yellow
+ICON_BLACK_BRUSH = QBrush(Qt.GlobalColor.black)
+ICON_WHITE_BRUSH = QBrush(Qt.GlobalColor.white)
+ICON_CLEAR_BRUSH = QBrush(Qt.GlobalColor.transparent)
+ICON_CLEAR_PEN = QPen(Qt.GlobalColor.transparent)
+
+def battery_bucket(percentage):
+    """Color tier for a battery level: 0 green, 1 yellow, 2 orange, 3 red"""
+    if percentage >= 75:
+        return 0
+    elif percentage >= 50:
+        return 1
+    elif percentage >= 30:
+        return 2
+    return 3
+
+# The tray always uses 24px icons, so that geometry is computed once up front
+_ICON24 = icon_geometry(24)
+
 class BatteryWidget(QWidget):
     """A widget to display battery information in a window"""
     
-    def __init__(self):
+    # Progress bar and percentage label styles per color tier (index = battery_bucket())
+    PROGRESS_BAR_QSS = tuple(f"""
+            QProgressBar {{
+                border: 2px solid #cccccc;
+                border-radius: 5px;
+                text-align: center;
+                font-weight: bold;
+            }}
+            QProgressBar::chunk {{
+                background-color: {color};
+                border-radius: 3px;
+            }}
+        """ for color in ("#4CAF50", "#FFEB3B", "#FF9800", "#F44336"))  # Green, Yellow, Orange, Red
+    PERCENTAGE_LABEL_QSS = ("color: #2E7D32;", "color: #F57F17;", "color: #F57C00;", "color: #C62828;")
+    
+    def __init__(self, icon_pixmap):
         super().__init__()
         self.setWindowTitle("BattMon Qt6 - Battery Status")
         self.setFixedSize(350, 200)
         self.setWindowFlags(Qt.WindowType.WindowStaysOnTopHint)
         
-        # Set window icon
-        icon_pixmap = self.create_window_icon()
+        # Color tier last applied to the progress bar (stylesheets only change on a tier change)
+        self._last_color_bucket = None
+        
+        # Set window icon (shared with the application icon)
         self.setWindowIcon(QIcon(icon_pixmap))
         
         layout = QVBoxLayout()
@@ -55,7 +135,7 @@ class BatteryWidget(QWidget):
         # Title
         title_layout = QHBoxLayout()
         title_icon = QLabel()
-        title_icon.setPixmap(icon_pixmap.scaled(32, 32, Qt.AspectRatioMode.KeepAspectRatio, Qt.TransformationMode.SmoothTransformation))
+        title_icon.setPixmap(icon_pixmap)
         
         title_label = QLabel("BattMon Qt6")
         title_font = title_label.font()
@@ -138,25 +218,6 @@ class BatteryWidget(QWidget):
             }
         """)
         
-    def create_window_icon(self):
-        """Create a window icon"""
-        pixmap = QPixmap(32, 32)
-        pixmap.fill(Qt.GlobalColor.transparent)
-        
-        painter = QPainter(pixmap)
-        painter.setRenderHint(QPainter.RenderHint.Antialiasing)
-        
-        # Draw battery outline
-        painter.setPen(QPen(QColor(0, 0, 0), 2))
-        painter.setBrush(QBrush(QColor(100, 200, 100)))
-        painter.drawRect(4, 12, 22, 10)
-        
-        # Draw battery terminal
-        painter.fillRect(26, 15, 3, 4, QBrush(QColor(0, 0, 0)))
-        
-        painter.end()
-        return pixmap
-        
     def update_battery_info(self, info):
         """Update the widget with battery information"""
         percentage = info['percentage']
@@ -174,33 +235,15 @@ class BatteryWidget(QWidget):
         self.progress_bar.setValue(percentage)
         
         # Color-code the progress bar and percentage (4-tier system)
-        if percentage >= 75:
-            color = "#4CAF50"  # Green (100-75%)
-            text_color = "#2E7D32"
-        elif percentage >= 50:
-            color = "#FFEB3B"  # Yellow (74-50%)
-            text_color = "#F57F17"
-        elif percentage >= 30:
-            color = "#FF9800"  # Orange (49-30%)
-            text_color = "#F57C00"
-        else:
-            color = "#F44336"  # Red (29-0%)
-            text_color = "#C62828"
-            
-        self.progress_bar.setStyleSheet(f"""
-            QProgressBar {{
-                border: 2px solid #cccccc;
-                border-radius: 5px;
-                text-align: center;
-                font-weight: bold;
-            }}
-            QProgressBar::chunk {{
-                background-color: {color};
-                border-radius: 3px;
-            }}
-        """)
+        bucket = battery_bucket(percentage)
+        
+        # Restyling forces a stylesheet reparse and relayout, so skip it within a tier
+        if bucket == self._last_color_bucket:
+            return
+        self._last_color_bucket = bucket
         
-        self.percentage_label.setStyleSheet(f"color: {text_color};")
+        self.progress_bar.setStyleSheet(self.PROGRESS_BAR_QSS[bucket])
+        self.percentage_label.setStyleSheet(self.PERCENTAGE_LABEL_QSS[bucket])
 
 class BattMonQt6(QWidget):
     """Main BattMon Qt6 application"""
@@ -214,26 +257,47 @@ class BattMonQt6(QWidget):
                                "System tray is not available on this system.")
             sys.exit(1)
         
-        self.battery_widget = None
         self.last_percentage = None
         self.last_state = None
+        self._last_bucket = None
+        # Last (percentage, state, is_charging) and tooltip pushed to the tray
+        self._last_tray_key = None
+        self._last_tooltip = None
+        
+        # sysfs battery directory, located once (None = fall back to acpi)
+        battery_paths = sorted(glob.glob(SYSFS_BATTERY_GLOB))
+        self._bat_path = battery_paths[0] if battery_paths else None
+        
+        # Without a usable sysfs reading, acpi runs asynchronously so the event loop
+        # never blocks on it; its last parsed result is what get_battery_info() reports
+        self._acpi_info = {'state': "Unknown", 'percentage': 0, 'time': None}
+        self._acpi_proc = None  # QProcess, created on the first acpi query
         
         # Pulsing animation state
         self.pulse_opacity = 1.0
         self.pulse_direction = -0.3  # Fade direction and speed
         self.pulse_timer = None
         
+        # Rendered icons keyed by (percentage, is_charging, size)
+        self._icon_cache = {}
+        
         # Create system tray icon
         self.tray_icon = QSystemTrayIcon(self)
         self.tray_icon.setToolTip("BattMon Qt6 - Battery Monitor")
         
+        # Build the battery window up front (hidden) so the first click shows it instantly
+        self.battery_widget = BatteryWidget(QApplication.windowIcon().pixmap(32, 32))
+        self.battery_widget.hide()
+        
         # Create context menu
         self.create_tray_menu()
         
-        # Set up timer for battery updates
-        self.timer = QTimer()
+        # Set up timer for battery updates (coarse: no need for high-resolution wakeups)
+        self.timer = QTimer(self)
+        self.timer.setTimerType(Qt.TimerType.CoarseTimer)
+        self.timer.setInterval(TIMEOUT)
         self.timer.timeout.connect(self.update_battery)
-        self.timer.start(TIMEOUT)
+        self.timer.start()
         
         # Initial battery update
         self.update_battery()
@@ -284,9 +348,6 @@ class BattMonQt6(QWidget):
     
     def show_battery_window(self):
         """Show the battery information window"""
-        if self.battery_widget is None:
-            self.battery_widget = BatteryWidget()
-        
         # Update with current battery info
         info = self.get_battery_info()
         self.battery_widget.update_battery_info(info)
@@ -341,27 +402,102 @@ License: GPL v2+</p>"""
             self.battery_widget.close()
         QApplication.quit()
     
+    def read_sysfs_value(self, name):
+        """Read one attribute from the battery's sysfs directory, or None if missing"""
+        try:
+            with open(os.path.join(self._bat_path, name), 'rb') as f:
+                return f.read().strip().decode('ascii')
+        except OSError:
+            return None
+    
+    def get_battery_info_sysfs(self):
+        """Get battery information straight from sysfs (no acpi process)"""
+        capacity = self.read_sysfs_value('capacity')
+        state = self.read_sysfs_value('status')
+        if capacity is None or state is None:
+            return None
+        
+        # Time remaining from energy (uWh/uW) or charge (uAh/uA) counters
+        time = None
+        if state in ('Charging', 'Discharging'):
+            for now_name, full_name, rate_name in (('energy_now', 'energy_full', 'power_now'),
+                                                   ('charge_now', 'charge_full', 'current_now')):
+                now = self.read_sysfs_value(now_name)
+                rate = self.read_sysfs_value(rate_name)
+                if now is None or not rate or int(rate) == 0:
+                    continue
+                if state == 'Charging':
+                    full = self.read_sysfs_value(full_name)
+                    if full is None:
+                        break
+                    hours = (int(full) - int(now)) / abs(int(rate))
+                else:
+                    hours = int(now) / abs(int(rate))
+                seconds = max(0, int(hours * 3600))
+                time = f"{seconds // 3600:02d}:{seconds % 3600 // 60:02d}:{seconds % 60:02d}"
+                break
+        
+        return {
+            'state': state,
+            'percentage': int(capacity),
+            'time': time
+        }
+    
+    def read_sysfs_battery_info(self):
+        """Read sysfs battery information, or None if there is no usable reading"""
+        if self._bat_path:
+            try:
+                return self.get_battery_info_sysfs()
+            except ValueError as e:
+                print(f"Error reading sysfs battery info: {e}")
+        return None
+    
     def get_battery_info(self):
-        """Get battery information from acpi"""
+        """Get battery information from sysfs, falling back to the last acpi result"""
+        info = self.read_sysfs_battery_info()
+        if info is not None:
+            return info
+        
+        # sysfs is missing or failed: refresh acpi in the background
+        self.start_acpi_query()
+        return self._acpi_info
+    
+    def start_acpi_query(self):
+        """Start an asynchronous acpi query unless one is already running"""
+        if self._acpi_proc is None:
+            self._acpi_proc = QProcess(self)
+            self._acpi_proc.finished.connect(self._on_acpi_finished)
+            self._acpi_proc.errorOccurred.connect(self._on_acpi_error)
+        if self._acpi_proc.state() == QProcess.ProcessState.NotRunning:
+            self._acpi_proc.start(ACPI_CMD, [])
+    
+    def _on_acpi_finished(self, exit_code, exit_status):
+        """Parse acpi output once the background process completes"""
+        text = self._acpi_proc.readAllStandardOutput().data().decode('utf-8').strip()
+        self._acpi_info = self.parse_acpi_output(text)
+        self.apply_battery_info(self._acpi_info)
+    
+    def _on_acpi_error(self, error):
+        """Report an acpi process that could not be started"""
+        if error == QProcess.ProcessError.FailedToStart:
+            print(f"Error getting battery info: could not start {ACPI_CMD}")
+            self._acpi_info = {'state': "Error", 'percentage': 0, 'time': None}
+            self.apply_battery_info(self._acpi_info)
+    
+    def parse_acpi_output(self, text):
+        """Parse acpi output into a battery info dict"""
         try:
-            text = subprocess.check_output(ACPI_CMD, shell=True).decode('utf-8').strip()
-            if 'Battery' not in text:
+            match = _ACPI_RE.search(text) if 'Battery' in text else None
+            if match is None:
                 return {
                     'state': "Unknown",
                     'percentage': 0,
                     'time': None
                 }
             
-            data = text.split(',')
-            state = data[0].split(':')[1].strip()
-            percentage_str = data[1].strip(' %')
-            percentage = int(percentage_str)
-            time = None
-            
-            if len(data) > 2 and state not in ('Full', 'Unknown'):
-                time_part = data[2].strip()
-                if ' ' in time_part:
-                    time = time_part.split(' ')[1]
+            state = match.group(1).strip()
+            percentage = int(match.group(2))
+            time = match.group(3) if state not in ('Full', 'Unknown') else None
             
             return {
                 'state': state,
@@ -392,6 +528,8 @@ License: GPL v2+</p>"""
             self.pulse_timer.stop()
             self.pulse_timer = None
         self.pulse_opacity = 1.0
+        # Pulse frames drew over the tray icon, so force the next static redraw
+        self._last_tray_key = None
         
     def pulse_update(self):
         """Update pulse animation state"""
@@ -413,7 +551,31 @@ License: GPL v2+</p>"""
         self.tray_icon.setIcon(icon)
     
     def create_battery_icon(self, percentage, is_charging=False, size=24, opacity=1.0):
-        """Create a battery icon using Qt's superior image handling with better space utilization"""
+        """Create a battery icon, reusing a cached rendering when available"""
+        key = (percentage, is_charging, size)
+        icon = self._icon_cache.get(key)
+        if icon is None:
+            if len(self._icon_cache) >= ICON_CACHE_MAX:
+                # FIFO eviction: dicts keep insertion order
+                del self._icon_cache[next(iter(self._icon_cache))]
+            icon = QIcon(self.render_battery_pixmap(percentage, is_charging, size))
+            self._icon_cache[key] = icon
+        
+        # Apply global opacity if specified (for pulsing effect)
+        if opacity < 1.0:
+            pixmap = icon.pixmap(size, size)
+            temp_pixmap = QPixmap(pixmap.size())
+            temp_pixmap.fill(Qt.GlobalColor.transparent)
+            temp_painter = QPainter(temp_pixmap)
+            temp_painter.setOpacity(opacity)
+            temp_painter.drawPixmap(0, 0, pixmap)
+            temp_painter.end()
+            return QIcon(temp_pixmap)
+        
+        return icon
+    
+    def render_battery_pixmap(self, percentage, is_charging, size):
+        """Render a battery icon using Qt's superior image handling with better space utilization"""
         # Create a pixmap
         pixmap = QPixmap(size, size)
         pixmap.fill(Qt.GlobalColor.transparent)
@@ -422,90 +584,56 @@ License: GPL v2+</p>"""
         painter.setRenderHint(QPainter.RenderHint.Antialiasing)
         
         # Scale dimensions based on icon size
-        scale = size / 24.0
+        g = _ICON24 if size == 24 else icon_geometry(size)
         
         # Choose color based on battery level (4-tier system)
-        if percentage >= 75:
-            color = QColor(76, 175, 80)   # Green (100-75%)
-            bg_color = QColor(200, 255, 200, 180)  # Light green background
-        elif percentage >= 50:
-            color = QColor(255, 235, 59)  # Yellow (74-50%)
-            bg_color = QColor(255, 255, 200, 180)  # Light yellow background
-        elif percentage >= 30:
-            color = QColor(255, 152, 0)   # Orange (49-30%)
-            bg_color = QColor(255, 230, 180, 180)  # Light orange background
-        else:
-            color = QColor(244, 67, 54)   # Red (29-0%)
-            bg_color = QColor(255, 200, 200, 180)  # Light red background
-        
-        # Use more of the available space - make battery larger and move it up
-        battery_x = int(1 * scale)
-        battery_y = int(6 * scale)  # Move up to use upper space
-        battery_width = int(20 * scale)  # Make wider
-        battery_height = int(10 * scale)  # Make taller
-        terminal_width = int(2 * scale)
-        terminal_height = int(6 * scale)  # Make terminal taller too
+        fill_brush, bg_brush = ICON_TIER_BRUSHES[battery_bucket(percentage)]
         
         # Add a subtle background color fill in upper area to reinforce color coding
         if size >= 20:  # Only for larger icons
-            painter.setBrush(QBrush(bg_color))
-            painter.setPen(QPen(Qt.GlobalColor.transparent))
-            painter.drawRoundedRect(0, 0, size, int(16 * scale), 2, 2)
+            painter.setBrush(bg_brush)
+            painter.setPen(ICON_CLEAR_PEN)
+            painter.drawRoundedRect(0, 0, size, g['background_height'], 2, 2)
         
         # Draw battery fill based on percentage
-        fill_width = int((battery_width * percentage) / 100)
+        fill_width = int((g['battery_width'] * percentage) / 100)
         if fill_width > 0:
-            painter.setBrush(QBrush(color))
-            painter.setPen(QPen(Qt.GlobalColor.transparent))
-            painter.drawRect(battery_x, battery_y, fill_width, battery_height)
+            painter.setBrush(fill_brush)
+            painter.setPen(ICON_CLEAR_PEN)
+            painter.drawRect(g['battery_x'], g['battery_y'], fill_width, g['battery_height'])
         
         # Draw empty battery area (if not full)
-        if fill_width < battery_width:
-            empty_color = QColor(240, 240, 240, 200)  # Light gray for empty area
-            painter.setBrush(QBrush(empty_color))
-            painter.setPen(QPen(Qt.GlobalColor.transparent))
-            painter.drawRect(battery_x + fill_width, battery_y, 
-                           battery_width - fill_width, battery_height)
+        if fill_width < g['battery_width']:
+            painter.setBrush(ICON_EMPTY_BRUSH)
+            painter.setPen(ICON_CLEAR_PEN)
+            painter.drawRect(g['battery_x'] + fill_width, g['battery_y'],
+                           g['battery_width'] - fill_width, g['battery_height'])
         
         # Draw battery outline with thicker line for better visibility
-        painter.setBrush(QBrush(Qt.GlobalColor.transparent))
-        painter.setPen(QPen(Qt.GlobalColor.black, max(1, int(2.5 * scale))))
-        painter.drawRect(battery_x, battery_y, battery_width, battery_height)
+        painter.setBrush(ICON_CLEAR_BRUSH)
+        painter.setPen(g['outline_pen'])
+        painter.drawRect(g['battery_x'], g['battery_y'], g['battery_width'], g['battery_height'])
         
         # Draw battery terminal (positive end)
-        terminal_x = battery_x + battery_width
-        terminal_y = battery_y + int(2 * scale)
-        painter.setBrush(QBrush(Qt.GlobalColor.black))
-        painter.setPen(QPen(Qt.GlobalColor.transparent))
-        painter.drawRect(terminal_x, terminal_y, terminal_width, terminal_height)
+        painter.setBrush(ICON_BLACK_BRUSH)
+        painter.setPen(ICON_CLEAR_PEN)
+        painter.drawRect(g['terminal_x'], g['terminal_y'], g['terminal_width'], g['terminal_height'])
         
         # Add charging indicator if charging
         if is_charging:
-            painter.setBrush(QBrush(QColor(255, 235, 59)))  # Yellow
-            painter.setPen(QPen(QColor(255, 235, 59), max(1, int(scale))))
-            
-            # Create lightning bolt polygon
-            lightning_points = [
-                (int(10 * scale), int(4 * scale)),   # Top
-                (int(14 * scale), int(8 * scale)),   # Middle right
-                (int(12 * scale), int(8 * scale)),   # Middle left  
-                (int(16 * scale), int(12 * scale)),  # Bottom right
-                (int(12 * scale), int(8 * scale)),   # Back to middle
-                (int(14 * scale), int(8 * scale)),   # Complete shape
-            ]
+            painter.setBrush(ICON_BOLT_BRUSH)
+            painter.setPen(g['bolt_pen'])
             
             # Draw simplified lightning bolt
-            painter.drawLine(int(10 * scale), int(4 * scale), int(14 * scale), int(10 * scale))
-            painter.drawLine(int(14 * scale), int(6 * scale), int(10 * scale), int(12 * scale))
+            painter.drawLines(g['bolt_lines'])
             
             # Add white outline for visibility
-            painter.setPen(QPen(Qt.GlobalColor.white, max(1, int(2 * scale))))
-            painter.drawLine(int(10 * scale), int(4 * scale), int(14 * scale), int(10 * scale))
-            painter.drawLine(int(14 * scale), int(6 * scale), int(10 * scale), int(12 * scale))
+            painter.setPen(g['bolt_outline_pen'])
+            painter.drawLines(g['bolt_lines'])
         
         # Add percentage text in the lower area below the battery
         if size >= 16:  # Only add text for larger icons
-            font = QFont("Arial", max(8, int(10 * scale)), QFont.Weight.Bold)
+            font = g['font']
             painter.setFont(font)
             
             text = str(percentage)
@@ -514,57 +642,50 @@ License: GPL v2+</p>"""
             
             # Center text in lower part, below the new battery position
             text_x = (size - text_rect.width()) // 2
-            text_y = int(23 * scale)  # Slightly lower to accommodate taller battery
+            text_y = g['text_y']
             
             # Draw text with outline for better visibility
-            outline_width = max(1, int(3 * scale))
+            text_path = QPainterPath()
+            text_path.addText(text_x, text_y, font, text)
             
-            # Black outline
-            for dx in range(-outline_width, outline_width + 1):
-                for dy in range(-outline_width, outline_width + 1):
-                    if dx != 0 or dy != 0:
-                        painter.setPen(QPen(Qt.GlobalColor.black))
-                        painter.drawText(text_x + dx, text_y + dy, text)
+            # Black outline (one stroke pass instead of a drawText per offset)
+            painter.setPen(g['text_outline_pen'])
+            painter.setBrush(Qt.BrushStyle.NoBrush)
+            painter.drawPath(text_path)
             
             # White text
-            painter.setPen(QPen(Qt.GlobalColor.white))
-            painter.drawText(text_x, text_y, text)
+            painter.fillPath(text_path, ICON_WHITE_BRUSH)
         
         painter.end()
         
-        # Apply global opacity if specified (for pulsing effect)
-        if opacity < 1.0:
-            temp_pixmap = QPixmap(pixmap.size())
-            temp_pixmap.fill(Qt.GlobalColor.transparent)
-            temp_painter = QPainter(temp_pixmap)
-            temp_painter.setOpacity(opacity)
-            temp_painter.drawPixmap(0, 0, pixmap)
-            temp_painter.end()
-            return QIcon(temp_pixmap)
-        
-        return QIcon(pixmap)
+        return pixmap
     
     def update_battery(self):
         """Update battery status and icon"""
-        info = self.get_battery_info()
+        info = self.read_sysfs_battery_info()
+        if info is not None:
+            self.apply_battery_info(info)
+            return
+        
+        # No sysfs reading: results arrive in _on_acpi_finished (the tick is
+        # skipped if acpi is still running)
+        self.start_acpi_query()
+    
+    def apply_battery_info(self, info):
+        """Update the tray icon, tooltip, menu and window from a battery reading"""
         percentage = info['percentage']
         state = info['state']
         is_charging = state not in ('Discharging', 'Full', 'Unknown')
         
-        # Check if we should show a notification
-        show_message = False
-        if self.last_percentage is None:
+        # Check if we should show a notification: on startup, on a state change,
+        # or when the level crosses into another color tier
+        bucket = battery_bucket(percentage)
+        show_message = (self.last_percentage is None or state != self.last_state
+                        or bucket != self._last_bucket)
+        if show_message:
             self.last_percentage = percentage
             self.last_state = state
-            show_message = True
-        else:
-            percentage_diff = abs(percentage - self.last_percentage)
-            state_changed = state != self.last_state
-            show_message = percentage_diff >= 5 or state_changed
-            
-            if show_message:
-                self.last_percentage = percentage
-                self.last_state = state
+            self._last_bucket = bucket
         
         # Handle pulse animation based on battery level and charging state
         if not is_charging:  # Only pulse when not charging
@@ -581,34 +702,40 @@ License: GPL v2+</p>"""
             if self.pulse_timer and self.pulse_timer.isActive():
                 self.stop_pulse_animation()
         
-        # Update system tray icon (only if not pulsing to avoid conflicts)
-        if not self.pulse_timer or not self.pulse_timer.isActive():
-            icon = self.create_battery_icon(percentage, is_charging, 24)
-            self.tray_icon.setIcon(icon)
-        
-        # Update tooltip
+        # Update tooltip (the time remaining can change while the percentage doesn't)
         tooltip = f"BattMon Qt6\nBattery: {percentage}% ({state})"
         if info.get('time'):
             tooltip += f"\nTime: {info['time']}"
-        self.tray_icon.setToolTip(tooltip)
-        
-        # Update context menu status
-        self.status_action.setText(f"Battery: {percentage}% ({state})")
+        if tooltip != self._last_tooltip:
+            self.tray_icon.setToolTip(tooltip)
+            self._last_tooltip = tooltip
         
         # Update battery window if it's open
         if self.battery_widget and self.battery_widget.isVisible():
             self.battery_widget.update_battery_info(info)
         
+        # Icon and menu text only depend on percentage and state
+        tray_key = (percentage, state, is_charging)
+        if tray_key == self._last_tray_key and not show_message:
+            return
+        self._last_tray_key = tray_key
+        
+        # Update system tray icon (only if not pulsing to avoid conflicts)
+        if not self.pulse_timer or not self.pulse_timer.isActive():
+            icon = self.create_battery_icon(percentage, is_charging, 24)
+            self.tray_icon.setIcon(icon)
+        
+        # Update context menu status
+        self.status_action.setText(f"Battery: {percentage}% ({state})")
+        
         # Print status message
         if show_message:
             print(f"Battery: {percentage}% {state}")
 
 def check_dependencies():
     """Check if required dependencies are available"""
-    try:
-        # Check if acpi is available
-        subprocess.check_output(ACPI_CMD, shell=True, stderr=subprocess.DEVNULL)
-    except (subprocess.CalledProcessError, FileNotFoundError):
+    # acpi is only needed when there is no sysfs battery to read
+    if not glob.glob(SYSFS_BATTERY_GLOB) and shutil.which(ACPI_CMD) is None:
         print("Error: ACPI utility not found. Please install acpi:")
         print("  sudo apt install acpi")
         return False
@@ -637,19 +764,22 @@ def main():
     
     # Set application icon
     app_icon = QIcon()
-    # Create multiple sizes for better scaling
-    for size in [16, 24, 32, 48, 64]:
-        pixmap = QPixmap(size, size)
-        pixmap.fill(Qt.GlobalColor.transparent)
-        painter = QPainter(pixmap)
-        painter.setRenderHint(QPainter.RenderHint.Antialiasing)
-        scale = size / 24.0
-        painter.setBrush(QBrush(QColor(76, 175, 80)))
-        painter.setPen(QPen(Qt.GlobalColor.black, max(1, int(2 * scale))))
-        painter.drawRect(int(2 * scale), int(8 * scale), int(18 * scale), int(8 * scale))
-        painter.fillRect(int(20 * scale), int(10 * scale), int(2 * scale), int(4 * scale), QBrush(Qt.GlobalColor.black))
-        painter.end()
-        app_icon.addPixmap(pixmap)
+    # Paint one 64px master and scale it down for the smaller sizes
+    size = 64
+    master = QPixmap(size, size)
+    master.fill(Qt.GlobalColor.transparent)
+    painter = QPainter(master)
+    painter.setRenderHint(QPainter.RenderHint.Antialiasing)
+    scale = size / 24.0
+    painter.setBrush(QBrush(QColor(76, 175, 80)))
+    painter.setPen(QPen(Qt.GlobalColor.black, max(1, int(2 * scale))))
+    painter.drawRect(int(2 * scale), int(8 * scale), int(18 * scale), int(8 * scale))
+    painter.fillRect(int(20 * scale), int(10 * scale), int(2 * scale), int(4 * scale), QBrush(Qt.GlobalColor.black))
+    painter.end()
+    for size in [16, 24, 32, 48]:
+        app_icon.addPixmap(master.scaled(size, size, Qt.AspectRatioMode.KeepAspectRatio,
+                                         Qt.TransformationMode.SmoothTransformation))
+    app_icon.addPixmap(master)
     
     app.setWindowIcon(app_icon)
     
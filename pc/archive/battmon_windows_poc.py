@@ -8,10 +8,19 @@ Cross-platform battery monitor using psutil and pystray
 import os
 import sys
 import time
+import subprocess
 import threading
 import configparser
+import logging
 from datetime import datetime
 
+# Runtime messages go through logging so formatting is deferred until a
+# handler actually emits them; main() keeps plain prints for its checklist
+logger = logging.getLogger('battmon')
+logger.addHandler(logging.StreamHandler(sys.stdout))
+logger.setLevel(logging.INFO)
+logger.propagate = False
+
 # Cross-platform dependencies
 try:
     import psutil
@@ -21,28 +30,144 @@ try:
     HAS_WINDOWS_DEPS = True
 except ImportError as e:
     HAS_WINDOWS_DEPS = False
-    print(f"Missing Windows dependencies: {e}")
-    print("Install with: pip install psutil pystray pillow")
+    logger.error("Missing Windows dependencies: %s", e)
+    logger.error("Install with: pip install psutil pystray pillow")
+
+# On Windows read the battery straight from kernel32 instead of via psutil,
+# and listen for WM_POWERBROADCAST instead of polling
+if os.name == 'nt':
+    import ctypes
+    import uuid
+    from ctypes import wintypes
+    
+    WM_POWERBROADCAST = 0x0218
+    PBT_APMPOWERSTATUSCHANGE = 0x000A
+    PBT_POWERSETTINGCHANGE = 0x8013
+    HWND_MESSAGE = wintypes.HWND(-3)
+    DEVICE_NOTIFY_WINDOW_HANDLE = 0
+    
+    WNDPROC = ctypes.WINFUNCTYPE(wintypes.LPARAM, wintypes.HWND, wintypes.UINT,
+                                 wintypes.WPARAM, wintypes.LPARAM)
+    
+    class WNDCLASSW(ctypes.Structure):
+        _fields_ = [
+            ('style', wintypes.UINT),
+            ('lpfnWndProc', WNDPROC),
+            ('cbClsExtra', ctypes.c_int),
+            ('cbWndExtra', ctypes.c_int),
+            ('hInstance', wintypes.HINSTANCE),
+            ('hIcon', wintypes.HICON),
+            ('hCursor', wintypes.HANDLE),
+            ('hbrBackground', wintypes.HBRUSH),
+            ('lpszMenuName', wintypes.LPCWSTR),
+            ('lpszClassName', wintypes.LPCWSTR),
+        ]
+    
+    class GUID(ctypes.Structure):
+        _fields_ = [
+            ('Data1', wintypes.DWORD),
+            ('Data2', wintypes.WORD),
+            ('Data3', wintypes.WORD),
+            ('Data4', ctypes.c_ubyte * 8),
+        ]
+    
+    # Power settings that signal a battery change
+    POWER_SETTING_GUIDS = [
+        GUID.from_buffer_copy(uuid.UUID('5d3e9a59-e9d5-4b00-a6bd-ff34ff516548').bytes_le),  # GUID_ACDC_POWER_SOURCE
+        GUID.from_buffer_copy(uuid.UUID('a7ad8041-b45a-4cae-87a3-eecbb468a9e1').bytes_le),  # GUID_BATTERY_PERCENTAGE_REMAINING
+    ]
+    
+    class SYSTEM_POWER_STATUS(ctypes.Structure):
+        _fields_ = [
+            ('ACLineStatus', ctypes.c_ubyte),
+            ('BatteryFlag', ctypes.c_ubyte),
+            ('BatteryLifePercent', ctypes.c_ubyte),
+            ('SystemStatusFlag', ctypes.c_ubyte),
+            ('BatteryLifeTime', ctypes.c_ulong),
+            ('BatteryFullLifeTime', ctypes.c_ulong),
+        ]
 
 VERSION = '0.2.0-windows-poc'
 
+# The script's mtime cannot change while it runs, so build the About text once
+_UPDATE_DATE = datetime.fromtimestamp(os.path.getmtime(os.path.abspath(__file__))).strftime('%Y-%m-%d %H:%M:%S')
+_ABOUT_TEXT = f"BattMon Windows PoC\\n\\nVersion: {VERSION}\\nLast Updated: {_UPDATE_DATE}\\n\\nCross-platform battery monitor\\nBuilt with psutil + pystray + Pillow"
+
+# How long (seconds) a battery reading is shared between callers
+BATTERY_CACHE_TTL = 2.0
+
+# Polling back-off cap (seconds) while the battery reading is not changing
+MAX_UPDATE_INTERVAL = 60
+
+# Tray icon geometry: drawn on a 24-unit grid, rendered at 32x32
+ICON_SIZE = 32
+ICON_SCALE = ICON_SIZE / 24
+
+# Battery body colors by level bucket (see color_bucket)
+ICON_COLORS = (
+    (220, 53, 69),   # Bootstrap danger red
+    (255, 193, 7),   # Bootstrap warning orange
+    (40, 167, 69),   # Bootstrap success green
+)
+
 class CrossPlatformBatteryMonitor:
     def __init__(self):
-        self.running = True
+        self._stop = threading.Event()  # set on quit
+        self._wake = threading.Event()  # set on quit or a power event; ends the monitor wait
+        self._power_events = False  # True once WM_POWERBROADCAST notifications are registered
+        self._battery_cache = (0.0, None)  # (time.monotonic() of the read, battery info)
         self.last_percentage = 0
         self.last_state = ""
-        self.update_interval = 5  # seconds
+        self.update_interval = 5  # seconds, fastest poll (low battery, discharging)
+        self._icon_cache = {}  # (percentage, is_charging) -> rendered PIL image
+        self._last_rendered_key = None  # (percentage, is_charging) shown in the tray
+        self._last_tooltip = None
         
         if not HAS_WINDOWS_DEPS:
-            print("Cannot start: Missing required dependencies")
+            logger.error("Cannot start: Missing required dependencies")
             sys.exit(1)
+        
+        # Icon layers: body+terminal per color bucket (without and with the
+        # bolt), and the outlined text for every percentage 0-100, so FreeType
+        # only runs here
+        body_layers = [self.render_body_layer(color) for color in ICON_COLORS]
+        bolt_layer = self.render_bolt_layer()
+        self._body_layers = {
+            False: body_layers,
+            True: [Image.alpha_composite(body, bolt_layer) for body in body_layers],
+        }
+        self._font = self.load_icon_font()
+        self._digit_layers = [self.render_digit_layer(p) for p in range(101)]
+        
+        # Direct GetSystemPowerStatus access on Windows (psutil elsewhere)
+        self._power_status = None
+        if os.name == 'nt':
+            try:
+                self._get_system_power_status = ctypes.windll.kernel32.GetSystemPowerStatus
+                self._power_status = SYSTEM_POWER_STATUS()
+            except (AttributeError, OSError) as e:
+                logger.warning("GetSystemPowerStatus unavailable, using psutil: %s", e)
             
-        print(f"BattMon Windows PoC v{VERSION} starting...")
-        print("Cross-platform battery monitor using psutil + pystray")
+        logger.info("BattMon Windows PoC v%s starting...", VERSION)
+        logger.info("Cross-platform battery monitor using psutil + pystray")
+        
+    def get_battery_info(self, fresh=False):
+        """Get battery information, reusing a reading younger than BATTERY_CACHE_TTL"""
+        now = time.monotonic()
+        ts, info = self._battery_cache
+        if not fresh and info is not None and now - ts < BATTERY_CACHE_TTL:
+            return info
         
-    def get_battery_info(self):
+        info = self.read_battery_info()
+        self._battery_cache = (now, info)
+        return info
+    
+    def read_battery_info(self):
         """Get battery information using psutil (cross-platform)"""
         try:
+            if self._power_status is not None:
+                return self.get_battery_info_win32()
+            
             battery = psutil.sensors_battery()
             if battery is None:
                 return {
@@ -51,26 +176,13 @@ class CrossPlatformBatteryMonitor:
                     'time_left': None,
                     'is_charging': False
                 }
-                
-            # Convert time from seconds to hours:minutes
-            time_left = None
-            if battery.secsleft != psutil.POWER_TIME_UNLIMITED and battery.secsleft > 0:
-                hours, remainder = divmod(battery.secsleft, 3600)
-                minutes, _ = divmod(remainder, 60)
-                time_left = f"{hours:02d}:{minutes:02d}"
-                
-            state = "Charging" if battery.power_plugged else "Discharging"
-            if battery.percent >= 100 and battery.power_plugged:
-                state = "Full"
-                
-            return {
-                'percentage': int(battery.percent),
-                'state': state,
-                'time_left': time_left,
-                'is_charging': battery.power_plugged
-            }
+            
+            secsleft = battery.secsleft
+            if secsleft == psutil.POWER_TIME_UNLIMITED:
+                secsleft = None
+            return self.make_battery_info(battery.percent, battery.power_plugged, secsleft)
         except Exception as e:
-            print(f"Error getting battery info: {e}")
+            logger.error("Error getting battery info: %s", e)
             return {
                 'percentage': 0,
                 'state': 'Error',
@@ -78,99 +190,155 @@ class CrossPlatformBatteryMonitor:
                 'is_charging': False
             }
     
-    def create_battery_icon(self, percentage, is_charging=False):
-        """Create battery icon using Pillow (cross-platform)"""
-        try:
-            # Create 32x32 image for better Windows compatibility
-            size = 32
-            img = Image.new('RGBA', (size, size), (0, 0, 0, 0))
-            draw = ImageDraw.Draw(img)
-            
-            # Choose color based on battery level
-            if percentage > 75:
-                color = (40, 167, 69)  # Bootstrap success green
-            elif percentage > 25:
-                color = (255, 193, 7)  # Bootstrap warning orange
-            else:
-                color = (220, 53, 69)  # Bootstrap danger red
-                
-            # Scale coordinates for 32x32
-            scale = size / 24
-            
-            # Draw battery body (rectangular)
-            battery_x = int(4 * scale)
-            battery_y = int(10 * scale)
-            battery_w = int(20 * scale)
-            battery_h = int(12 * scale)
-            
-            draw.rectangle(
-                [(battery_x, battery_y), (battery_x + battery_w, battery_y + battery_h)],
-                fill=color,
-                outline=(0, 0, 0),
-                width=2
-            )
-            
-            # Draw battery terminal
-            terminal_x = battery_x + battery_w
-            terminal_y = battery_y + int(3 * scale)
-            terminal_w = int(3 * scale)
-            terminal_h = int(6 * scale)
-            
-            draw.rectangle(
-                [(terminal_x, terminal_y), (terminal_x + terminal_w, terminal_y + terminal_h)],
-                fill=(0, 0, 0)
-            )
-            
-            # Add charging indicator
-            if is_charging:
-                # Draw lightning bolt
-                lightning_points = [
-                    (int(12 * scale), int(5 * scale)),   # Top
-                    (int(18 * scale), int(9 * scale)),   # Right middle
-                    (int(15 * scale), int(9 * scale)),   # Center
-                    (int(20 * scale), int(13 * scale)),  # Bottom right
-                    (int(14 * scale), int(9 * scale)),   # Back to center
-                    (int(17 * scale), int(9 * scale))    # Right point
-                ]
-                draw.polygon(lightning_points, fill=(255, 255, 0), outline=(255, 255, 255))
-            
-            # Add percentage text
-            text = str(percentage)
-            try:
-                # Try to use a system font
-                if os.name == 'nt':  # Windows
-                    font = ImageFont.truetype("arial.ttf", int(10 * scale))
-                else:  # Linux/Mac
-                    font = ImageFont.truetype("/usr/share/fonts/truetype/liberation/LiberationSans-Bold.ttf", int(10 * scale))
-            except:
-                # Fallback to default font
-                font = ImageFont.load_default()
-            
-            # Calculate text position
-            bbox = draw.textbbox((0, 0), text, font=font)
-            text_width = bbox[2] - bbox[0]
-            text_height = bbox[3] - bbox[1]
-            
-            text_x = (size - text_width) // 2
-            text_y = int(24 * scale)
-            
-            # Draw text with black outline for visibility
-            outline_width = 1
-            for dx in range(-outline_width, outline_width + 1):
-                for dy in range(-outline_width, outline_width + 1):
-                    if dx != 0 or dy != 0:
-                        draw.text((text_x + dx, text_y + dy), text, font=font, fill=(0, 0, 0))
+    def get_battery_info_win32(self):
+        """Get battery information from GetSystemPowerStatus (Windows)"""
+        status = self._power_status
+        if not self._get_system_power_status(ctypes.byref(status)):
+            raise ctypes.WinError()
+        
+        # 128 = no system battery, 255 = charge unknown
+        if status.BatteryFlag == 128 or status.BatteryLifePercent == 255:
+            return {
+                'percentage': 0,
+                'state': 'Unknown',
+                'time_left': None,
+                'is_charging': False
+            }
+        
+        secsleft = status.BatteryLifeTime
+        if secsleft == 0xFFFFFFFF:  # unknown, or on AC power
+            secsleft = None
+        return self.make_battery_info(status.BatteryLifePercent, status.ACLineStatus == 1, secsleft)
+    
+    def make_battery_info(self, percent, power_plugged, secsleft):
+        """Build the battery info dict from raw charge, AC and seconds-left values"""
+        # Convert time from seconds to hours:minutes
+        time_left = None
+        if secsleft is not None and secsleft > 0:
+            hours, remainder = divmod(secsleft, 3600)
+            minutes, _ = divmod(remainder, 60)
+            time_left = f"{hours:02d}:{minutes:02d}"
             
-            # Draw white text on top
-            draw.text((text_x, text_y), text, font=font, fill=(255, 255, 255))
+        state = "Charging" if power_plugged else "Discharging"
+        if percent >= 100 and power_plugged:
+            state = "Full"
             
+        return {
+            'percentage': int(percent),
+            'state': state,
+            'time_left': time_left,
+            'is_charging': power_plugged
+        }
+    
+    def create_battery_icon(self, percentage, is_charging=False):
+        """Create battery icon using Pillow (cross-platform)"""
+        # Only 101 x 2 icons are possible; pystray never modifies the image,
+        # so the cached one can be shared directly
+        key = (percentage, is_charging)
+        img = self._icon_cache.get(key)
+        if img is not None:
             return img
-            
+        
+        try:
+            img = self.render_battery_icon(percentage, is_charging)
         except Exception as e:
-            print(f"Error creating battery icon: {e}")
-            # Return a simple fallback icon
-            img = Image.new('RGBA', (32, 32), (100, 100, 100, 255))
-            return img
+            logger.error("Error creating battery icon: %s", e)
+            # Return a simple fallback icon (not cached, so the next tick retries)
+            return Image.new('RGBA', (32, 32), (100, 100, 100, 255))
+        
+        self._icon_cache[key] = img
+        return img
+    
+    def render_battery_icon(self, percentage, is_charging):
+        """Compose a battery icon image from the cached layers"""
+        # One composite straight into the returned image: no copy of the body
+        # and no scratch buffers from in-place compositing
+        body = self._body_layers[bool(is_charging)][self.color_bucket(percentage)]
+        return Image.alpha_composite(body, self._digit_layers[min(max(percentage, 0), 100)])
+    
+    def color_bucket(self, percentage):
+        """Return the ICON_COLORS index for a battery level"""
+        return (percentage > 25) + (percentage > 75)
+    
+    def render_body_layer(self, color):
+        """Render the battery body and terminal in the given fill color"""
+        # Everything here is an axis-aligned box, so fill them with paste()
+        # directly instead of going through ImageDraw; boxes are end-exclusive
+        scale = ICON_SCALE
+        img = Image.new('RGBA', (ICON_SIZE, ICON_SIZE), (0, 0, 0, 0))
+        black = (0, 0, 0, 255)
+        
+        # Draw battery body (rectangular): 2px black outline around the fill
+        battery_x = int(4 * scale)
+        battery_y = int(10 * scale)
+        battery_w = int(20 * scale)
+        battery_h = int(12 * scale)
+        
+        img.paste(black, (battery_x, battery_y, battery_x + battery_w + 1, battery_y + battery_h + 1))
+        img.paste(color + (255,), (battery_x + 2, battery_y + 2, battery_x + battery_w - 1, battery_y + battery_h - 1))
+        
+        # Draw battery terminal (clipped to the icon)
+        terminal_x = battery_x + battery_w
+        terminal_y = battery_y + int(3 * scale)
+        terminal_w = int(3 * scale)
+        terminal_h = int(6 * scale)
+        
+        img.paste(black, (terminal_x, terminal_y,
+                          min(terminal_x + terminal_w + 1, ICON_SIZE), terminal_y + terminal_h + 1))
+        
+        return img
+    
+    def render_bolt_layer(self):
+        """Render the charging lightning bolt"""
+        scale = ICON_SCALE
+        img = Image.new('RGBA', (ICON_SIZE, ICON_SIZE), (0, 0, 0, 0))
+        draw = ImageDraw.Draw(img)
+        
+        lightning_points = [
+            (int(12 * scale), int(5 * scale)),   # Top
+            (int(18 * scale), int(9 * scale)),   # Right middle
+            (int(15 * scale), int(9 * scale)),   # Center
+            (int(20 * scale), int(13 * scale)),  # Bottom right
+            (int(14 * scale), int(9 * scale)),   # Back to center
+            (int(17 * scale), int(9 * scale))    # Right point
+        ]
+        draw.polygon(lightning_points, fill=(255, 255, 0), outline=(255, 255, 255))
+        
+        return img
+    
+    def load_icon_font(self):
+        """Load the percentage text font once"""
+        try:
+            # Try to use a system font
+            if os.name == 'nt':  # Windows
+                return ImageFont.truetype("arial.ttf", int(10 * ICON_SCALE))
+            else:  # Linux/Mac
+                return ImageFont.truetype("/usr/share/fonts/truetype/liberation/LiberationSans-Bold.ttf", int(10 * ICON_SCALE))
+        except OSError:
+            # Fallback to default font
+            return ImageFont.load_default()
+    
+    def render_digit_layer(self, percentage):
+        """Render the outlined percentage text"""
+        scale = ICON_SCALE
+        layer = Image.new('RGBA', (ICON_SIZE, ICON_SIZE), (0, 0, 0, 0))
+        draw = ImageDraw.Draw(layer)
+        
+        text = str(percentage)
+        font = self._font
+        
+        # Calculate text position
+        bbox = draw.textbbox((0, 0), text, font=font)
+        text_width = bbox[2] - bbox[0]
+        
+        text_x = (ICON_SIZE - text_width) // 2
+        text_y = int(24 * scale)
+        
+        # Draw white text with a 1px black outline for visibility, stroked by Pillow in one call
+        draw.text((text_x, text_y), text, font=font, fill=(255, 255, 255),
+                  stroke_width=1, stroke_fill=(0, 0, 0))
+        
+        return layer
     
     def show_notification(self, title, message):
         """Show system notification (cross-platform)"""
@@ -186,12 +354,14 @@ class CrossPlatformBatteryMonitor:
                         app_name="BattMon"
                     )
                 except ImportError:
-                    print(f"Notification: {title} - {message}")
+                    logger.info("Notification: %s - %s", title, message)
             else:  # Linux
-                os.system(f'notify-send "{title}" "{message}"')
+                # No shell: one fork/exec, no quoting issues, and no waiting
+                subprocess.Popen(['notify-send', title, message],
+                                 stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
         except Exception as e:
-            print(f"Notification error: {e}")
-            print(f"{title}: {message}")
+            logger.error("Notification error: %s", e)
+            logger.info("%s: %s", title, message)
     
     def show_battery_status(self, icon, item):
         """Show detailed battery status"""
@@ -202,47 +372,129 @@ class CrossPlatformBatteryMonitor:
     
     def show_about(self, icon, item):
         """Show about information"""
-        script_path = os.path.abspath(__file__)
-        mtime = os.path.getmtime(script_path)
-        update_date = datetime.fromtimestamp(mtime).strftime('%Y-%m-%d %H:%M:%S')
-        
-        about_text = f"BattMon Windows PoC\\n\\nVersion: {VERSION}\\nLast Updated: {update_date}\\n\\nCross-platform battery monitor\\nBuilt with psutil + pystray + Pillow"
-        self.show_notification("About BattMon", about_text)
+        self.show_notification("About BattMon", _ABOUT_TEXT)
     
     def quit_application(self, icon, item):
         """Quit the application"""
-        print("BattMon shutting down...")
-        self.running = False
+        logger.info("BattMon shutting down...")
+        self.stop_monitor()
         icon.stop()
     
+    def stop_monitor(self):
+        """Stop the monitor thread without waiting out its poll interval"""
+        self._stop.set()
+        self._wake.set()
+    
+    def start_power_notifications(self):
+        """Listen for WM_POWERBROADCAST on a message-only window (Windows)"""
+        user32 = ctypes.windll.user32
+        user32.DefWindowProcW.argtypes = [wintypes.HWND, wintypes.UINT, wintypes.WPARAM, wintypes.LPARAM]
+        user32.DefWindowProcW.restype = wintypes.LPARAM
+        user32.CreateWindowExW.argtypes = [wintypes.DWORD, wintypes.LPCWSTR, wintypes.LPCWSTR, wintypes.DWORD,
+                                           ctypes.c_int, ctypes.c_int, ctypes.c_int, ctypes.c_int,
+                                           wintypes.HWND, wintypes.HMENU, wintypes.HINSTANCE, wintypes.LPVOID]
+        user32.CreateWindowExW.restype = wintypes.HWND
+        ctypes.windll.kernel32.GetModuleHandleW.restype = wintypes.HMODULE
+        user32.RegisterPowerSettingNotification.argtypes = [wintypes.HANDLE, ctypes.POINTER(GUID), wintypes.DWORD]
+        user32.RegisterPowerSettingNotification.restype = wintypes.HANDLE
+        
+        def wnd_proc(hwnd, msg, wparam, lparam):
+            if msg == WM_POWERBROADCAST and wparam in (PBT_POWERSETTINGCHANGE, PBT_APMPOWERSTATUSCHANGE):
+                self._wake.set()
+                return 1
+            return user32.DefWindowProcW(hwnd, msg, wparam, lparam)
+        
+        # Keep the callback alive for as long as the window exists
+        self._wnd_proc = WNDPROC(wnd_proc)
+        
+        wndclass = WNDCLASSW()
+        wndclass.lpfnWndProc = self._wnd_proc
+        wndclass.hInstance = ctypes.windll.kernel32.GetModuleHandleW(None)
+        wndclass.lpszClassName = 'BattMonPowerListener'
+        if not user32.RegisterClassW(ctypes.byref(wndclass)):
+            raise ctypes.WinError()
+        
+        hwnd = user32.CreateWindowExW(0, wndclass.lpszClassName, None, 0, 0, 0, 0, 0,
+                                      HWND_MESSAGE, None, wndclass.hInstance, None)
+        if not hwnd:
+            raise ctypes.WinError()
+        
+        for guid in POWER_SETTING_GUIDS:
+            if not user32.RegisterPowerSettingNotification(hwnd, ctypes.byref(guid), DEVICE_NOTIFY_WINDOW_HANDLE):
+                raise ctypes.WinError()
+        
+        return hwnd
+    
+    def power_notification_loop(self):
+        """Pump window messages so power events reach the monitor (Windows)"""
+        try:
+            self.start_power_notifications()
+        except Exception as e:
+            logger.warning("Power notifications unavailable, polling instead: %s", e)
+            return
+        
+        self._power_events = True
+        user32 = ctypes.windll.user32
+        msg = wintypes.MSG()
+        while user32.GetMessageW(ctypes.byref(msg), None, 0, 0) > 0:
+            user32.TranslateMessage(ctypes.byref(msg))
+            user32.DispatchMessageW(ctypes.byref(msg))
+    
+    def base_interval(self, info):
+        """Return the polling interval in seconds for the current power state"""
+        if info['is_charging']:
+            return 30 if info['percentage'] >= 100 else 20
+        return 15 if info['percentage'] > 25 else self.update_interval
+    
     def update_battery_icon(self, icon):
         """Update battery icon periodically"""
-        while self.running:
+        interval = self.update_interval
+        last_sample = None
+        while not self._stop.is_set():
+            # Clear before reading so a power event during the read is not lost
+            self._wake.clear()
             try:
-                info = self.get_battery_info()
+                # Always read: this may be a wake-up for a power event
+                info = self.get_battery_info(fresh=True)
                 percentage = info['percentage']
                 
                 # Only update if significant change
                 if abs(percentage - self.last_percentage) >= 5 or info['state'] != self.last_state:
-                    print(f"Battery: {percentage}% {info['state']}")
+                    logger.info("Battery: %d%% %s", percentage, info['state'])
                     self.last_percentage = percentage
                     self.last_state = info['state']
                 
-                # Create new icon
-                new_image = self.create_battery_icon(percentage, info['is_charging'])
-                icon.icon = new_image
+                # Only push a new icon when what it shows has changed; every
+                # assignment makes pystray repaint the shell's tray entry
+                key = (percentage, info['is_charging'])
+                if key != self._last_rendered_key:
+                    icon.icon = self.create_battery_icon(percentage, info['is_charging'])
+                    self._last_rendered_key = key
                 
                 # Update tooltip
                 tooltip = f"Battery: {percentage}% ({info['state']})"
                 if info['time_left']:
                     tooltip += f"\\n{info['time_left']} remaining"
-                icon.title = tooltip
+                if tooltip != self._last_tooltip:
+                    icon.title = tooltip
+                    self._last_tooltip = tooltip
+                
+                # Back off while nothing changes, snap back to the base rate
+                # for this power state as soon as something does
+                base = self.base_interval(info)
+                sample = (percentage, info['state'])
+                if sample == last_sample:
+                    interval = min(max(interval, base) * 1.5, MAX_UPDATE_INTERVAL)
+                else:
+                    interval = base
+                last_sample = sample
                 
             except Exception as e:
-                print(f"Error updating icon: {e}")
+                logger.error("Error updating icon: %s", e)
             
-            # Wait before next update
-            time.sleep(self.update_interval)
+            # Wait before next update. With power notifications the events
+            # drive updates and the slow poll only refreshes the time left.
+            self._wake.wait(MAX_UPDATE_INTERVAL if self._power_events else interval)
     
     def create_menu(self):
         """Create system tray context menu"""
@@ -259,30 +511,36 @@ class CrossPlatformBatteryMonitor:
             # Get initial battery info
             info = self.get_battery_info()
             initial_image = self.create_battery_icon(info['percentage'], info['is_charging'])
+            initial_tooltip = f"Battery: {info['percentage']}% ({info['state']})"
             
             # Create system tray icon
             icon = pystray.Icon(
                 "BattMon",
                 initial_image,
-                f"Battery: {info['percentage']}% ({info['state']})",
+                initial_tooltip,
                 self.create_menu()
             )
+            self._last_rendered_key = (info['percentage'], info['is_charging'])
+            self._last_tooltip = initial_tooltip
             
             # Start battery monitoring thread
             monitor_thread = threading.Thread(target=self.update_battery_icon, args=(icon,), daemon=True)
             monitor_thread.start()
             
-            print("BattMon is running in system tray. Right-click the icon for options.")
+            if os.name == 'nt':
+                threading.Thread(target=self.power_notification_loop, daemon=True).start()
+            
+            logger.info("BattMon is running in system tray. Right-click the icon for options.")
             
             # Run the icon (blocking call)
             icon.run()
             
         except KeyboardInterrupt:
-            print("\\nShutdown requested...")
-            self.running = False
+            logger.info("Shutdown requested...")
+            self.stop_monitor()
         except Exception as e:
-            print(f"Error running BattMon: {e}")
-            self.running = False
+            logger.error("Error running BattMon: %s", e)
+            self.stop_monitor()
 
 def main():
     """Main entry point"""
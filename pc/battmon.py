@@ -16,19 +16,25 @@ import sys
 import subprocess
 import os
 import platform
-import configparser
 import datetime
-import io
 import time
 import json
 import re
+import shutil
+import queue
+import threading
+import functools
+from dataclasses import dataclass
+from types import MappingProxyType
+import logging
+import logging.handlers
 
 try:
     from PyQt6.QtWidgets import (QApplication, QSystemTrayIcon, QMenu, QMessageBox, 
                                  QWidget, QVBoxLayout, QHBoxLayout, QLabel, QProgressBar,
-                                 QPushButton)
-    from PyQt6.QtCore import QTimer, Qt, pyqtSignal, QSize
-    from PyQt6.QtGui import QIcon, QPixmap, QPainter, QBrush, QColor, QPen, QFont, QAction, QPolygon, QMovie
+                                 QPushButton, QDialog, QTextBrowser)
+    from PyQt6.QtCore import QTimer, Qt, pyqtSignal, QSize, QThreadPool, QLine, QVariant, QMetaType
+    from PyQt6.QtGui import QIcon, QPixmap, QPainter, QBrush, QColor, QPen, QFont, QAction, QPolygon, QMovie, QPainterPath
     QT6_AVAILABLE = True
 except ImportError:
     print("PyQt6 not found. Please install it with:")
@@ -41,8 +47,9 @@ except ImportError:
 # Cross-platform constants
 VERSION = '0.5.13'
 TIMEOUT = 2000  # milliseconds
-config = False
-config_path = os.path.expanduser('~/.battmon')
+MAX_TIMEOUT = 30000  # milliseconds - poll interval ceiling while the reading is stable
+BATTERY_INFO_TTL = 1.5  # seconds a battery reading is reused (pulse frames, dialogs)
+NOTIFY_DEDUP_SECONDS = 1.0  # Identical notifications within this window are dropped
 
 # Platform detection
 CURRENT_OS = platform.system()
@@ -50,148 +57,158 @@ IS_WINDOWS = CURRENT_OS == "Windows"
 IS_LINUX = CURRENT_OS == "Linux"
 IS_MACOS = CURRENT_OS == "Darwin"
 
-def show_battery_window_dialog(parent_app):
-    """Show battery status in a QMessageBox dialog that matches About window style"""
-    try:
-        # Get battery information
-        info = parent_app.get_battery_info()
-        detailed_info = parent_app.get_detailed_battery_info()
-        
-        percentage = info['percentage']
-        state = info['state']
-        time_remaining = info.get('time', '')
-        is_charging = info.get('state', '').lower() in ('charging', 'full')
-        
-        # Create prominent battery status display
-        charging_indicator = " ⚡" if is_charging else ""
-        time_info = f"<br><b>Time Remaining:</b> {time_remaining}" if time_remaining else ""
-        
-        # Color-code the percentage based on battery level
-        if percentage >= 75:
-            color = "#27ae60"  # Green
-            status_icon = "🔋"
-        elif percentage >= 50:
-            color = "#f39c12"  # Orange-yellow
-            status_icon = "🔋"
-        elif percentage >= 30:
-            color = "#e67e22"  # Orange
-            status_icon = "⚠️"
-        else:
-            color = "#e74c3c"  # Red
-            status_icon = "🚨"
-        
-        # Build the battery status text in the same format as About window
-        current_time = datetime.datetime.now().strftime("%H:%M:%S")
-        
-        battery_text = f"""<h2>{status_icon} BattMon Cross-Platform - Battery Status</h2>
+# Status console output goes through a buffered logger: records are collected while
+# a tick (or startup) runs and written in one batch when it finishes via _log_buffer.flush()
+logger = logging.getLogger('battmon')
+logger.setLevel(logging.INFO)
+_console_handler = logging.StreamHandler(sys.stdout)
+_console_handler.setFormatter(logging.Formatter('%(message)s'))
+_log_buffer = logging.handlers.MemoryHandler(capacity=64, flushLevel=logging.WARNING,
+                                             target=_console_handler)
+logger.addHandler(_log_buffer)
+logger.propagate = False
 
-<p><b>Current Charge:</b> <span style="color: {color}; font-size: 18pt; font-weight: bold;">{percentage}%{charging_indicator}</span><br>
-<b>Battery State:</b> {state}{time_info}<br>
-<b>Platform:</b> {CURRENT_OS}<br>
-<b>Last Updated:</b> {current_time}</p>
+# Icon colors per battery tier (fill, background), shared by every icon render
+ICON_COLORS_GREEN = (QColor(76, 175, 80), QColor(200, 255, 200, 180))    # 100-75%
+ICON_COLORS_YELLOW = (QColor(255, 235, 59), QColor(255, 255, 200, 180))  # 74-50%
+ICON_COLORS_ORANGE = (QColor(255, 152, 0), QColor(255, 230, 180, 180))   # 49-30%
+ICON_COLORS_RED = (QColor(244, 67, 54), QColor(255, 200, 200, 180))      # 29-0%
+ICON_EMPTY_COLOR = QColor(240, 240, 240, 200)  # Light gray for empty area
+ICON_BOLT_COLOR = QColor(255, 235, 59)         # Yellow charging bolt
 
-<h3>⚡ Battery Details</h3>
-<p><b>Technology:</b> {detailed_info.get('technology', 'Unknown')}<br>
-<b>Manufacturer:</b> {detailed_info.get('manufacturer', 'Unknown')}<br>
-<b>Voltage:</b> {detailed_info.get('voltage', 'Unknown')}<br>
-<b>Power Draw:</b> {detailed_info.get('power_draw', 'Unknown')}</p>
+@functools.lru_cache(maxsize=128)
+def _icon_colors(percentage):
+    """Return the (fill, background) icon colors for a battery level (4-tier system)"""
+    if percentage >= 75:
+        return ICON_COLORS_GREEN
+    elif percentage >= 50:
+        return ICON_COLORS_YELLOW
+    elif percentage >= 30:
+        return ICON_COLORS_ORANGE
+    return ICON_COLORS_RED
 
-<h3>💚 Battery Health</h3>
-<p><b>Health Status:</b> {detailed_info.get('health_status', 'Unknown')}<br>
-<b>Health Percentage:</b> {detailed_info.get('health_percentage', 0)}%<br>
-<b>Design Capacity:</b> {detailed_info.get('design_capacity', 'Unknown')}<br>
-<b>Current Capacity:</b> {detailed_info.get('current_capacity', 'Unknown')}<br>
-<b>Cycle Count:</b> {detailed_info.get('cycle_count', 'Unknown')}</p>
+@functools.lru_cache(maxsize=128)
+def _status_style(percentage):
+    """Return the (HTML color, status emoji) used by the battery status dialogs"""
+    if percentage >= 75:
+        return "#27ae60", "🔋"  # Green
+    elif percentage >= 50:
+        return "#f39c12", "🔋"  # Orange-yellow
+    elif percentage >= 30:
+        return "#e67e22", "⚠️"  # Orange
+    return "#e74c3c", "🚨"      # Red
 
-<p style="margin-top: 10px; text-align: center;">
-<b>BattMon Cross-Platform</b> v{VERSION}<br>
-<em>Real-time battery monitoring and health tracking</em>
-</p>"""
-        
-        # Create and show the message box in the same style as About
-        msg_box = QMessageBox()
-        msg_box.setWindowTitle("Battery Status - BattMon Cross-Platform")
-        msg_box.setTextFormat(Qt.TextFormat.RichText)
-        msg_box.setText(battery_text)
-        msg_box.setIconPixmap(parent_app.create_battery_icon(percentage, is_charging, 24).pixmap(64, 64))
-        
-        # Add a Refresh button alongside OK
-        refresh_button = msg_box.addButton("🔄 Refresh", QMessageBox.ButtonRole.ActionRole)
-        ok_button = msg_box.addButton(QMessageBox.StandardButton.Ok)
-        msg_box.setDefaultButton(ok_button)
-        
-        # Show dialog and handle refresh
-        while True:
-            result = msg_box.exec()
-            clicked_button = msg_box.clickedButton()
-            
-            if clicked_button == refresh_button:
-                # Refresh data and update dialog
-                info = parent_app.get_battery_info()
-                detailed_info = parent_app.get_detailed_battery_info()
-                
-                percentage = info['percentage']
-                state = info['state']
-                time_remaining = info.get('time', '')
-                is_charging = info.get('state', '').lower() in ('charging', 'full')
-                
-                # Update colors and indicators
-                charging_indicator = " ⚡" if is_charging else ""
-                time_info = f"<br><b>Time Remaining:</b> {time_remaining}" if time_remaining else ""
-                
-                if percentage >= 75:
-                    color = "#27ae60"
-                    status_icon = "🔋"
-                elif percentage >= 50:
-                    color = "#f39c12"
-                    status_icon = "🔋"
-                elif percentage >= 30:
-                    color = "#e67e22"
-                    status_icon = "⚠️"
-                else:
-                    color = "#e74c3c"
-                    status_icon = "🚨"
-                
-                current_time = datetime.datetime.now().strftime("%H:%M:%S")
-                
-                # Update the text
-                battery_text = f"""<h2>{status_icon} BattMon Cross-Platform - Battery Status</h2>
+@dataclass(frozen=True)
+class BatteryGeom:
+    """Pre-scaled pixel geometry and drawing tools for one icon size"""
+    size: int
+    battery_x: int
+    battery_y: int
+    battery_width: int
+    battery_height: int
+    terminal_x: int
+    terminal_y: int
+    terminal_width: int
+    terminal_height: int
+    background_height: int
+    outline_pen: QPen
+    bolt_pen: QPen
+    bolt_outline_pen: QPen
+    bolt_lines: tuple  # QLine segments, passed to drawLines() in one call
+    font: QFont
+    text_y: int
+    text_outline_pen: QPen
 
-<p><b>Current Charge:</b> <span style="color: {color}; font-size: 18pt; font-weight: bold;">{percentage}%{charging_indicator}</span><br>
-<b>Battery State:</b> {state}{time_info}<br>
-<b>Platform:</b> {CURRENT_OS}<br>
-<b>Last Updated:</b> {current_time}</p>
+@functools.lru_cache(maxsize=16)
+def _geom_for_size(size):
+    """Compute icon geometry for a given size (icons only use a handful of sizes)"""
+    scale = size / 24.0
+    # Use more of the available space - make battery larger and move it higher up
+    battery_x = int(1 * scale)
+    battery_y = int(2 * scale)  # Move higher up to use more top space
+    battery_width = int(20 * scale)  # Make wider
+    return BatteryGeom(
+        size=size,
+        battery_x=battery_x,
+        battery_y=battery_y,
+        battery_width=battery_width,
+        battery_height=int(12 * scale),  # Make even taller
+        terminal_x=battery_x + battery_width,
+        terminal_y=battery_y + int(2 * scale),  # Adjust for taller battery
+        terminal_width=int(2 * scale),
+        terminal_height=int(8 * scale),  # Make terminal taller to match
+        background_height=int(16 * scale),
+        outline_pen=QPen(Qt.GlobalColor.black, max(1, int(2.5 * scale))),
+        bolt_pen=QPen(ICON_BOLT_COLOR, max(1, int(scale))),
+        bolt_outline_pen=QPen(Qt.GlobalColor.white, max(1, int(2 * scale))),
+        bolt_lines=(
+            QLine(int(10 * scale), int(4 * scale), int(14 * scale), int(10 * scale)),
+            QLine(int(14 * scale), int(6 * scale), int(10 * scale), int(12 * scale)),
+        ),
+        font=QFont("Arial", max(8, int(10 * scale)), QFont.Weight.Bold),
+        text_y=int(23 * scale),  # Slightly lower to accommodate taller battery
+        # Stroked on both sides of the glyph edge, so twice the outline width
+        text_outline_pen=QPen(Qt.GlobalColor.black, 2 * max(1, int(3 * scale)), Qt.PenStyle.SolidLine,
+                              Qt.PenCapStyle.RoundCap, Qt.PenJoinStyle.RoundJoin),
+    )
 
-<h3>⚡ Battery Details</h3>
-<p><b>Technology:</b> {detailed_info.get('technology', 'Unknown')}<br>
-<b>Manufacturer:</b> {detailed_info.get('manufacturer', 'Unknown')}<br>
-<b>Voltage:</b> {detailed_info.get('voltage', 'Unknown')}<br>
-<b>Power Draw:</b> {detailed_info.get('power_draw', 'Unknown')}</p>
+# Optional platform modules, resolved once at import instead of on every call
+winsound = None
+wmi = None
+if IS_WINDOWS:
+    try:
+        import winsound
+    except ImportError:
+        pass
+    try:
+        import wmi
+    except ImportError:
+        pass
 
-<h3>💚 Battery Health</h3>
-<p><b>Health Status:</b> {detailed_info.get('health_status', 'Unknown')}<br>
-<b>Health Percentage:</b> {detailed_info.get('health_percentage', 0)}%<br>
-<b>Design Capacity:</b> {detailed_info.get('design_capacity', 'Unknown')}<br>
-<b>Current Capacity:</b> {detailed_info.get('current_capacity', 'Unknown')}<br>
-<b>Cycle Count:</b> {detailed_info.get('cycle_count', 'Unknown')}</p>
+# Linux desktop notifications go straight to the notification daemon over D-Bus
+# (one in-process call instead of forking notify-send for every alert)
+QDBusConnection = None
+if IS_LINUX:
+    try:
+        from PyQt6.QtDBus import QDBusConnection, QDBusMessage, QDBusArgument
+    except ImportError:
+        pass
 
-<p style="margin-top: 10px; text-align: center;">
-<b>BattMon Cross-Platform</b> v{VERSION}<br>
-<em>Real-time battery monitoring and health tracking</em>
-</p>"""
-                
-                msg_box.setText(battery_text)
-                msg_box.setIconPixmap(parent_app.create_battery_icon(percentage, is_charging, 24).pixmap(64, 64))
-                
-                print("[DEBUG] Battery status refreshed")
-            else:
-                break
-                
-    except Exception as e:
-        print(f"[ERROR] Failed to show battery status: {e}")
-        # Fallback to simple message
-        QMessageBox.information(None, "Battery Status", 
-                               f"Battery Status Error\n\nUnable to retrieve battery information.\n\nError: {str(e)}")
+# org.freedesktop.Notifications urgency levels (0 low, 1 normal, 2 critical)
+NOTIFY_URGENCY = {'info': 1, 'warning': 1, 'critical': 2}
+
+def _dbus_typed(value, type_id):
+    """Wrap a value in a QVariant of an explicit D-Bus type (e.g. uint32, byte)"""
+    variant = QVariant(value)
+    variant.convert(QMetaType(type_id.value))
+    return variant
+
+SYSFS_POWER_SUPPLY = '/sys/class/power_supply'
+
+# Matches acpi lines like "Battery 0: Discharging, 85%, 02:10:13 remaining"
+_ACPI_RE = re.compile(r'Battery\s+\d+:\s*([^,]+),\s*(\d+)%(?:,\s*(\d+:\d{2}(?::\d{2})?))?')
+# Pieces used by the looser colon-separated acpi fallback
+_PERCENT_RE = re.compile(r'(\d+)%')
+_HHMM_RE = re.compile(r'(\d{2}:\d{2})')
+
+# Win32_Battery.BatteryStatus -> BattMon state
+WIN32_BATTERY_STATUS = {
+    1: "Unknown",     # Other
+    2: "Discharging", # Low
+    3: "Discharging", # Warning
+    4: "Discharging", # Critical
+    5: "Charging",    # Charging
+    6: "Full",        # Charged/Full
+}
+WIN32_RUNTIME_UNKNOWN = 71582788  # EstimatedRunTime sentinel while on AC power
+
+# One-line query sent to the persistent PowerShell process, terminated by a sentinel line
+PS_BATTERY_QUERY = (
+    "Get-CimInstance -ClassName Win32_Battery | Select-Object -First 1 | "
+    "ForEach-Object { \"$($_.EstimatedChargeRemaining),$($_.BatteryStatus),$($_.EstimatedRunTime)\" }; "
+    "Write-Output '---END---'\n"
+)
+PS_QUERY_TIMEOUT = 10  # seconds to wait for the sentinel before giving up on PowerShell
 
 class BattMonCrossPlatform(QWidget):
     """Main cross-platform BattMon application"""
@@ -210,6 +227,26 @@ class BattMonCrossPlatform(QWidget):
         self.last_state = None
         # Track last seen percentage across ticks (for drop detection across state changes)
         self.last_seen_percent = None
+        # (percentage, state) of the last processed tick, for the no-change short-circuit
+        self._last_tick = None
+        # Reading taken by the last timer tick, reused by pulse animation frames
+        self._last_info = None
+        
+        # Notifications and alert sounds block on external processes (notify-send,
+        # PowerShell toasts, sox), so they run on a small dedicated pool
+        self._notify_pool = QThreadPool()
+        self._notify_pool.setMaxThreadCount(2)
+        self._notify_dedup = {}  # (title, type) -> time last shown
+        
+        # Linux sysfs battery directory (None = not probed yet, '' = unavailable)
+        self._sysfs_battery_path = None
+        
+        # Last battery reading and its time.monotonic() timestamp
+        self._battery_info_cache = (None, 0.0)
+        
+        # Long-lived PowerShell process for the Windows fallback (started on first use)
+        self._ps_proc = None
+        self._ps_lines = None  # Output lines from self._ps_proc's reader thread
         
         # Battery Status Window state tracking
         self.battery_status_window = None  # Reference to the currently open battery status window
@@ -219,12 +256,8 @@ class BattMonCrossPlatform(QWidget):
         
         # Sleep mode detection - detect when system wakes up from sleep
         self.last_update_time = time.time()
-        self.sleep_threshold = self.user_profile.get('sleep_threshold', 300)  # seconds - consider system was asleep if gap > 5 minutes
-        self.sleep_notifications_enabled = self.user_profile.get('sleep_notifications_enabled', True)
         self.was_asleep = False
-        self.milestone_thresholds = self.user_profile.get('milestone_thresholds', [90, 80, 70, 60, 50, 40, 30, 20, 10])
-        self.charging_milestones = self.user_profile.get('charging_milestones', [25, 50, 75, 90, 100])
-        self.notifications_enabled = self.user_profile.get('notifications_enabled', True)
+        self.apply_user_profile()
         self.last_milestone_triggered = None  # Track last milestone to prevent spam
         self.last_charging_milestone = None  # Track charging milestones separately
         
@@ -235,9 +268,21 @@ class BattMonCrossPlatform(QWidget):
         self.pulse_opacity = 1.0
         self.pulse_direction = -0.3  # Fade direction and speed
         self.pulse_timer = None
+        self._composite_pixmap = None  # Reused buffer for pulse opacity compositing
+        self._icon_pixmap_cache = {}  # (percentage, is_charging, size) -> QPixmap
+        # Last values pushed to Qt - setters are skipped when nothing visible changed
+        self._last_rendered = {'icon_key': None, 'tooltip': None, 'status': None}
+        self._menu_status = ('--', '--')  # (percentage, state) shown when the menu opens
         # Enable pulse beeps and 1% step beeps for debugging
         self.beep_with_pulse = True  # Enable/disable beeps with pulsing
         
+        # Tooltip prefix is constant; only the percentage changes per tick
+        self._tooltip_prefix = "BattMon - battery monitor - Battery "
+        
+        # Render tray icons at device pixels (24 logical px) so HiDPI trays don't upscale them
+        screen = QApplication.primaryScreen()
+        self.tray_icon_size = max(16, round(24 * (screen.devicePixelRatio() if screen else 1.0)))
+        
         # Create system tray icon
         self.tray_icon = QSystemTrayIcon(self)
         self.tray_icon.setToolTip(f"BattMon Cross-Platform - Battery Monitor ({CURRENT_OS})")
@@ -259,12 +304,15 @@ class BattMonCrossPlatform(QWidget):
         # Show startup notification with milestone thresholds
         self.show_startup_notification()
         
-        print(f"BattMon Cross-Platform started on {CURRENT_OS} - system tray icon should be visible")
-        print("Left-click to show battery window, Right-click for menu")
+        logger.info("BattMon Cross-Platform started on %s - system tray icon should be visible", CURRENT_OS)
+        logger.info("Left-click to show battery window, Right-click for menu")
+        _log_buffer.flush()
         
     def create_tray_menu(self):
-        """Create the system tray context menu"""
-        menu = QMenu()
+        """Create the system tray context menu (built once, reused for every popup)"""
+        menu = self.tray_menu = QMenu()
+        # The status line is only formatted when the menu is actually opened
+        menu.aboutToShow.connect(self.refresh_tray_menu)
         
         # Battery status action (disabled, shows current status)
         self.status_action = QAction(f"Battery: --% (--) [{CURRENT_OS}]", self)
@@ -312,6 +360,14 @@ class BattMonCrossPlatform(QWidget):
         # Connect left-click to show battery window
         self.tray_icon.activated.connect(self.tray_icon_activated)
     
+    def refresh_tray_menu(self):
+        """Update the dynamic battery status line right before the menu pops up"""
+        percentage, state = self._menu_status
+        status = f"Battery: {percentage}% ({state}) [{CURRENT_OS}]"
+        if status != self._last_rendered['status']:
+            self.status_action.setText(status)
+            self._last_rendered['status'] = status
+    
     def tray_icon_activated(self, reason):
         """Handle system tray icon activation"""
         if reason == QSystemTrayIcon.ActivationReason.Trigger:  # Left-click
@@ -343,19 +399,56 @@ class BattMonCrossPlatform(QWidget):
             print(f"[DEBUG] Error creating battery status window: {e}")
             self.battery_status_window = None
     
+    def build_battery_status_text(self, info, detailed_info):
+        """Build the rich-text body shared by the battery status dialog and its refreshes"""
+        percentage = info['percentage']
+        state = info['state']
+        time_remaining = info.get('time', '')
+        is_charging = info.get('state', '').lower() in ('charging', 'full')
+        
+        charging_indicator = " ⚡" if is_charging else ""
+        time_info = f"<br><b>Time Remaining:</b> {time_remaining}" if time_remaining else ""
+        
+        # Color-code the percentage based on battery level
+        color, status_icon = _status_style(percentage)
+        
+        current_time = datetime.datetime.now().strftime("%H:%M:%S")
+        
+        return f"""
+<h2>{status_icon} BattMon Cross-Platform - Battery Status</h2>
+
+<p><b>Current Charge:</b> <span style="color: {color}; font-size: 18pt; font-weight: bold;">{percentage}%{charging_indicator}</span><br>
+<b>Battery State:</b> {state}{time_info}<br>
+<b>Platform:</b> {CURRENT_OS}<br>
+<b>Last Updated:</b> {current_time}</p>
+
+<h3>⚡ Battery Details</h3>
+<p><b>Technology:</b> {detailed_info.get('technology', 'Unknown')}<br>
+<b>Manufacturer:</b> {detailed_info.get('manufacturer', 'Unknown')}<br>
+<b>Voltage:</b> {detailed_info.get('voltage', 'Unknown')}<br>
+<b>Power Draw:</b> {detailed_info.get('power_draw', 'Unknown')}</p>
+
+<h3>💚 Battery Health</h3>
+<p><b>Health Status:</b> {detailed_info.get('health_status', 'Unknown')}<br>
+<b>Health Percentage:</b> {detailed_info.get('health_percentage', 0)}%<br>
+<b>Design Capacity:</b> {detailed_info.get('design_capacity', 'Unknown')}<br>
+<b>Current Capacity:</b> {detailed_info.get('current_capacity', 'Unknown')}<br>
+<b>Cycle Count:</b> {detailed_info.get('cycle_count', 'Unknown')}</p>
+
+<p style="margin-top: 10px; text-align: center;">
+<b>BattMon Cross-Platform</b> v{VERSION}<br>
+<em>Real-time battery monitoring and health tracking</em>
+</p>
+"""
+    
     def create_battery_status_dialog(self):
         """Create a non-modal battery status dialog"""
         try:
-            from PyQt6.QtWidgets import QDialog, QVBoxLayout, QLabel, QPushButton, QHBoxLayout
-            from PyQt6.QtCore import QTimer
-            
             # Get battery information
             info = self.get_battery_info()
             detailed_info = self.get_detailed_battery_info()
             
             percentage = info['percentage']
-            state = info['state']
-            time_remaining = info.get('time', '')
             is_charging = info.get('state', '').lower() in ('charging', 'full')
             
             # Create dialog
@@ -363,6 +456,8 @@ class BattMonCrossPlatform(QWidget):
             dialog.setWindowTitle("Battery Status - BattMon Cross-Platform")
             dialog.setModal(False)  # Non-modal so it doesn't block the main application
             dialog.resize(500, 400)
+            # Free the widget tree (and its refresh timer) as soon as it is closed
+            dialog.setAttribute(Qt.WidgetAttribute.WA_DeleteOnClose)
             
             # Set dialog icon
             dialog.setWindowIcon(self.create_battery_icon(percentage, is_charging, 24))
@@ -376,51 +471,7 @@ class BattMonCrossPlatform(QWidget):
             content_label.setWordWrap(True)
             
             # Create the battery status text in HTML format
-            charging_indicator = " ⚡" if is_charging else ""
-            time_info = f"<br><b>Time Remaining:</b> {time_remaining}" if time_remaining else ""
-            
-            # Color-code the percentage based on battery level
-            if percentage >= 75:
-                color = "#27ae60"  # Green
-                status_icon = "🔋"
-            elif percentage >= 50:
-                color = "#f39c12"  # Orange-yellow
-                status_icon = "🔋"
-            elif percentage >= 30:
-                color = "#e67e22"  # Orange
-                status_icon = "⚠️"
-            else:
-                color = "#e74c3c"  # Red
-                status_icon = "🚨"
-            
-            current_time = datetime.datetime.now().strftime("%H:%M:%S")
-            
-            battery_text = f"""
-<h2>{status_icon} BattMon Cross-Platform - Battery Status</h2>
-
-<p><b>Current Charge:</b> <span style="color: {color}; font-size: 18pt; font-weight: bold;">{percentage}%{charging_indicator}</span><br>
-<b>Battery State:</b> {state}{time_info}<br>
-<b>Platform:</b> {CURRENT_OS}<br>
-<b>Last Updated:</b> {current_time}</p>
-
-<h3>⚡ Battery Details</h3>
-<p><b>Technology:</b> {detailed_info.get('technology', 'Unknown')}<br>
-<b>Manufacturer:</b> {detailed_info.get('manufacturer', 'Unknown')}<br>
-<b>Voltage:</b> {detailed_info.get('voltage', 'Unknown')}<br>
-<b>Power Draw:</b> {detailed_info.get('power_draw', 'Unknown')}</p>
-
-<h3>💚 Battery Health</h3>
-<p><b>Health Status:</b> {detailed_info.get('health_status', 'Unknown')}<br>
-<b>Health Percentage:</b> {detailed_info.get('health_percentage', 0)}%<br>
-<b>Design Capacity:</b> {detailed_info.get('design_capacity', 'Unknown')}<br>
-<b>Current Capacity:</b> {detailed_info.get('current_capacity', 'Unknown')}<br>
-<b>Cycle Count:</b> {detailed_info.get('cycle_count', 'Unknown')}</p>
-
-<p style="margin-top: 10px; text-align: center;">
-<b>BattMon Cross-Platform</b> v{VERSION}<br>
-<em>Real-time battery monitoring and health tracking</em>
-</p>
-"""
+            battery_text = self.build_battery_status_text(info, detailed_info)
             
             content_label.setText(battery_text)
             layout.addWidget(content_label)
@@ -444,8 +495,8 @@ class BattMonCrossPlatform(QWidget):
             
             dialog.setLayout(layout)
             
-            # Set up auto-refresh timer
-            refresh_timer = QTimer()
+            # Set up auto-refresh timer (parented so it is destroyed with the dialog)
+            refresh_timer = QTimer(dialog)
             refresh_timer.timeout.connect(lambda: self.refresh_battery_dialog(dialog, content_label))
             refresh_timer.start(5000)  # Refresh every 5 seconds
             
@@ -469,63 +520,16 @@ class BattMonCrossPlatform(QWidget):
             detailed_info = self.get_detailed_battery_info()
             
             percentage = info['percentage']
-            state = info['state']
-            time_remaining = info.get('time', '')
             is_charging = info.get('state', '').lower() in ('charging', 'full')
             
             # Update dialog icon
             dialog.setWindowIcon(self.create_battery_icon(percentage, is_charging, 24))
             
             # Create updated content
-            charging_indicator = " ⚡" if is_charging else ""
-            time_info = f"<br><b>Time Remaining:</b> {time_remaining}" if time_remaining else ""
-            
-            # Color-code the percentage based on battery level
-            if percentage >= 75:
-                color = "#27ae60"  # Green
-                status_icon = "🔋"
-            elif percentage >= 50:
-                color = "#f39c12"  # Orange-yellow
-                status_icon = "🔋"
-            elif percentage >= 30:
-                color = "#e67e22"  # Orange
-                status_icon = "⚠️"
-            else:
-                color = "#e74c3c"  # Red
-                status_icon = "🚨"
-            
-            current_time = datetime.datetime.now().strftime("%H:%M:%S")
-            
-            battery_text = f"""
-<h2>{status_icon} BattMon Cross-Platform - Battery Status</h2>
-
-<p><b>Current Charge:</b> <span style="color: {color}; font-size: 18pt; font-weight: bold;">{percentage}%{charging_indicator}</span><br>
-<b>Battery State:</b> {state}{time_info}<br>
-<b>Platform:</b> {CURRENT_OS}<br>
-<b>Last Updated:</b> {current_time}</p>
-
-<h3>⚡ Battery Details</h3>
-<p><b>Technology:</b> {detailed_info.get('technology', 'Unknown')}<br>
-<b>Manufacturer:</b> {detailed_info.get('manufacturer', 'Unknown')}<br>
-<b>Voltage:</b> {detailed_info.get('voltage', 'Unknown')}<br>
-<b>Power Draw:</b> {detailed_info.get('power_draw', 'Unknown')}</p>
-
-<h3>💚 Battery Health</h3>
-<p><b>Health Status:</b> {detailed_info.get('health_status', 'Unknown')}<br>
-<b>Health Percentage:</b> {detailed_info.get('health_percentage', 0)}%<br>
-<b>Design Capacity:</b> {detailed_info.get('design_capacity', 'Unknown')}<br>
-<b>Current Capacity:</b> {detailed_info.get('current_capacity', 'Unknown')}<br>
-<b>Cycle Count:</b> {detailed_info.get('cycle_count', 'Unknown')}</p>
-
-<p style="margin-top: 10px; text-align: center;">
-<b>BattMon Cross-Platform</b> v{VERSION}<br>
-<em>Real-time battery monitoring and health tracking</em>
-</p>
-"""
+            battery_text = self.build_battery_status_text(info, detailed_info)
             
             # Update the content
             content_label.setText(battery_text)
-            print("[DEBUG] Battery status dialog refreshed")
             
         except Exception as e:
             print(f"[ERROR] Failed to refresh battery status dialog: {e}")
@@ -698,16 +702,13 @@ class BattMonCrossPlatform(QWidget):
                 print(f"[DEBUG] HTML content length: {len(html_content)} characters")
                 
                 # Create a help window/dialog to display the HTML content
-                from PyQt6.QtWidgets import QDialog, QVBoxLayout, QTextBrowser, QPushButton, QHBoxLayout
-                from PyQt6.QtCore import QSize
-                
                 help_dialog = QDialog()
                 help_dialog.setWindowTitle("BattMon Cross-Platform - Help")
                 help_dialog.setMinimumSize(QSize(900, 700))
                 help_dialog.resize(QSize(1000, 800))
                 
                 # Set dialog icon
-                help_dialog.setWindowIcon(QIcon(self.create_battery_icon(75, False).pixmap(32, 32)))
+                help_dialog.setWindowIcon(self.create_battery_icon(75, False, 32))
                 
                 # Dark theme for the entire dialog to match About window
                 help_dialog.setStyleSheet("""
@@ -1049,7 +1050,7 @@ Platform: """ + CURRENT_OS
                 msg_box.setWindowTitle("BattMon Cross-Platform - Help")
                 msg_box.setTextFormat(Qt.TextFormat.PlainText)
                 msg_box.setText(fallback_help)
-                msg_box.setIconPixmap(self.create_battery_icon(75, False).pixmap(64, 64))
+                msg_box.setIconPixmap(self.create_battery_icon(75, False, 64).pixmap(64, 64))
                 msg_box.exec()
                 
         except Exception as e:
@@ -1061,9 +1062,6 @@ Platform: """ + CURRENT_OS
     def show_about(self):
         """Show about dialog with animated GIF"""
         try:
-            from PyQt6.QtWidgets import QDialog, QVBoxLayout, QHBoxLayout, QLabel, QPushButton
-            from PyQt6.QtCore import QSize
-            
             # Create custom dialog
             about_dialog = QDialog()
             about_dialog.setWindowTitle("About BattMon Cross-Platform")
@@ -1172,6 +1170,11 @@ License: GPL v2+</p>
             # Show dialog
             about_dialog.exec()
             
+            # Stop decoding GIF frames as soon as the dialog is dismissed
+            if hasattr(about_dialog, '_movie'):
+                about_dialog._movie.stop()
+            about_dialog.deleteLater()
+            
         except Exception as e:
             print(f"Error showing about dialog: {e}")
             # Fallback to simple message box
@@ -1192,9 +1195,6 @@ For more info: https://github.com/juren53/BattMon"""
     def show_profile_editor(self):
         """Show the Profile Editor dialog"""
         try:
-            # Import required PyQt6 components for QDialog
-            from PyQt6.QtWidgets import QDialog
-            
             # Import the profile editor module
             import profile_editor
             
@@ -1229,15 +1229,13 @@ For more info: https://github.com/juren53/BattMon"""
                     self.user_profile = self.load_user_profile()
                     
                     # Update current settings from reloaded profile
-                    self.milestone_thresholds = self.user_profile.get('milestone_thresholds', [90, 80, 70, 60, 50, 40, 30, 20, 10])
-                    self.charging_milestones = self.user_profile.get('charging_milestones', [25, 50, 75, 90, 100])
-                    self.notifications_enabled = self.user_profile.get('notifications_enabled', True)
-                    self.sleep_threshold = self.user_profile.get('sleep_threshold', 300)
-                    self.sleep_notifications_enabled = self.user_profile.get('sleep_notifications_enabled', True)
+                    self.apply_user_profile()
                     
                     # Reset milestone tracking to prevent duplicate notifications
                     self.last_milestone_triggered = None
                     self.last_charging_milestone = None
+                    # Re-evaluate the current reading against the new settings
+                    self._last_tick = None
                     
                     print("Profile settings reloaded successfully")
                     
@@ -1261,6 +1259,8 @@ For more info: https://github.com/juren53/BattMon"""
         print(f"BattMon Cross-Platform shutting down on {CURRENT_OS}...")
         # Save user profile before quitting
         self.save_user_profile()
+        self._stop_powershell_process()
+        self._battery_info_cache = (None, 0.0)
         if self.battery_widget:
             self.battery_widget.close()
         QApplication.quit()
@@ -1316,6 +1316,21 @@ For more info: https://github.com/juren53/BattMon"""
             print("Using default settings")
             return default_profile
     
+    def apply_user_profile(self):
+        """Copy profile settings into plain attributes (call after loading the profile)"""
+        self.sleep_threshold = self.user_profile.get('sleep_threshold', 300)  # seconds - consider system was asleep if gap > 5 minutes
+        self.sleep_notifications_enabled = self.user_profile.get('sleep_notifications_enabled', True)
+        self.milestone_thresholds = self.user_profile.get('milestone_thresholds', [90, 80, 70, 60, 50, 40, 30, 20, 10])
+        self.charging_milestones = self.user_profile.get('charging_milestones', [25, 50, 75, 90, 100])
+        self.notifications_enabled = self.user_profile.get('notifications_enabled', True)
+        self.play_sound = self.user_profile.get('play_sound', True)
+        self.notification_timeout = self.user_profile.get('notification_timeout', 5000)
+        
+        # Highest-first copies used when seeding milestone tracking
+        self._discharge_milestones_desc = tuple(sorted(self.milestone_thresholds, reverse=True))
+        self._charging_milestones_desc = tuple(sorted(self.charging_milestones, reverse=True))
+        self.format_milestone_thresholds()
+    
     def save_user_profile(self):
         """Save current user profile to configuration file"""
         config_dir = self.get_config_dir()
@@ -1343,6 +1358,13 @@ For more info: https://github.com/juren53/BattMon"""
         if not self.notifications_enabled:
             return
         
+        # Coalesce duplicates queued in quick succession
+        now = time.monotonic()
+        key = (title, notification_type)
+        if now - self._notify_dedup.get(key, -NOTIFY_DEDUP_SECONDS) < NOTIFY_DEDUP_SECONDS:
+            return
+        self._notify_dedup[key] = now
+        
         try:
             # Use Qt's built-in system tray notification as primary method
             icon_type = QSystemTrayIcon.MessageIcon.Information
@@ -1353,20 +1375,48 @@ For more info: https://github.com/juren53/BattMon"""
                 icon_type = QSystemTrayIcon.MessageIcon.Critical
             
             # Show notification with timeout from user profile
-            timeout = self.user_profile.get('notification_timeout', 5000)
+            timeout = self.notification_timeout
             self.tray_icon.showMessage(title, message, icon_type, timeout)
             
-            # Platform-specific enhancements
+            # Platform-specific enhancements (run off the GUI thread)
             if IS_LINUX:
-                self._show_linux_notification(title, message, notification_type)
+                if not self._send_dbus_notification(title, message, notification_type):
+                    self._notify_pool.start(lambda: self._show_linux_notification(title, message, notification_type))
             elif IS_WINDOWS:
-                self._show_windows_notification(title, message, notification_type)
+                self._notify_pool.start(lambda: self._show_windows_notification(title, message, notification_type))
             elif IS_MACOS:
-                self._show_macos_notification(title, message, notification_type)
+                self._notify_pool.start(lambda: self._show_macos_notification(title, message, notification_type))
                 
         except Exception as e:
             print(f"Error showing desktop notification: {e}")
     
+    def _send_dbus_notification(self, title, message, notification_type):
+        """Send a desktop notification over the D-Bus session bus; False if unavailable"""
+        if QDBusConnection is None:
+            return False
+        
+        # Connect before building the message: QtDBus registers its argument types on connect
+        bus = QDBusConnection.sessionBus()
+        if not bus.isConnected():
+            return False
+        
+        msg = QDBusMessage.createMethodCall('org.freedesktop.Notifications',
+                                            '/org/freedesktop/Notifications',
+                                            'org.freedesktop.Notifications', 'Notify')
+        urgency = NOTIFY_URGENCY.get(notification_type, 1)
+        msg.setArguments([
+            'BattMon',                                     # app_name
+            _dbus_typed(0, QMetaType.Type.UInt),           # replaces_id
+            'battery',                                     # app_icon
+            title,                                         # summary
+            message,                                       # body
+            QDBusArgument([], QMetaType.Type.QStringList.value),  # actions (as)
+            {'urgency': _dbus_typed(urgency, QMetaType.Type.UChar)},  # hints
+            self.notification_timeout                      # expire_timeout
+        ])
+        # Fire-and-forget: queued on the bus without waiting for the daemon's reply
+        return bus.send(msg)
+    
     def _show_linux_notification(self, title, message, notification_type):
         """Show Linux desktop notification using notify-send"""
         try:
@@ -1382,7 +1432,7 @@ For more info: https://github.com/juren53/BattMon"""
                 '--urgency', urgency,
                 '--icon', 'battery',
                 '--app-name', 'BattMon',
-                '--expire-time', str(self.user_profile.get('notification_timeout', 5000)),
+                '--expire-time', str(self.notification_timeout),
                 title, 
                 message
             ], capture_output=True, timeout=2)
@@ -1567,8 +1617,8 @@ try {{
                     self.last_charging_milestone = milestone
                     
                     # Play notification sound if enabled
-                    if self.user_profile.get('play_sound', True):
-                        self.alert_beep(1)
+                    if self.play_sound:
+                        self.alert_beep_async(1)
                     
                     break
         else:
@@ -1599,13 +1649,13 @@ try {{
                     self.last_milestone_triggered = milestone
                     
                     # Play notification sound if enabled (more urgent = more beeps)
-                    if self.user_profile.get('play_sound', True):
+                    if self.play_sound:
                         if milestone <= 10:
-                            self.alert_beep(3)  # Critical - 3 beeps
+                            self.alert_beep_async(3)  # Critical - 3 beeps
                         elif milestone <= 20:
-                            self.alert_beep(2)  # Low - 2 beeps
+                            self.alert_beep_async(2)  # Low - 2 beeps
                         else:
-                            self.alert_beep(1)  # Normal - 1 beep
+                            self.alert_beep_async(1)  # Normal - 1 beep
                     
                     break
             
@@ -1613,6 +1663,11 @@ try {{
             if self.last_charging_milestone is not None:
                 self.last_charging_milestone = None
     
+    def format_milestone_thresholds(self):
+        """Pre-format milestone thresholds for display (call whenever they change)"""
+        self._discharge_thresholds_str = ', '.join(f"{t}%" for t in self._discharge_milestones_desc)
+        self._charging_thresholds_str = ', '.join(f"{t}%" for t in reversed(self._charging_milestones_desc))
+    
     def show_startup_notification(self):
         """Show startup notification with configured milestone thresholds"""
         try:
@@ -1621,9 +1676,9 @@ try {{
             current_percentage = info.get('percentage', 0)
             current_state = info.get('state', 'Unknown')
             
-            # Format milestone thresholds for display
-            discharge_thresholds = ', '.join([f"{t}%" for t in sorted(self.milestone_thresholds, reverse=True)])
-            charging_thresholds = ', '.join([f"{t}%" for t in sorted(self.charging_milestones)])
+            # Milestone thresholds are pre-formatted at profile load time
+            discharge_thresholds = self._discharge_thresholds_str
+            charging_thresholds = self._charging_thresholds_str
             
             # Create informative startup message
             title = "🔋 BattMon Started - Desktop Notifications Active"
@@ -1633,18 +1688,18 @@ try {{
                 f"📉 Discharge alerts at: {discharge_thresholds}\n"
                 f"📈 Charging alerts at: {charging_thresholds}\n\n"
                 f"🔔 Notifications: {'Enabled' if self.notifications_enabled else 'Disabled'}\n"
-                f"🔊 Sound alerts: {'Enabled' if self.user_profile.get('play_sound', True) else 'Disabled'}"
+                f"🔊 Sound alerts: {'Enabled' if self.play_sound else 'Disabled'}"
             )
             
             # Show the startup notification
             self.show_desktop_notification(title, message, 'info')
             
             # Also print to console
-            print(f"Desktop notifications configured:")
-            print(f"  Discharge milestones: {discharge_thresholds}")
-            print(f"  Charging milestones: {charging_thresholds}")
-            print(f"  Notifications: {'ON' if self.notifications_enabled else 'OFF'}")
-            print(f"  Sound alerts: {'ON' if self.user_profile.get('play_sound', True) else 'OFF'}")
+            logger.info("Desktop notifications configured:")
+            logger.info("  Discharge milestones: %s", discharge_thresholds)
+            logger.info("  Charging milestones: %s", charging_thresholds)
+            logger.info("  Notifications: %s", 'ON' if self.notifications_enabled else 'OFF')
+            logger.info("  Sound alerts: %s", 'ON' if self.play_sound else 'OFF')
             
         except Exception as e:
             print(f"Error showing startup notification: {e}")
@@ -1688,110 +1743,157 @@ try {{
             self.show_desktop_notification(title, message, notification_type)
             
             # Play notification sound if enabled
-            if self.user_profile.get('play_sound', True):
+            if self.play_sound:
                 if current_percentage <= 10 and not is_charging:
-                    self.alert_beep(3)  # Critical - 3 beeps
+                    self.alert_beep_async(3)  # Critical - 3 beeps
                 elif current_percentage <= 20 and not is_charging:
-                    self.alert_beep(2)  # Warning - 2 beeps
+                    self.alert_beep_async(2)  # Warning - 2 beeps
                 else:
-                    self.alert_beep(1)  # Normal wake-up - 1 beep
+                    self.alert_beep_async(1)  # Normal wake-up - 1 beep
             
             # Also print to console
-            print(f"[WAKE-UP] System resumed at {current_time}")
-            print(f"[WAKE-UP] Battery: {current_percentage}% ({current_state}){charging_info}")
+            logger.info("[WAKE-UP] System resumed at %s", current_time)
+            logger.info("[WAKE-UP] Battery: %d%% (%s)%s", current_percentage, current_state, charging_info)
             
         except Exception as e:
             print(f"Error showing wake-up notification: {e}")
     
     def get_battery_info(self):
         """Get battery information using OS-appropriate method"""
+        # Pulse frames, dialogs and menu actions all poll between timer ticks;
+        # reuse a recent reading rather than querying the OS again
+        cached_info, cached_at = self._battery_info_cache
+        now = time.monotonic()
+        if cached_info is not None and now - cached_at < BATTERY_INFO_TTL:
+            return cached_info
+        
         if IS_WINDOWS:
-            return self.get_battery_info_windows()
+            info = self.get_battery_info_windows()
         elif IS_LINUX:
-            return self.get_battery_info_linux()
+            info = self.get_battery_info_linux()
         elif IS_MACOS:
-            return self.get_battery_info_macos()
+            info = self.get_battery_info_macos()
         else:
-            return self.get_battery_info_fallback()
+            info = self.get_battery_info_fallback()
+        
+        # The same reading is handed to every caller until the TTL expires,
+        # so share it as a read-only view rather than a mutable dict
+        info = MappingProxyType(info)
+        self._battery_info_cache = (info, now)
+        return info
     
     def get_battery_info_windows(self):
         """Get battery information on Windows using WMI/PowerShell"""
         try:
             # Try WMI first (requires pywin32 or wmi module)
-            try:
-                import wmi
-                c = wmi.WMI()
-                
-                for battery in c.Win32_Battery():
-                    percentage = battery.EstimatedChargeRemaining or 0
-                    
-                    # Convert Windows battery status to our format
-                    status_map = {
-                        1: "Unknown",     # Other
-                        2: "Discharging", # Low
-                        3: "Discharging", # Warning  
-                        4: "Discharging", # Critical
-                        5: "Charging",    # Charging
-                        6: "Full",        # Charged/Full
-                    }
-                    state = status_map.get(battery.BatteryStatus, "Unknown")
-                    
-                    # Get time estimate
-                    time_remaining = None
-                    if battery.EstimatedRunTime and battery.EstimatedRunTime != 71582788:
-                        hours = battery.EstimatedRunTime // 60
-                        minutes = battery.EstimatedRunTime % 60
-                        time_remaining = f"{hours:02d}:{minutes:02d}"
-                    
-                    return {
-                        'state': state,
-                        'percentage': percentage,
-                        'time': time_remaining
-                    }
-                        
-            except ImportError:
+            if wmi is None:
                 # Fallback to PowerShell
                 return self.get_battery_info_powershell()
+            
+            c = wmi.WMI()
+            
+            for battery in c.Win32_Battery():
+                percentage = battery.EstimatedChargeRemaining or 0
+                
+                # Convert Windows battery status to our format
+                state = WIN32_BATTERY_STATUS.get(battery.BatteryStatus, "Unknown")
+                
+                # Get time estimate
+                time_remaining = None
+                if battery.EstimatedRunTime and battery.EstimatedRunTime != WIN32_RUNTIME_UNKNOWN:
+                    hours = battery.EstimatedRunTime // 60
+                    minutes = battery.EstimatedRunTime % 60
+                    time_remaining = f"{hours:02d}:{minutes:02d}"
+                
+                return {
+                    'state': state,
+                    'percentage': percentage,
+                    'time': time_remaining
+                }
+            
+            return self.get_battery_info_fallback()
                 
         except Exception as e:
             print(f"Error getting Windows battery info: {e}")
             return self.get_battery_info_fallback()
     
+    def _get_powershell_process(self):
+        """Return the persistent PowerShell process, (re)starting it if needed"""
+        if self._ps_proc is None or self._ps_proc.poll() is not None:
+            # '-Command -' reads commands from stdin, so the interpreter starts once
+            # and each poll is a single query instead of a new shell + script parse
+            self._ps_proc = subprocess.Popen(
+                ["powershell", "-NoProfile", "-NoLogo", "-NonInteractive", "-Command", "-"],
+                stdin=subprocess.PIPE, stdout=subprocess.PIPE, stderr=subprocess.DEVNULL,
+                text=True, bufsize=1,
+                creationflags=getattr(subprocess, 'CREATE_NO_WINDOW', 0)
+            )
+            # A reader thread feeds stdout lines into a queue so queries can wait
+            # with a deadline; None marks end of output (PowerShell exited)
+            self._ps_lines = queue.Queue()
+            threading.Thread(target=self._read_powershell_output,
+                             args=(self._ps_proc.stdout, self._ps_lines), daemon=True).start()
+        return self._ps_proc
+    
+    @staticmethod
+    def _read_powershell_output(stdout, lines):
+        """Forward PowerShell output lines to a queue until the pipe closes"""
+        try:
+            for line in stdout:
+                lines.put(line)
+        except (OSError, ValueError):
+            pass
+        lines.put(None)
+    
+    def _stop_powershell_process(self):
+        """Terminate the persistent PowerShell process if it is running"""
+        if self._ps_proc is not None:
+            try:
+                self._ps_proc.stdin.close()
+                self._ps_proc.terminate()
+            except Exception:
+                pass
+            self._ps_proc = None
+    
     def get_battery_info_powershell(self):
         """Get battery information using PowerShell (Windows fallback)"""
         try:
-            # PowerShell command to get battery info
-            ps_cmd = """
-            Get-WmiObject -Class Win32_Battery | ForEach-Object {
-                $percentage = $_.EstimatedChargeRemaining
-                $status = switch ($_.BatteryStatus) {
-                    1 { "Unknown" }
-                    2 { "Discharging" }  
-                    3 { "Discharging" }
-                    4 { "Discharging" }
-                    5 { "Charging" }
-                    6 { "Full" }
-                    default { "Unknown" }
-                }
-                $time = if ($_.EstimatedRunTime -and $_.EstimatedRunTime -ne 71582788) {
-                    $hours = [math]::Floor($_.EstimatedRunTime / 60)
-                    $minutes = $_.EstimatedRunTime % 60
-                    "{0:D2}:{1:D2}" -f $hours, $minutes
-                } else { "" }
-                Write-Output "$percentage,$status,$time"
-            }
-            """
-            
-            result = subprocess.check_output(
-                ["powershell", "-Command", ps_cmd], 
-                shell=True, text=True
-            ).strip()
+            proc = self._get_powershell_process()
+            proc.stdin.write(PS_BATTERY_QUERY)
+            proc.stdin.flush()
+            
+            # Read until the sentinel; None means PowerShell exited. A stalled
+            # CIM query must not block the GUI thread, so give up after the deadline
+            result = ''
+            deadline = time.monotonic() + PS_QUERY_TIMEOUT
+            while True:
+                try:
+                    line = self._ps_lines.get(timeout=max(0, deadline - time.monotonic()))
+                except queue.Empty:
+                    print(f"PowerShell battery query timed out after {PS_QUERY_TIMEOUT}s")
+                    self._stop_powershell_process()
+                    return self.get_battery_info_fallback()
+                if line is None:
+                    self._stop_powershell_process()
+                    break
+                line = line.strip()
+                if line == '---END---':
+                    break
+                if line:
+                    result = line
             
             if result:
                 parts = result.split(',')
                 percentage = int(parts[0]) if parts[0].isdigit() else 0
-                state = parts[1] if len(parts) > 1 else "Unknown"
-                time_remaining = parts[2] if len(parts) > 2 and parts[2] else None
+                status = int(parts[1]) if len(parts) > 1 and parts[1].isdigit() else 0
+                state = WIN32_BATTERY_STATUS.get(status, "Unknown")
+                
+                time_remaining = None
+                runtime = int(parts[2]) if len(parts) > 2 and parts[2].isdigit() else 0
+                if runtime and runtime != WIN32_RUNTIME_UNKNOWN:
+                    hours = runtime // 60
+                    minutes = runtime % 60
+                    time_remaining = f"{hours:02d}:{minutes:02d}"
                 
                 return {
                     'state': state,
@@ -1801,6 +1903,7 @@ try {{
                 
         except Exception as e:
             print(f"Error getting PowerShell battery info: {e}")
+            self._stop_powershell_process()
             
         return self.get_battery_info_fallback()
     
@@ -1832,8 +1935,7 @@ try {{
         
         try:
             # Try WMI for detailed info
-            try:
-                import wmi
+            if wmi is not None:
                 c = wmi.WMI()
                 
                 # Get battery information
@@ -1876,10 +1978,6 @@ try {{
                         else:
                             detailed_info['health_status'] = "Unknown"
                     break
-                    
-            except ImportError:
-                # Fallback to PowerShell
-                pass
                 
         except Exception as e:
             print(f"Error getting detailed Windows battery info: {e}")
@@ -1903,11 +2001,7 @@ try {{
         
         try:
             # Find battery path
-            battery_path = None
-            for bat_name in os.listdir('/sys/class/power_supply/'):
-                if bat_name.startswith('BAT'):
-                    battery_path = f'/sys/class/power_supply/{bat_name}'
-                    break
+            battery_path = self.find_sysfs_battery()
             
             if battery_path:
                 # Read various battery properties
@@ -2022,7 +2116,6 @@ try {{
             if 'Health Information' in result:
                 # Extract cycle count
                 if 'Cycle Count' in result:
-                    import re
                     cycle_match = re.search(r'Cycle Count</key>\s*<integer>(\d+)</integer>', result)
                     if cycle_match:
                         detailed_info['cycle_count'] = cycle_match.group(1)
@@ -2098,10 +2191,83 @@ try {{
             'power_draw': '--'
         }
     
+    def find_sysfs_battery(self):
+        """Return the first /sys/class/power_supply/BAT* directory, or '' if none"""
+        if self._sysfs_battery_path is None:
+            self._sysfs_battery_path = ''
+            try:
+                for bat_name in sorted(os.listdir(SYSFS_POWER_SUPPLY)):
+                    if bat_name.startswith('BAT'):
+                        self._sysfs_battery_path = os.path.join(SYSFS_POWER_SUPPLY, bat_name)
+                        break
+            except OSError:
+                pass
+        return self._sysfs_battery_path
+    
+    def _read_sysfs(self, battery_path, name):
+        """Read one sysfs attribute, returning None if it is missing"""
+        try:
+            with open(os.path.join(battery_path, name), 'r') as f:
+                return f.read().strip()
+        except OSError:
+            return None
+    
+    def get_battery_info_sysfs(self):
+        """Get battery information on Linux straight from sysfs (no subprocess)"""
+        battery_path = self.find_sysfs_battery()
+        if not battery_path:
+            return None
+        
+        capacity = self._read_sysfs(battery_path, 'capacity')
+        status = self._read_sysfs(battery_path, 'status')
+        if capacity is None or status is None:
+            return None
+        
+        # Time remaining from energy (uWh / uW) or charge (uAh / uA) counters
+        time_remaining = None
+        if status in ('Charging', 'Discharging'):
+            for now_name, full_name, rate_name in (('energy_now', 'energy_full', 'power_now'),
+                                                   ('charge_now', 'charge_full', 'current_now')):
+                now = self._read_sysfs(battery_path, now_name)
+                rate = self._read_sysfs(battery_path, rate_name)
+                if now is None or rate is None:
+                    continue
+                try:
+                    rate = abs(int(rate))
+                    if rate == 0:
+                        break
+                    if status == 'Charging':
+                        full = self._read_sysfs(battery_path, full_name)
+                        if full is None:
+                            break
+                        hours = (int(full) - int(now)) / rate
+                    else:
+                        hours = int(now) / rate
+                except ValueError:
+                    break
+                seconds = max(0, int(hours * 3600))
+                time_remaining = f"{seconds // 3600:02d}:{seconds % 3600 // 60:02d}:{seconds % 60:02d}"
+                break
+        
+        try:
+            percentage = int(capacity)
+        except ValueError:
+            return None
+        
+        return {
+            'state': status,
+            'percentage': percentage,
+            'time': time_remaining
+        }
+    
     def get_battery_info_linux(self):
-        """Get battery information on Linux using ACPI"""
+        """Get battery information on Linux from sysfs, falling back to ACPI"""
+        info = self.get_battery_info_sysfs()
+        if info is not None:
+            return info
+        
         try:
-            text = subprocess.check_output('acpi', shell=True).decode('utf-8').strip()
+            text = subprocess.check_output(['acpi'], text=True).strip()
             if 'Battery' not in text:
                 return self.get_battery_info_fallback()
             
@@ -2119,61 +2285,35 @@ try {{
                 if not line or 'Battery' not in line:
                     continue
                 
-                # Try comma-separated format first (Format 1)
-                if ',' in line:
-                    try:
-                        data = line.split(',')
-                        if len(data) >= 2:
-                            # Extract state from first part
-                            if ':' in data[0]:
-                                state = data[0].split(':')[1].strip()
-                            else:
-                                state = "Unknown"
-                            
-                            # Extract percentage from second part
-                            percentage_part = data[1].strip()
-                            # Extract percentage number (handle various formats like " 100%", "100%", etc.)
-                            import re
-                            percentage_match = re.search(r'(\d+)%', percentage_part)
-                            if percentage_match:
-                                percentage = int(percentage_match.group(1))
-                            else:
-                                continue  # Skip this line if no percentage found
-                            
-                            # Extract time remaining if available
-                            time = None
-                            if len(data) > 2 and state not in ('Full', 'Unknown'):
-                                time_part = data[2].strip()
-                                if ' ' in time_part:
-                                    time = time_part.split(' ')[1]
-                            
-                            return {
-                                'state': state,
-                                'percentage': percentage,
-                                'time': time
-                            }
-                    except Exception as e:
-                        pass  # Continue to next parsing method
-                        continue
+                # Comma-separated format (Format 1): one regex scan yields all fields
+                match = _ACPI_RE.search(line)
+                if match:
+                    state, percentage, time = match.group(1, 2, 3)
+                    state = state.strip()
+                    if state in ('Full', 'Unknown'):
+                        time = None
+                    return {
+                        'state': state,
+                        'percentage': int(percentage),
+                        'time': time
+                    }
                 
                 # Try colon-separated format (Format 2 and variations)
                 if ':' in line:
                     try:
-                        parts = line.split(':')
+                        parts = line.split(':', 1)  # Keep any further colons in the second part
                         if len(parts) >= 2:
                             # First part should contain "Battery X"
                             # Second part should contain state and possibly percentage
-                            battery_part = parts[0].strip()
-                            info_part = ':'.join(parts[1:]).strip()  # Join back in case of multiple colons
+                            info_part = parts[1].strip()
                             
                             # Extract percentage using regex
-                            import re
-                            percentage_match = re.search(r'(\d+)%', info_part)
+                            percentage_match = _PERCENT_RE.search(info_part)
                             if percentage_match:
                                 percentage = int(percentage_match.group(1))
                             else:
                                 # Maybe percentage is in the battery part or elsewhere
-                                percentage_match = re.search(r'(\d+)%', line)
+                                percentage_match = _PERCENT_RE.search(line)
                                 if percentage_match:
                                     percentage = int(percentage_match.group(1))
                                 else:
@@ -2181,18 +2321,17 @@ try {{
                             
                             # Extract state (check 'discharging' before 'charging' since 'discharging' contains 'charging')
                             state = "Unknown"
-                            if 'discharging' in info_part.lower():
+                            info_lower = info_part.lower()
+                            if 'discharging' in info_lower:
                                 state = "Discharging"
-                            elif 'charging' in info_part.lower():
+                            elif 'charging' in info_lower:
                                 state = "Charging"
-                            elif 'full' in info_part.lower() or 'charged' in info_part.lower():
+                            elif 'full' in info_lower or 'charged' in info_lower:
                                 state = "Full"
-                            elif 'unknown' in info_part.lower():
-                                state = "Unknown"
                             
                             # Extract time remaining
                             time = None
-                            time_match = re.search(r'(\d{2}:\d{2})', info_part)
+                            time_match = _HHMM_RE.search(info_part)
                             if time_match:
                                 time = time_match.group(1)
                             
@@ -2279,36 +2418,32 @@ try {{
             self.pulse_timer.stop()
             self.pulse_timer = None
         self.pulse_opacity = 1.0
+        # Pulse frames drew over the tray icon, so force the next static redraw
+        self._last_rendered['icon_key'] = None
         
     def beep(self):
         """Make a beep sound using platform-appropriate methods."""
         if not self.beep_with_pulse:
             return
             
-        system = platform.system().lower()
-        
-        if system == 'windows':
-            try:
+        if IS_WINDOWS:
+            if winsound is not None:
                 # Method 1: Use winsound module (built into Python on Windows)
-                import winsound
                 # Play a beep at 800 Hz for 150ms (shorter for pulse beeps)
                 winsound.Beep(800, 150)
                 return
-            except ImportError:
-                pass
             
             try:
-                # Method 2: Use os.system with Windows beep command
-                import os
-                os.system('echo \a')
+                # Method 2: Ring the console bell directly (no cmd.exe for 'echo')
+                sys.stdout.write('\a')
+                sys.stdout.flush()
                 return
             except:
                 pass
         
-        elif system == 'linux' or system == 'darwin':  # Linux or macOS
+        elif IS_LINUX or IS_MACOS:
             try:
                 # Use sox if available - shorter beep for pulsing
-                import subprocess
                 subprocess.run(['play', '-n', 'synth', '0.1', 'sine', '800'], 
                               capture_output=True, check=True, timeout=2)
                 return
@@ -2319,12 +2454,9 @@ try {{
         
     def alert_beep(self, times: int = 1):
         """Cross-platform short beep N times (separate from pulsing)."""
-        system = platform.system().lower()
-        
         for i in range(max(1, times)):
-            if system == 'windows':
+            if IS_WINDOWS:
                 try:
-                    import winsound
                     # Use Windows system WAV sounds - these work when beeps are disabled
                     if i == 0:  # First beep - use warning sound
                         winsound.PlaySound("SystemExclamation", winsound.SND_ALIAS)
@@ -2340,8 +2472,9 @@ try {{
                             winsound.Beep(880, 120)
                         except Exception:
                             try:
-                                # Final fallback
-                                os.system('echo \a')
+                                # Final fallback: console bell
+                                sys.stdout.write('\a')
+                                sys.stdout.flush()
                             except Exception:
                                 pass
             else:
@@ -2356,6 +2489,10 @@ try {{
                         pass
             time.sleep(0.08)
 
+    def alert_beep_async(self, times: int = 1):
+        """Play alert_beep on the notification pool so the GUI thread is not blocked."""
+        self._notify_pool.start(lambda: self.alert_beep(times))
+
     def pulse_update(self):
         """Update pulse animation state"""
         # Update opacity for pulsing effect
@@ -2371,14 +2508,40 @@ try {{
             # Beep when pulse reaches maximum opacity (most visible)
             self.beep()
         
-        # Update the icon with new opacity
-        info = self.get_battery_info()
+        # Update the icon with new opacity (frames only animate the last tick's reading)
+        info = self._last_info if self._last_info is not None else self.get_battery_info()
         is_charging = info['state'] not in ('Discharging', 'Full', 'Unknown')
-        icon = self.create_battery_icon(info['percentage'], is_charging, 24, self.pulse_opacity)
+        icon = self.create_battery_icon(info['percentage'], is_charging, self.tray_icon_size, self.pulse_opacity)
         self.tray_icon.setIcon(icon)
     
     def create_battery_icon(self, percentage, is_charging=False, size=24, opacity=1.0):
         """Create a battery icon using Qt's cross-platform image handling"""
+        # Icons are a pure function of (percentage, charging, size), so each
+        # combination is rendered once and reused (at most ~200 per size)
+        key = (percentage, is_charging, size)
+        pixmap = self._icon_pixmap_cache.get(key)
+        if pixmap is None:
+            pixmap = self._render_battery_pixmap(percentage, is_charging, size)
+            self._icon_pixmap_cache[key] = pixmap
+        
+        # Apply global opacity if specified (for pulsing effect)
+        if opacity < 1.0:
+            # Reuse one composite buffer across pulse frames; only reallocate on size change
+            if self._composite_pixmap is None or self._composite_pixmap.size() != pixmap.size():
+                self._composite_pixmap = QPixmap(pixmap.size())
+            self._composite_pixmap.fill(Qt.GlobalColor.transparent)
+            temp_painter = QPainter(self._composite_pixmap)
+            temp_painter.setOpacity(opacity)
+            temp_painter.drawPixmap(0, 0, pixmap)
+            temp_painter.end()
+            return QIcon(self._composite_pixmap)
+        
+        return QIcon(pixmap)
+    
+    def _render_battery_pixmap(self, percentage, is_charging, size):
+        """Paint a battery icon pixmap at full opacity"""
+        g = _geom_for_size(size)
+        
         # Create a pixmap
         pixmap = QPixmap(size, size)
         pixmap.fill(Qt.GlobalColor.transparent)
@@ -2386,82 +2549,52 @@ try {{
         painter = QPainter(pixmap)
         painter.setRenderHint(QPainter.RenderHint.Antialiasing)
         
-        # Scale dimensions based on icon size
-        scale = size / 24.0
-        
         # Choose color based on battery level (4-tier system)
-        if percentage >= 75:
-            color = QColor(76, 175, 80)   # Green (100-75%)
-            bg_color = QColor(200, 255, 200, 180)  # Light green background
-        elif percentage >= 50:
-            color = QColor(255, 235, 59)  # Yellow (74-50%)
-            bg_color = QColor(255, 255, 200, 180)  # Light yellow background
-        elif percentage >= 30:
-            color = QColor(255, 152, 0)   # Orange (49-30%)
-            bg_color = QColor(255, 230, 180, 180)  # Light orange background
-        else:
-            color = QColor(244, 67, 54)   # Red (29-0%)
-            bg_color = QColor(255, 200, 200, 180)  # Light red background
-        
-        # Use more of the available space - make battery larger and move it higher up
-        battery_x = int(1 * scale)
-        battery_y = int(2 * scale)  # Move higher up to use more top space
-        battery_width = int(20 * scale)  # Make wider
-        battery_height = int(12 * scale)  # Make even taller
-        terminal_width = int(2 * scale)
-        terminal_height = int(8 * scale)  # Make terminal taller to match
+        color, bg_color = _icon_colors(percentage)
         
         # Add a subtle background color fill in upper area to reinforce color coding
+        painter.setPen(Qt.PenStyle.NoPen)
         if size >= 20:  # Only for larger icons
-            painter.setBrush(QBrush(bg_color))
-            painter.setPen(QPen(Qt.GlobalColor.transparent))
-            painter.drawRoundedRect(0, 0, size, int(16 * scale), 2, 2)
+            painter.setBrush(bg_color)
+            painter.drawRoundedRect(0, 0, size, g.background_height, 2, 2)
         
         # Draw battery fill based on percentage
-        fill_width = int((battery_width * percentage) / 100)
+        fill_width = int((g.battery_width * percentage) / 100)
         if fill_width > 0:
-            painter.setBrush(QBrush(color))
-            painter.setPen(QPen(Qt.GlobalColor.transparent))
-            painter.drawRect(battery_x, battery_y, fill_width, battery_height)
+            painter.setBrush(color)
+            painter.drawRect(g.battery_x, g.battery_y, fill_width, g.battery_height)
         
         # Draw empty battery area (if not full)
-        if fill_width < battery_width:
-            empty_color = QColor(240, 240, 240, 200)  # Light gray for empty area
-            painter.setBrush(QBrush(empty_color))
-            painter.setPen(QPen(Qt.GlobalColor.transparent))
-            painter.drawRect(battery_x + fill_width, battery_y, 
-                           battery_width - fill_width, battery_height)
+        if fill_width < g.battery_width:
+            painter.setBrush(ICON_EMPTY_COLOR)
+            painter.drawRect(g.battery_x + fill_width, g.battery_y,
+                             g.battery_width - fill_width, g.battery_height)
         
         # Draw battery outline with thicker line for better visibility
-        painter.setBrush(QBrush(Qt.GlobalColor.transparent))
-        painter.setPen(QPen(Qt.GlobalColor.black, max(1, int(2.5 * scale))))
-        painter.drawRect(battery_x, battery_y, battery_width, battery_height)
+        painter.setBrush(Qt.BrushStyle.NoBrush)
+        painter.setPen(g.outline_pen)
+        painter.drawRect(g.battery_x, g.battery_y, g.battery_width, g.battery_height)
         
         # Draw battery terminal (positive end)
-        terminal_x = battery_x + battery_width
-        terminal_y = battery_y + int(2 * scale)  # Adjust for taller battery
-        painter.setBrush(QBrush(Qt.GlobalColor.black))
-        painter.setPen(QPen(Qt.GlobalColor.transparent))
-        painter.drawRect(terminal_x, terminal_y, terminal_width, terminal_height)
+        painter.setBrush(Qt.GlobalColor.black)
+        painter.setPen(Qt.PenStyle.NoPen)
+        painter.drawRect(g.terminal_x, g.terminal_y, g.terminal_width, g.terminal_height)
         
         # Add charging indicator if charging
         if is_charging:
-            painter.setBrush(QBrush(QColor(255, 235, 59)))  # Yellow
-            painter.setPen(QPen(QColor(255, 235, 59), max(1, int(scale))))
+            painter.setBrush(ICON_BOLT_COLOR)
+            painter.setPen(g.bolt_pen)
             
             # Draw simplified lightning bolt
-            painter.drawLine(int(10 * scale), int(4 * scale), int(14 * scale), int(10 * scale))
-            painter.drawLine(int(14 * scale), int(6 * scale), int(10 * scale), int(12 * scale))
+            painter.drawLines(g.bolt_lines)
             
             # Add white outline for visibility
-            painter.setPen(QPen(Qt.GlobalColor.white, max(1, int(2 * scale))))
-            painter.drawLine(int(10 * scale), int(4 * scale), int(14 * scale), int(10 * scale))
-            painter.drawLine(int(14 * scale), int(6 * scale), int(10 * scale), int(12 * scale))
+            painter.setPen(g.bolt_outline_pen)
+            painter.drawLines(g.bolt_lines)
         
         # Add percentage text in the lower area below the battery
         if size >= 16:  # Only add text for larger icons
-            font = QFont("Arial", max(8, int(10 * scale)), QFont.Weight.Bold)
-            painter.setFont(font)
+            painter.setFont(g.font)
             
             text = str(percentage)
             font_metrics = painter.fontMetrics()
@@ -2469,35 +2602,23 @@ try {{
             
             # Center text in lower part, below the new battery position
             text_x = (size - text_rect.width()) // 2
-            text_y = int(23 * scale)  # Slightly lower to accommodate taller battery
+            text_y = g.text_y
             
-            # Draw text with outline for better visibility
-            outline_width = max(1, int(3 * scale))
-            
-            # Black outline
-            for dx in range(-outline_width, outline_width + 1):
-                for dy in range(-outline_width, outline_width + 1):
-                    if dx != 0 or dy != 0:
-                        painter.setPen(QPen(Qt.GlobalColor.black))
-                        painter.drawText(text_x + dx, text_y + dy, text)
-            
-            # White text
-            painter.setPen(QPen(Qt.GlobalColor.white))
-            painter.drawText(text_x, text_y, text)
+            # Draw text with outline for better visibility: shape the glyphs
+            # once into a path, then stroke it (black outline) and fill it (white)
+            text_path = QPainterPath()
+            text_path.addText(text_x, text_y, g.font, text)
+            painter.strokePath(text_path, g.text_outline_pen)
+            painter.fillPath(text_path, Qt.GlobalColor.white)
         
         painter.end()
         
-        # Apply global opacity if specified (for pulsing effect)
-        if opacity < 1.0:
-            temp_pixmap = QPixmap(pixmap.size())
-            temp_pixmap.fill(Qt.GlobalColor.transparent)
-            temp_painter = QPainter(temp_pixmap)
-            temp_painter.setOpacity(opacity)
-            temp_painter.drawPixmap(0, 0, pixmap)
-            temp_painter.end()
-            return QIcon(temp_pixmap)
-        
-        return QIcon(pixmap)
+        return pixmap
+    
+    def _set_poll_interval(self, interval):
+        """Change the battery poll interval (milliseconds) if it differs"""
+        if self.timer.interval() != interval:
+            self.timer.setInterval(interval)
     
     def update_battery(self):
         """Update battery status and icon"""
@@ -2510,50 +2631,65 @@ try {{
         if (self.sleep_notifications_enabled and 
             time_gap > self.sleep_threshold and 
             not self.was_asleep):
-            print(f"[SLEEP] Detected sleep mode wake-up. Time gap: {time_gap:.1f} seconds")
+            logger.info("[SLEEP] Detected sleep mode wake-up. Time gap: %.1f seconds", time_gap)
             self.was_asleep = True
             # Show wake-up notification
             self.show_wake_up_notification()
         elif time_gap <= self.sleep_threshold:
             # Normal update interval - reset sleep flag if it was set
             self.was_asleep = False
+        _log_buffer.flush()
         
         # Update the last update time for next detection
         self.last_update_time = current_time
         
         info = self.get_battery_info()
+        self._last_info = info
         percentage = info['percentage']
         state = info['state']
         is_charging = info['state'] not in ('Discharging', 'Full', 'Unknown')
         
+        # Nothing visible or notifiable can change if the reading is identical to the
+        # last tick (drop detection is trivially zero as well). While pulsing, the
+        # pulse timer owns the tray icon, so there is nothing to redraw here either.
+        tick_key = (percentage, state)
+        if tick_key == self._last_tick:
+            # Back off polling while the battery is stable (2 -> 4 -> 8 -> 16 -> 30 s),
+            # but keep the normal rate while pulsing so a charger plug-in stops it promptly
+            if not self.pulse_timer:
+                self._set_poll_interval(min(self.timer.interval() * 2, MAX_TIMEOUT))
+            return
+        self._last_tick = tick_key
+        self._set_poll_interval(TIMEOUT)
+        
         # Initialize milestone tracking on first update to prevent startup cascade
         if hasattr(self, '_initialize_milestone_tracking') and self._initialize_milestone_tracking:
-            print(f"[INIT] Initializing milestone tracking at {percentage}% to prevent startup cascade")
+            logger.info("[INIT] Initializing milestone tracking at %d%% to prevent startup cascade", percentage)
             
             # For discharge milestones, set the last triggered to the nearest milestone at or below current level
             # This prevents notifications for milestones that are at or below the current level
             if not is_charging:
                 # Find the highest milestone that is <= current percentage
-                for milestone in sorted(self.milestone_thresholds, reverse=True):
+                for milestone in self._discharge_milestones_desc:
                     if milestone <= percentage:
                         self.last_milestone_triggered = milestone
-                        print(f"[INIT] Set last_milestone_triggered to {milestone}% (current: {percentage}%)")
+                        logger.info("[INIT] Set last_milestone_triggered to %d%% (current: %d%%)", milestone, percentage)
                         break
                 # If no milestone is <= current percentage, set to None (all milestones are above current level)
                 if self.last_milestone_triggered is None:
-                    print(f"[INIT] All discharge milestones are above {percentage}%, leaving last_milestone_triggered as None")
+                    logger.info("[INIT] All discharge milestones are above %d%%, leaving last_milestone_triggered as None", percentage)
             
             # For charging milestones, set to the highest milestone at or below current level
             if is_charging:
                 # Find the highest milestone that is <= current percentage
-                for milestone in sorted(self.charging_milestones, reverse=True):
+                for milestone in self._charging_milestones_desc:
                     if milestone <= percentage:
                         self.last_charging_milestone = milestone
-                        print(f"[INIT] Set last_charging_milestone to {milestone}% (current: {percentage}%)")
+                        logger.info("[INIT] Set last_charging_milestone to %d%% (current: %d%%)", milestone, percentage)
                         break
                 # If no milestone is <= current percentage, set to None (all milestones are above current level)
                 if self.last_charging_milestone is None:
-                    print(f"[INIT] All charging milestones are above {percentage}%, leaving last_charging_milestone as None")
+                    logger.info("[INIT] All charging milestones are above %d%%, leaving last_charging_milestone as None", percentage)
             
             # Remove the initialization flag
             delattr(self, '_initialize_milestone_tracking')
@@ -2590,15 +2726,20 @@ try {{
         
         # Update system tray icon (only if not pulsing to avoid conflicts)
         if not self.pulse_timer or not self.pulse_timer.isActive():
-            icon = self.create_battery_icon(percentage, is_charging, 24)
-            self.tray_icon.setIcon(icon)
+            icon_key = (percentage, is_charging)
+            if icon_key != self._last_rendered['icon_key']:
+                icon = self.create_battery_icon(percentage, is_charging, self.tray_icon_size)
+                self.tray_icon.setIcon(icon)
+                self._last_rendered['icon_key'] = icon_key
         
         # Update tooltip
-        tooltip = f"BattMon - battery monitor - Battery {percentage}%"
-        self.tray_icon.setToolTip(tooltip)
+        tooltip = f"{self._tooltip_prefix}{percentage}%"
+        if tooltip != self._last_rendered['tooltip']:
+            self.tray_icon.setToolTip(tooltip)
+            self._last_rendered['tooltip'] = tooltip
         
-        # Update context menu status
-        self.status_action.setText(f"Battery: {percentage}% ({state}) [{CURRENT_OS}]")
+        # Context menu status line is refreshed from this when the menu opens
+        self._menu_status = (percentage, state)
         
         # Battery window now uses dialog style - no persistent window to update
         
@@ -2609,57 +2750,42 @@ try {{
         # This uses last_seen_percent so it works across state transitions.
         if self.last_seen_percent is not None:
             drop_any = self.last_seen_percent - percentage
-            # print(f"[DEBUG] drop-check last_seen={self.last_seen_percent}% current={percentage}% drop_any={drop_any} is_charging={is_charging}")
             if not is_charging and drop_any >= 1:
                 if percentage < 30:
-                    print("[DEBUG] RED zone 1%+ drop detected -> double beep")
-                    self.alert_beep(2)
+                    self.alert_beep_async(2)  # RED zone - double beep
                 elif 30 <= percentage < 50:
-                    print("[DEBUG] ORANGE zone 1%+ drop detected -> single beep")
-                    self.alert_beep(1)
-        else:
-            # print(f"[DEBUG] initializing last_seen_percent at {percentage}%")
-            pass
+                    self.alert_beep_async(1)  # ORANGE zone - single beep
         # Update last seen for next tick
         self.last_seen_percent = percentage
         
         # Print status message
         if show_message:
-            print(f"[{CURRENT_OS}] Battery: {percentage}% {state}")
+            logger.info("[%s] Battery: %d%% %s", CURRENT_OS, percentage, state)
+        _log_buffer.flush()
 
 def check_dependencies():
     """Check if required dependencies are available"""
     missing_deps = []
     
     if IS_LINUX:
-        try:
-            subprocess.check_output('acpi', shell=True, stderr=subprocess.DEVNULL)
-        except (subprocess.CalledProcessError, FileNotFoundError):
+        if shutil.which('acpi') is None:
             print("Warning: ACPI utility not found. Battery info may not work correctly.")
             print("  To fix: sudo apt install acpi")
     
     elif IS_WINDOWS:
-        try:
-            # Test PowerShell availability
-            subprocess.check_output(
-                ["powershell", "-Command", "Write-Output 'test'"], 
-                shell=True, stderr=subprocess.DEVNULL
-            )
-        except (subprocess.CalledProcessError, FileNotFoundError):
+        # Test PowerShell availability
+        if shutil.which('powershell') is None:
             print("Warning: PowerShell not found. Battery info may not work correctly.")
             
         # Check for optional WMI module
-        try:
-            import wmi
+        if wmi is not None:
             print("WMI module found - will use WMI for battery info")
-        except ImportError:
+        else:
             print("WMI module not found - will use PowerShell fallback")
             print("  For better performance: pip install WMI")
     
     elif IS_MACOS:
-        try:
-            subprocess.check_output(['pmset', '-g', 'batt'], stderr=subprocess.DEVNULL)
-        except (subprocess.CalledProcessError, FileNotFoundError):
+        if shutil.which('pmset') is None:
             print("Warning: pmset not found. Battery info may not work correctly.")
     
     return True  # Continue even with warnings
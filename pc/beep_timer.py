@@ -7,15 +7,46 @@ Press Ctrl+C to stop the beeping.
 import time
 import sys
 import subprocess
-import os
+import io
+import math
+import array
+import wave
+
+# 0.2 second 1000 Hz beep, rendered to WAV bytes once and piped to aplay
+# (kept in memory, so there is no shared temp file to collide with)
+BEEP_RATE = 44100
+BEEP_SECONDS = 0.2
+BEEP_FREQ = 1000
+
+BEEP_INTERVAL = 5.0  # seconds between beeps
+
+_beep_wav = None
+
+def render_beep_wav():
+    """Render the beep as 16-bit mono PCM WAV bytes."""
+    count = int(BEEP_RATE * BEEP_SECONDS)
+    step = 2 * math.pi * BEEP_FREQ / BEEP_RATE
+    samples = array.array('h', (int(math.sin(i * step) * 16383) for i in range(count)))
+    if sys.byteorder == 'big':
+        samples.byteswap()  # WAV data is little-endian
+    
+    buffer = io.BytesIO()
+    with wave.open(buffer, 'wb') as wav:
+        wav.setnchannels(1)
+        wav.setsampwidth(2)
+        wav.setframerate(BEEP_RATE)
+        wav.writeframes(samples.tobytes())
+    return buffer.getvalue()
 
 def beep():
-    """Make a beep sound using sox play command."""
+    """Make a beep sound by piping a pre-rendered WAV to aplay."""
+    global _beep_wav
     try:
-        # Generate a 0.2 second beep at 1000 Hz using sox
-        subprocess.run(['play', '-n', 'synth', '0.2', 'sine', '1000'], 
+        if _beep_wav is None:
+            _beep_wav = render_beep_wav()
+        subprocess.run(['aplay', '-q', '-'], input=_beep_wav,
                       capture_output=True, check=True, timeout=3)
-    except (subprocess.CalledProcessError, subprocess.TimeoutExpired, FileNotFoundError):
+    except (subprocess.CalledProcessError, subprocess.TimeoutExpired, OSError):
         # Fallback: visual beep
         print("🔔 BEEP!", end=' ', flush=True)
 
@@ -24,10 +55,15 @@ def main():
     print("Press Ctrl+C to stop")
     
     try:
+        # Schedule against the monotonic clock so the beep's own duration
+        # doesn't accumulate as drift; after a suspend, resync instead of
+        # trying to catch up
+        deadline = time.monotonic()
         while True:
             beep()
             print(f"Beep! {time.strftime('%H:%M:%S')}")
-            time.sleep(5)
+            deadline = max(deadline, time.monotonic() - BEEP_INTERVAL) + BEEP_INTERVAL
+            time.sleep(max(0, deadline - time.monotonic()))
     except KeyboardInterrupt:
         print("\nBeep timer stopped.")
         sys.exit(0)
@@ -6,52 +6,69 @@ Press Ctrl+C to stop the beeping.
 
 import time
 import sys
+import os
+import subprocess
 import platform
 
-def beep():
-    """Make a beep sound using platform-appropriate methods."""
-    system = platform.system().lower()
-    
-    if system == 'windows':
-        try:
-            # Method 1: Use winsound module (built into Python on Windows)
-            import winsound
-            # Play a beep at 1000 Hz for 200ms
-            winsound.Beep(1000, 200)
-            return
-        except ImportError:
-            pass
-        
-        try:
-            # Method 2: Use os.system with Windows beep command
-            import os
-            os.system('echo \a')
-            return
-        except:
-            pass
+BEEP_INTERVAL = 5.0  # seconds between beeps
+
+# Detect the platform once; beep is bound to the matching function below
+_SYSTEM = platform.system().lower()
+
+try:
+    import winsound  # built into Python on Windows
+except ImportError:
+    winsound = None
+
+def _beep_fallback():
+    """Fallback for all systems: visual beep."""
+    print("🔔 BEEP!", end=' ', flush=True)
+
+def _beep_windows():
+    """Beep using winsound, or the console bell."""
+    if winsound is not None:
+        # Play a beep at 1000 Hz for 200ms
+        winsound.Beep(1000, 200)
+        return
     
-    elif system == 'linux' or system == 'darwin':  # Linux or macOS
-        try:
-            # Use sox if available
-            import subprocess
-            subprocess.run(['play', '-n', 'synth', '0.2', 'sine', '1000'], 
-                          capture_output=True, check=True, timeout=3)
-            return
-        except (subprocess.CalledProcessError, subprocess.TimeoutExpired, FileNotFoundError):
-            pass
+    try:
+        # Use os.system with Windows beep command
+        os.system('echo \a')
+        return
+    except:
+        pass
     
-    # Fallback for all systems: visual beep
-    print("🔔 BEEP!", end=' ', flush=True)
+    _beep_fallback()
+
+def _beep_posix():
+    """Beep using sox on Linux or macOS."""
+    try:
+        subprocess.run(['play', '-n', 'synth', '0.2', 'sine', '1000'], 
+                      capture_output=True, check=True, timeout=3)
+    except (subprocess.CalledProcessError, subprocess.TimeoutExpired, FileNotFoundError):
+        _beep_fallback()
+
+if _SYSTEM == 'windows':
+    beep = _beep_windows
+elif _SYSTEM in ('linux', 'darwin'):  # Linux or macOS
+    beep = _beep_posix
+else:
+    beep = _beep_fallback
 
 def main():
     print(f"Starting beep timer on {platform.system()} - beeping every 5 seconds...")
     print("Press Ctrl+C to stop")
     
     try:
+        # Schedule against the monotonic clock so the beep's own duration
+        # doesn't accumulate as drift; after a suspend, resync instead of
+        # trying to catch up
+        deadline = time.monotonic()
         while True:
             beep()
             print(f"Beep! {time.strftime('%H:%M:%S')}")
-            time.sleep(5)
+            deadline = max(deadline, time.monotonic() - BEEP_INTERVAL) + BEEP_INTERVAL
+            time.sleep(max(0, deadline - time.monotonic()))
     except KeyboardInterrupt:
         print("\nBeep timer stopped.")
         sys.exit(0)
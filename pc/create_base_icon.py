@@ -3,19 +3,13 @@
 Create a base battery icon template that battmon.py can use
 """
 import cairo
-from gi.repository import GdkPixbuf
 import os
 
 def create_base_battery_icon():
     """Create a base battery icon template (outline only)"""
     # Create a 24x24 surface for the icon
     surface = cairo.ImageSurface(cairo.FORMAT_ARGB32, 24, 24)
-    ctx = cairo.Context(surface)
-    
-    # Set background to transparent
-    ctx.set_operator(cairo.OPERATOR_CLEAR)
-    ctx.paint()
-    ctx.set_operator(cairo.OPERATOR_OVER)
+    ctx = cairo.Context(surface)  # new surfaces start fully transparent
     
     # Draw battery outline (just the shape, no fill)
     battery_x, battery_y = 2, 8
@@ -45,12 +39,7 @@ def create_base_battery_icon():
 def create_charging_indicator_template():
     """Create a charging indicator template"""
     surface = cairo.ImageSurface(cairo.FORMAT_ARGB32, 24, 24)
-    ctx = cairo.Context(surface)
-    
-    # Set background to transparent
-    ctx.set_operator(cairo.OPERATOR_CLEAR)
-    ctx.paint()
-    ctx.set_operator(cairo.OPERATOR_OVER)
+    ctx = cairo.Context(surface)  # new surfaces start fully transparent
     
     # Draw lightning bolt
     ctx.set_source_rgba(1.0, 1.0, 0.0, 0.9)  # Bright yellow lightning
@@ -64,16 +53,9 @@ def create_charging_indicator_template():
     ctx.line_to(12, 7)   # Back to center
     ctx.line_to(14, 7)   # Right point
     ctx.close_path()
-    ctx.fill()
+    ctx.fill_preserve()  # keep the path for the outline
     
     # Add a white outline to make it stand out more
-    ctx.move_to(10, 4)
-    ctx.line_to(14, 7)
-    ctx.line_to(12, 7)
-    ctx.line_to(16, 10)
-    ctx.line_to(12, 7)
-    ctx.line_to(14, 7)
-    ctx.close_path()
     ctx.set_source_rgba(1.0, 1.0, 1.0, 0.9)  # White outline
     ctx.set_line_width(2)
     ctx.stroke()
@@ -85,10 +67,6 @@ def create_charging_indicator_template():
     return surface
 
 if __name__ == "__main__":
-    import gi
-    gi.require_version('GdkPixbuf', '2.0')
-    from gi.repository import GdkPixbuf
-    
     create_base_battery_icon()
     create_charging_indicator_template()
     print("\nBase icon templates created!")
@@ -7,20 +7,57 @@ Alternative to PowerShell script for users with restricted execution policies
 
 import os
 import sys
+import re
 import subprocess
-import urllib.request
+import time
+import base64
 import urllib.error
+import urllib.request
+import http.client
+import threading
+import contextlib
+import functools
+import importlib
+import importlib.metadata
+import site
+import concurrent.futures
 import json
 import tempfile
 import shutil
+import struct
+import uuid
 import winreg
 from pathlib import Path
+from urllib.parse import urlsplit, urljoin
 
 # Configuration
 GITHUB_RAW = "https://raw.githubusercontent.com/juren53/BattMon/main/pc"
 PYTHON_MIN_VERSION = (3, 8)
+PY_VER_STR = sys.version.split(maxsplit=1)[0]
+PIP_MIN_VERSION = (23, 0)  # only upgrade pip when it is older than this
+# No PyPI self-version check and no prompts: output is captured anyway
+PIP_INSTALL = [sys.executable, '-m', 'pip', '--disable-pip-version-check', 'install', '--no-input']
 INSTALL_DIR = Path(os.environ['LOCALAPPDATA']) / 'BattMon'
 START_MENU_DIR = Path(os.environ['APPDATA']) / 'Microsoft' / 'Windows' / 'Start Menu' / 'Programs'
+BATTMON_PY = INSTALL_DIR / 'battmon.py'
+BATTMON_BAT = INSTALL_DIR / 'battmon.bat'
+ETAGS_FILE = INSTALL_DIR / '.etags.json'  # ETags of the downloaded files, for update runs
+SHORTCUT_PATH = START_MENU_DIR / 'BattMon Cross-Platform.lnk'
+SYSTEM_ROOT = os.environ.get('SystemRoot', r'C:\Windows')
+HTTP_TIMEOUT = 30
+MAX_REDIRECTS = 5
+HTTP_RETRIES = 3          # extra attempts after a failed connect/request
+HTTP_RETRY_BACKOFF = 0.3  # seconds, doubled for each further retry
+DOWNLOAD_CHUNK_SIZE = 256 * 1024
+BANNER = "━" * 80
+
+# Idle keep-alive connections by (scheme, host), shared by every request so
+# the downloads don't each pay for a new TCP + TLS handshake
+_idle_connections = {}
+_connections_lock = threading.Lock()
+
+# Serializes the progress line shared by concurrent downloads
+_progress_lock = threading.Lock()
 
 # ANSI color codes for Windows
 class Colors:
@@ -42,85 +79,320 @@ class Colors:
         except Exception:
             pass
 
+def format_info(message):
+    return f"{Colors.BLUE}[INFO]{Colors.END} {message}"
+
+def format_success(message):
+    return f"{Colors.GREEN}[SUCCESS]{Colors.END} {message}"
+
+def format_warning(message):
+    return f"{Colors.YELLOW}[WARNING]{Colors.END} {message}"
+
+def format_error(message):
+    return f"{Colors.RED}[ERROR]{Colors.END} {message}"
+
+def format_header(message):
+    return f"{Colors.BOLD}{Colors.BLUE}{message}{Colors.END}"
+
 def print_info(message):
-    print(f"{Colors.BLUE}[INFO]{Colors.END} {message}")
+    print(format_info(message))
 
 def print_success(message):
-    print(f"{Colors.GREEN}[SUCCESS]{Colors.END} {message}")
+    print(format_success(message))
 
 def print_warning(message):
-    print(f"{Colors.YELLOW}[WARNING]{Colors.END} {message}")
+    print(format_warning(message))
 
 def print_error(message):
-    print(f"{Colors.RED}[ERROR]{Colors.END} {message}")
+    print(format_error(message))
 
 def print_header(message):
-    print(f"{Colors.BOLD}{Colors.BLUE}{message}{Colors.END}")
+    print(format_header(message))
+
+def print_block(lines):
+    """Print several lines with a single write"""
+    sys.stdout.write("\n".join(lines) + "\n")
+    sys.stdout.flush()
+
+@functools.lru_cache(maxsize=None)
+def _proxy_for(scheme, host):
+    """Return (proxy host:port, Proxy-Authorization header or None), or None for a direct connection"""
+    # getproxies() covers the *_PROXY variables and, on Windows, the registry settings
+    proxy = urllib.request.getproxies().get(scheme)
+    if not proxy or urllib.request.proxy_bypass(urlsplit(f"//{host}").hostname or host):
+        return None
+    
+    parts = urlsplit(proxy if '://' in proxy else f"http://{proxy}")
+    auth = None
+    if parts.username:
+        credentials = f"{parts.username}:{parts.password or ''}".encode()
+        auth = "Basic " + base64.b64encode(credentials).decode('ascii')
+    return parts.netloc.rpartition('@')[2], auth
+
+def _new_connection(scheme, host, timeout):
+    proxy = _proxy_for(scheme, host)
+    if proxy is None:
+        if scheme == 'https':
+            return http.client.HTTPSConnection(host, timeout=timeout)
+        return http.client.HTTPConnection(host, timeout=timeout)
+    
+    proxy_host, auth = proxy
+    if scheme == 'https':
+        # TLS to the real host, tunnelled through the proxy with CONNECT
+        conn = http.client.HTTPSConnection(proxy_host, timeout=timeout)
+        conn.set_tunnel(host, headers={'Proxy-Authorization': auth} if auth else None)
+        return conn
+    return http.client.HTTPConnection(proxy_host, timeout=timeout)
+
+def _request_target(scheme, host, url, path):
+    """Plain-HTTP requests through a proxy use the absolute URL as the request target"""
+    if scheme == 'http' and _proxy_for(scheme, host) is not None:
+        return url
+    return path
+
+def _request_headers(scheme, host, headers):
+    """Add Proxy-Authorization to plain-HTTP requests sent through an authenticating proxy"""
+    proxy = _proxy_for(scheme, host) if scheme == 'http' else None
+    if proxy is None or proxy[1] is None:
+        return headers
+    return {**headers, 'Proxy-Authorization': proxy[1]}
+
+def _get_connection(scheme, host, timeout):
+    """Take an idle pooled connection for host, or open a new one"""
+    with _connections_lock:
+        idle = _idle_connections.get((scheme, host))
+        conn = idle.pop() if idle else None
+    if conn is None:
+        return _new_connection(scheme, host, timeout)
+    conn.timeout = timeout
+    if conn.sock is not None:
+        conn.sock.settimeout(timeout)
+    return conn
+
+def _release_connection(scheme, host, conn, response):
+    """Return a connection whose response has been fully read to the pool"""
+    if response.will_close:
+        conn.close()
+        return
+    with _connections_lock:
+        _idle_connections.setdefault((scheme, host), []).append(conn)
+
+@contextlib.contextmanager
+def open_url(url, method='GET', timeout=HTTP_TIMEOUT, headers=None):
+    """Open url over a pooled keep-alive connection, following redirects"""
+    headers = headers or {}
+    for _ in range(MAX_REDIRECTS + 1):
+        parts = urlsplit(url)
+        path = parts.path or '/'
+        if parts.query:
+            path += '?' + parts.query
+        
+        target = _request_target(parts.scheme, parts.netloc, url, path)
+        request_headers = _request_headers(parts.scheme, parts.netloc, headers)
+        
+        # The first retry is immediate (a pooled connection may simply have been
+        # dropped by the server); later ones back off 0.3 s, 0.6 s, ...
+        for attempt in range(HTTP_RETRIES + 1):
+            if attempt == 0:
+                conn = _get_connection(parts.scheme, parts.netloc, timeout)
+            else:
+                conn = _new_connection(parts.scheme, parts.netloc, timeout)
+            try:
+                conn.request(method, target, headers=request_headers)
+                response = conn.getresponse()
+                break
+            except (http.client.HTTPException, OSError):
+                conn.close()
+                if attempt == HTTP_RETRIES:
+                    raise
+                if attempt:
+                    time.sleep(HTTP_RETRY_BACKOFF * 2 ** (attempt - 1))
+        
+        location = response.getheader('Location')
+        if response.status in (301, 302, 303, 307, 308) and location:
+            response.read()
+            _release_connection(parts.scheme, parts.netloc, conn, response)
+            url = urljoin(url, location)
+            continue
+        
+        if response.status >= 400:
+            response.read()
+            _release_connection(parts.scheme, parts.netloc, conn, response)
+            raise urllib.error.HTTPError(url, response.status, response.reason, response.headers, None)
+        
+        try:
+            yield response
+            response.read()  # drain anything unread so the connection can be reused
+        except BaseException:
+            conn.close()
+            raise
+        _release_connection(parts.scheme, parts.netloc, conn, response)
+        return
+    
+    raise urllib.error.URLError(f"Too many redirects: {url}")
 
 def check_internet():
     """Check if we have internet connectivity"""
+    # HEAD a small file on the download host itself, so the connection (and
+    # TLS session) is already open in the pool when the downloads start
     try:
-        urllib.request.urlopen('https://github.com', timeout=10)
-        return True
-    except urllib.error.URLError:
+        with open_url(f"{GITHUB_RAW}/requirements-windows.txt", method='HEAD', timeout=5):
+            return True
+    except (http.client.HTTPException, OSError):
         return False
 
 def check_python_version():
     """Check if Python version meets requirements"""
     current_version = sys.version_info[:2]
     if current_version >= PYTHON_MIN_VERSION:
-        print_success(f"Python {sys.version.split()[0]} detected")
+        print_success(f"Python {PY_VER_STR} detected")
         return True
     else:
         print_error(f"Python {PYTHON_MIN_VERSION[0]}.{PYTHON_MIN_VERSION[1]}+ required, found {current_version[0]}.{current_version[1]}")
         return False
 
-def install_pyqt6():
-    """Install PyQt6 using pip"""
+def pip_needs_upgrade():
+    """Check the installed pip version without importing or running pip"""
+    try:
+        version = importlib.metadata.version('pip')
+    except importlib.metadata.PackageNotFoundError:
+        return True
+    
+    match = re.match(r'(\d+)(?:\.(\d+))?', version)
+    if not match:
+        return True
+    return (int(match.group(1)), int(match.group(2) or 0)) < PIP_MIN_VERSION
+
+def pip_install(packages):
+    """Run one pip install for all packages"""
+    subprocess.run([*PIP_INSTALL, *packages], 
+                  check=True, capture_output=True, text=True)
+
+def install_pyqt6(optional_packages=()):
+    """Install PyQt6 (plus any accepted optional packages) using pip"""
     print_info("Installing PyQt6...")
+    if optional_packages:
+        print_info("Installing optional Windows dependencies...")
+    
+    # Install everything (and a newer pip, only if the current one is too
+    # old) in one pip run; the import check happens later in test_installation
+    packages = ['PyQt6>=6.4.0']
+    if pip_needs_upgrade():
+        packages.insert(0, f"pip>={PIP_MIN_VERSION[0]}.{PIP_MIN_VERSION[1]}")
+    
     try:
-        # Upgrade pip first
-        subprocess.run([sys.executable, '-m', 'pip', 'install', '--upgrade', 'pip'], 
-                      check=True, capture_output=True, text=True)
-        
-        # Install PyQt6
-        subprocess.run([sys.executable, '-m', 'pip', 'install', 'PyQt6>=6.4.0'], 
-                      check=True, capture_output=True, text=True)
-        
-        # Test PyQt6 import
-        subprocess.run([sys.executable, '-c', 'from PyQt6.QtWidgets import QApplication'], 
-                      check=True, capture_output=True, text=True)
-        
+        pip_install(packages + list(optional_packages))
+        if optional_packages:
+            print_success("WMI module installed for enhanced battery information")
         print_success("PyQt6 installed successfully")
         return True
     except subprocess.CalledProcessError as e:
-        print_error(f"Failed to install PyQt6: {e}")
-        if e.stderr:
-            print_error(f"Error details: {e.stderr}")
-        return False
+        if not optional_packages:
+            print_error(f"Failed to install PyQt6: {e}")
+            if e.stderr:
+                print_error(f"Error details: {e.stderr}")
+            return False
+    
+    # pip installs nothing when any requirement fails, so only on that
+    # failure path retry the required packages on their own
+    print_warning("Failed to install WMI module")
+    return install_pyqt6()
 
-def install_optional_deps():
-    """Install optional Windows dependencies"""
+def ask_optional_deps():
+    """Ask which optional Windows dependencies to install"""
     try:
         response = input("Install optional Windows enhancements (WMI for detailed battery info)? [y/N]: ")
         if response.lower() == 'y':
-            print_info("Installing optional Windows dependencies...")
-            subprocess.run([sys.executable, '-m', 'pip', 'install', 'WMI'], 
-                          check=True, capture_output=True, text=True)
-            print_success("WMI module installed for enhanced battery information")
-    except subprocess.CalledProcessError:
-        print_warning("Failed to install WMI module")
+            return ['WMI']
     except KeyboardInterrupt:
         print_warning("\nOptional dependency installation skipped")
+    return []
+
+def show_download_progress(name, done, total):
+    """Update the single-line download progress on stderr"""
+    with _progress_lock:
+        if total:
+            sys.stderr.write(f"\r\033[K  {name}: {done * 100 // total}% ({done // 1024} of {total // 1024} KiB)")
+        else:
+            sys.stderr.write("\r\033[K")
+        sys.stderr.flush()
+
+def load_etags():
+    """Load the ETags saved by the previous install"""
+    try:
+        with open(ETAGS_FILE, 'r', encoding='utf-8') as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return {}
+
+def save_etags(etags):
+    """Save the ETags of the downloaded files"""
+    try:
+        with open(ETAGS_FILE, 'w', encoding='utf-8') as f:
+            json.dump(etags, f, indent=2)
+    except OSError as e:
+        print_warning(f"Could not save download cache info: {e}")
 
-def download_file(url, destination):
+def download_file(url, destination, etags=None):
     """Download a file from URL to destination"""
+    # With an etags dict (file name -> ETag) the request is conditional: an
+    # unchanged file is left in place, and the dict is kept up to date
+    name = Path(destination).name
+    headers = {}
+    if etags is not None and etags.get(name) and os.path.exists(destination):
+        headers['If-None-Match'] = etags[name]
+    
     try:
-        with urllib.request.urlopen(url) as response:
-            with open(destination, 'wb') as f:
-                shutil.copyfileobj(response, f)
+        with open_url(url, headers=headers) as response:
+            if response.status == 304:
+                return True  # not modified since the last install
+            
+            if etags is not None:
+                etags.pop(name, None)  # forget the old ETag until the new file is complete
+            
+            # Content-Length from the same GET sizes both the file and the
+            # progress display; no separate HEAD needed
+            length = int(response.getheader('Content-Length') or 0)
+            # Preallocating means an aborted transfer leaves a full-size file of NULs
+            # behind, so remove the partial file on any failure
+            try:
+                with open(destination, 'wb') as f:
+                    if length:
+                        f.truncate(length)  # allocate the file in one go
+                    
+                    if not (length and sys.stderr.isatty()):
+                        shutil.copyfileobj(response, f, DOWNLOAD_CHUNK_SIZE)
+                    else:
+                        done = 0
+                        try:
+                            while True:
+                                chunk = response.read(DOWNLOAD_CHUNK_SIZE)
+                                if not chunk:
+                                    break
+                                f.write(chunk)
+                                done += len(chunk)
+                                show_download_progress(name, done, length)
+                        finally:
+                            show_download_progress(name, 0, 0)  # clear the line
+                    
+                    written = f.tell()
+            except BaseException:
+                with contextlib.suppress(OSError):
+                    os.remove(destination)
+                raise
+            
+            # A body that ends early must not pass for a complete download: the
+            # preallocated file would be padded with NULs and its ETag recorded
+            if length and written != length:
+                os.remove(destination)
+                print_error(f"Failed to download {url}: received {written} of {length} bytes")
+                return False
+            
+            etag = response.getheader('ETag')
+            if etags is not None and etag:
+                etags[name] = etag
         return True
-    except urllib.error.URLError as e:
+    except (http.client.HTTPException, OSError) as e:
         print_error(f"Failed to download {url}: {e}")
         return False
 
@@ -137,34 +409,47 @@ def download_battmon_files():
     
     print_info("Downloading BattMon files from GitHub...")
     
-    for filename, local_name in files_to_download:
-        url = f"{GITHUB_RAW}/{filename}"
-        destination = INSTALL_DIR / local_name
+    # The files are small and independent, so fetch them concurrently and
+    # let the round trips overlap
+    # On update runs unchanged files come back as 304 Not Modified and are kept
+    etags = load_etags()
+    success = True
+    with concurrent.futures.ThreadPoolExecutor(max_workers=len(files_to_download)) as executor:
+        futures = {
+            executor.submit(download_file, f"{GITHUB_RAW}/{filename}", INSTALL_DIR / local_name, etags): filename
+            for filename, local_name in files_to_download
+        }
         
-        if download_file(url, destination):
-            print_success(f"Downloaded {filename}")
-        else:
-            if filename == 'battmon.py':
+        for future in concurrent.futures.as_completed(futures):
+            filename = futures[future]
+            if future.result():
+                print_success(f"Downloaded {filename}")
+            elif filename == 'battmon.py':
                 print_error(f"Failed to download required file: {filename}")
-                return False
+                success = False
             else:
                 print_warning(f"Failed to download optional file: {filename}")
     
-    return True
+    save_etags(etags)
+    return success
 
 def create_launcher_scripts():
     """Create launcher scripts for BattMon"""
     print_info("Creating launcher scripts...")
     
-    # Create batch launcher
-    batch_launcher = INSTALL_DIR / 'battmon.bat'
+    exe = sys.executable
+    install_dir = str(INSTALL_DIR)
+    battmon_py = str(BATTMON_PY)
+    
+    # Create batch launcher. Both files are written in one call with the
+    # CRLF line endings text mode would have produced on Windows.
+    batch_launcher = BATTMON_BAT
     batch_content = f'''@echo off
-cd /d "{INSTALL_DIR}"
-"{sys.executable}" "{INSTALL_DIR / 'battmon.py'}" %*
+cd /d "{install_dir}"
+"{exe}" "{battmon_py}" %*
 '''
     
-    with open(batch_launcher, 'w', encoding='utf-8') as f:
-        f.write(batch_content)
+    batch_launcher.write_bytes(batch_content.replace('\n', '\r\n').encode('utf-8'))
     
     print_success(f"Created batch launcher: {batch_launcher}")
     
@@ -176,17 +461,71 @@ import os
 import sys
 import subprocess
 
-os.chdir(r"{INSTALL_DIR}")
-subprocess.run([sys.executable, r"{INSTALL_DIR / 'battmon.py'}"] + sys.argv[1:])
+os.chdir(r"{install_dir}")
+subprocess.run([sys.executable, r"{battmon_py}"] + sys.argv[1:])
 '''
     
-    with open(py_launcher, 'w', encoding='utf-8') as f:
-        f.write(py_content)
+    py_launcher.write_bytes(py_content.replace('\n', '\r\n').encode('utf-8'))
     
     print_success(f"Created Python launcher: {py_launcher}")
     
     return batch_launcher
 
+# MS-SHLLINK constants for write_shortcut
+LNK_CLSID = uuid.UUID('00021401-0000-0000-c000-000000000046').bytes_le
+LNK_HAS_LINK_INFO = 0x02
+LNK_HAS_NAME = 0x04
+LNK_HAS_WORKING_DIR = 0x10
+LNK_HAS_ARGUMENTS = 0x20
+LNK_HAS_ICON_LOCATION = 0x40
+LNK_IS_UNICODE = 0x80
+LNK_FILE_ATTRIBUTE_NORMAL = 0x80
+LNK_SW_SHOWNORMAL = 1
+LNK_DRIVE_FIXED = 3
+
+def _lnk_string(value):
+    """Encode a StringData entry: character count + UTF-16LE text"""
+    data = value.encode('utf-16-le')
+    return struct.pack('<H', len(data) // 2) + data
+
+def write_shortcut(path, target, arguments, working_dir, description, icon_path, icon_index=0):
+    """Write a Windows .lnk file directly (MS-SHLLINK), without COM or PowerShell"""
+    flags = (LNK_HAS_LINK_INFO | LNK_HAS_NAME | LNK_HAS_WORKING_DIR |
+             LNK_HAS_ARGUMENTS | LNK_HAS_ICON_LOCATION | LNK_IS_UNICODE)
+    
+    # ShellLinkHeader (76 bytes)
+    header = struct.pack('<I16sII8s8s8sIiIHHII',
+                         0x4C, LNK_CLSID, flags, LNK_FILE_ATTRIBUTE_NORMAL,
+                         b'\0' * 8, b'\0' * 8, b'\0' * 8,
+                         0, icon_index, LNK_SW_SHOWNORMAL, 0, 0, 0, 0)
+    
+    # LinkInfo: a VolumeID for a fixed drive and the target as the local
+    # base path, in both ANSI and Unicode form (header size 0x24)
+    volume_id = struct.pack('<IIII', 17, LNK_DRIVE_FIXED, 0, 0x10) + b'\0'
+    base_path = target.encode('mbcs' if os.name == 'nt' else 'utf-8', 'replace') + b'\0'
+    base_path_unicode = (target + '\0').encode('utf-16-le')
+    
+    header_size = 0x24
+    volume_id_offset = header_size
+    base_path_offset = volume_id_offset + len(volume_id)
+    suffix_offset = base_path_offset + len(base_path)
+    base_path_unicode_offset = suffix_offset + 1
+    suffix_unicode_offset = base_path_unicode_offset + len(base_path_unicode)
+    link_info_size = suffix_unicode_offset + 2
+    
+    link_info = struct.pack('<IIIIIIIII',
+                            link_info_size, header_size, 0x1,  # VolumeIDAndLocalBasePath
+                            volume_id_offset, base_path_offset, 0, suffix_offset,
+                            base_path_unicode_offset, suffix_unicode_offset)
+    link_info += volume_id + base_path + b'\0' + base_path_unicode + b'\0\0'
+    
+    # StringData in the order the format requires, then the terminal block
+    string_data = b''.join(_lnk_string(value) for value in
+                           (description, working_dir, arguments, icon_path))
+    
+    with open(path, 'wb') as f:
+        f.write(header + link_info + string_data + struct.pack('<I', 0))
+
 def create_start_menu_shortcut():
     """Create Start Menu shortcut"""
     print_info("Creating Start Menu shortcut...")
@@ -195,13 +534,13 @@ def create_start_menu_shortcut():
         import win32com.client
         
         shell = win32com.client.Dispatch("WScript.Shell")
-        shortcut_path = START_MENU_DIR / "BattMon Cross-Platform.lnk"
+        shortcut_path = SHORTCUT_PATH
         shortcut = shell.CreateShortCut(str(shortcut_path))
         shortcut.Targetpath = sys.executable
-        shortcut.Arguments = f'"{INSTALL_DIR / "battmon.py"}"'
+        shortcut.Arguments = f'"{BATTMON_PY}"'
         shortcut.WorkingDirectory = str(INSTALL_DIR)
         shortcut.Description = "BattMon Cross-Platform - Battery Monitor"
-        shortcut.IconLocation = f"{os.environ['SystemRoot']}\\System32\\batmeter.dll,0"
+        shortcut.IconLocation = f"{SYSTEM_ROOT}\\System32\\batmeter.dll,0"
         shortcut.save()
         
         print_success(f"Created Start Menu shortcut: {shortcut_path}")
@@ -210,27 +549,30 @@ def create_start_menu_shortcut():
     except ImportError:
         print_warning("win32com not available, creating shortcut manually...")
         
-        # Alternative method without win32com
+        # Alternative method without win32com: write the .lnk file ourselves
         try:
-            import subprocess
-            powershell_cmd = f'''
-$shell = New-Object -ComObject WScript.Shell
-$shortcut = $shell.CreateShortcut("{START_MENU_DIR / "BattMon Cross-Platform.lnk"}")
-$shortcut.TargetPath = "{sys.executable}"
-$shortcut.Arguments = '"{INSTALL_DIR / "battmon.py"}"'
-$shortcut.WorkingDirectory = "{INSTALL_DIR}"
-$shortcut.Description = "BattMon Cross-Platform - Battery Monitor"
-$shortcut.IconLocation = "$env:SystemRoot\\System32\\batmeter.dll,0"
-$shortcut.Save()
-'''
-            subprocess.run(['powershell', '-Command', powershell_cmd], 
-                          check=True, capture_output=True, text=True)
-            print_success("Created Start Menu shortcut via PowerShell")
+            write_shortcut(SHORTCUT_PATH, sys.executable, f'"{BATTMON_PY}"', str(INSTALL_DIR),
+                           "BattMon Cross-Platform - Battery Monitor",
+                           f"{SYSTEM_ROOT}\\System32\\batmeter.dll")
+            print_success(f"Created Start Menu shortcut: {SHORTCUT_PATH}")
             return True
-        except subprocess.CalledProcessError:
-            print_warning("Failed to create Start Menu shortcut")
+        except OSError as e:
+            print_warning(f"Failed to create Start Menu shortcut: {e}")
             return False
 
+def broadcast_environment_change():
+    """Tell Explorer the user environment changed, so new shells see the new PATH"""
+    try:
+        import ctypes
+        HWND_BROADCAST = 0xFFFF
+        WM_SETTINGCHANGE = 0x001A
+        SMTO_ABORTIFHUNG = 0x0002
+        result = ctypes.c_ulong()
+        ctypes.windll.user32.SendMessageTimeoutW(HWND_BROADCAST, WM_SETTINGCHANGE, 0, 'Environment',
+                                                 SMTO_ABORTIFHUNG, 5000, ctypes.byref(result))
+    except Exception:
+        pass
+
 def add_to_path():
     """Add BattMon directory to user PATH"""
     try:
@@ -238,22 +580,24 @@ def add_to_path():
         if response.lower() == 'y':
             try:
                 # Read current user PATH
-                key = winreg.OpenKey(winreg.HKEY_CURRENT_USER, 'Environment', 0, winreg.KEY_READ | winreg.KEY_WRITE)
-                try:
-                    current_path, _ = winreg.QueryValueEx(key, 'Path')
-                except FileNotFoundError:
-                    current_path = ''
-                
-                install_dir_str = str(INSTALL_DIR)
-                if install_dir_str not in current_path:
-                    new_path = f"{current_path};{install_dir_str}" if current_path else install_dir_str
-                    winreg.SetValueEx(key, 'Path', 0, winreg.REG_EXPAND_SZ, new_path)
-                    print_success(f"Added {install_dir_str} to user PATH")
-                    print_warning("Restart your command prompt/PowerShell to use 'battmon.bat' command")
-                else:
-                    print_info(f"{install_dir_str} already in PATH")
-                
-                winreg.CloseKey(key)
+                with winreg.OpenKey(winreg.HKEY_CURRENT_USER, 'Environment', 0, winreg.KEY_READ | winreg.KEY_WRITE) as key:
+                    try:
+                        current_path, value_type = winreg.QueryValueEx(key, 'Path')
+                    except FileNotFoundError:
+                        current_path, value_type = '', winreg.REG_EXPAND_SZ
+                    
+                    # Compare whole entries, case-insensitively like Windows does
+                    install_dir_str = str(INSTALL_DIR)
+                    entries = [entry.rstrip('\\').lower() for entry in current_path.split(';')]
+                    if install_dir_str.rstrip('\\').lower() not in entries:
+                        new_path = f"{current_path.rstrip(';')};{install_dir_str}" if current_path else install_dir_str
+                        # Keep the existing value type so REG_SZ entries aren't turned into expandable ones
+                        winreg.SetValueEx(key, 'Path', 0, value_type, new_path)
+                        broadcast_environment_change()
+                        print_success(f"Added {install_dir_str} to user PATH")
+                        print_warning("Open a new command prompt/PowerShell to use 'battmon.bat' command")
+                    else:
+                        print_info(f"{install_dir_str} already in PATH")
                 
             except Exception as e:
                 print_warning(f"Failed to add to PATH: {e}")
@@ -266,25 +610,27 @@ def test_installation():
     print_info("Testing BattMon installation...")
     
     try:
-        battmon_path = INSTALL_DIR / 'battmon.py'
+        battmon_path = BATTMON_PY
         if not battmon_path.exists():
             print_error("battmon.py not found")
             return False
         
-        # Test PyQt6 import
-        result = subprocess.run([
-            sys.executable, '-c', 
-            'from PyQt6.QtWidgets import QApplication; print("Dependencies verified")'
-        ], capture_output=True, text=True)
+        # Test PyQt6 import in this process. pip ran after startup, so refresh
+        # the import caches and pick up a user site directory it may have created
+        importlib.invalidate_caches()
+        user_site = site.getusersitepackages()
+        if site.ENABLE_USER_SITE and os.path.isdir(user_site) and user_site not in sys.path:
+            site.addsitedir(user_site)
         
-        if result.returncode == 0:
-            print_success("BattMon installation verified")
-            return True
-        else:
+        try:
+            from PyQt6.QtWidgets import QApplication
+        except ImportError as e:
             print_error("PyQt6 import test failed")
-            if result.stderr:
-                print_error(f"Error: {result.stderr}")
+            print_error(f"Error: {e}")
             return False
+        
+        print_success("BattMon installation verified")
+        return True
             
     except Exception as e:
         print_error(f"Installation test failed: {e}")
@@ -292,50 +638,54 @@ def test_installation():
 
 def show_completion_message():
     """Show installation completion message"""
-    print()
-    print("━" * 80)
-    print_success("BattMon Cross-Platform has been installed successfully!")
-    print("━" * 80)
-    print()
-    print_info(f"📍 Installation Location: {INSTALL_DIR}")
-    print_info(f"🐍 Python Version: {sys.version.split()[0]}")
-    print()
-    print_header("🚀 How to run BattMon:")
-    print("  1. Start Menu: Search for 'BattMon Cross-Platform'")
-    print(f"  2. Command Prompt: python \"{INSTALL_DIR / 'battmon.py'}\"")
-    print(f"  3. Batch file: \"{INSTALL_DIR / 'battmon.bat'}\"")
-    print(f"  4. Double-click: {INSTALL_DIR / 'battmon.py'}")
-    print()
-    print_header("✨ Features:")
-    print("  • System tray battery monitoring with percentage display")
-    print("  • Color-coded battery levels and charging indicators")
-    print("  • Desktop notifications for battery milestones")
-    print("  • Detailed battery health information")
-    print("  • Cross-platform compatibility (Windows, Linux, macOS)")
-    print()
-    print_header("🎯 Usage:")
-    print("  • Left-click tray icon: Show detailed battery window")
-    print("  • Right-click tray icon: Context menu with options")
-    print("  • System tray icon shows real-time battery percentage")
-    print()
-    print_warning("🔄 To update BattMon, simply re-run this installer")
-    print("━" * 80)
+    print_block([
+        "",
+        BANNER,
+        format_success("BattMon Cross-Platform has been installed successfully!"),
+        BANNER,
+        "",
+        format_info(f"📍 Installation Location: {INSTALL_DIR}"),
+        format_info(f"🐍 Python Version: {PY_VER_STR}"),
+        "",
+        format_header("🚀 How to run BattMon:"),
+        "  1. Start Menu: Search for 'BattMon Cross-Platform'",
+        f"  2. Command Prompt: python \"{BATTMON_PY}\"",
+        f"  3. Batch file: \"{BATTMON_BAT}\"",
+        f"  4. Double-click: {BATTMON_PY}",
+        "",
+        format_header("✨ Features:"),
+        "  • System tray battery monitoring with percentage display",
+        "  • Color-coded battery levels and charging indicators",
+        "  • Desktop notifications for battery milestones",
+        "  • Detailed battery health information",
+        "  • Cross-platform compatibility (Windows, Linux, macOS)",
+        "",
+        format_header("🎯 Usage:"),
+        "  • Left-click tray icon: Show detailed battery window",
+        "  • Right-click tray icon: Context menu with options",
+        "  • System tray icon shows real-time battery percentage",
+        "",
+        format_warning("🔄 To update BattMon, simply re-run this installer"),
+        BANNER,
+    ])
 
 def main():
     """Main installation function"""
     Colors.init_windows_colors()
     
-    print("━" * 80)
-    print_header("🔋 BattMon Cross-Platform Windows Installer (Python)")
-    print("━" * 80)
-    print()
-    print("This installer will:")
-    print("  • Verify Python 3.8+ installation")
-    print("  • Install PyQt6 and dependencies")
-    print("  • Download BattMon files from GitHub")
-    print("  • Create launcher scripts and Start Menu shortcut")
-    print("  • Configure system integration")
-    print()
+    print_block([
+        BANNER,
+        format_header("🔋 BattMon Cross-Platform Windows Installer (Python)"),
+        BANNER,
+        "",
+        "This installer will:",
+        "  • Verify Python 3.8+ installation",
+        "  • Install PyQt6 and dependencies",
+        "  • Download BattMon files from GitHub",
+        "  • Create launcher scripts and Start Menu shortcut",
+        "  • Configure system integration",
+        "",
+    ])
     
     try:
         # Check Python version
@@ -351,13 +701,13 @@ def main():
             return 1
         print_success("Internet connection verified")
         
+        # Ask about optional dependencies so they go into the same pip run
+        optional_packages = ask_optional_deps()
+        
         # Install PyQt6
-        if not install_pyqt6():
+        if not install_pyqt6(optional_packages):
             return 1
         
-        # Install optional dependencies
-        install_optional_deps()
-        
         # Download BattMon files
         if not download_battmon_files():
             return 1
@@ -383,8 +733,8 @@ def main():
             run_now = input("\nWould you like to start BattMon now? [y/N]: ")
             if run_now.lower() == 'y':
                 print_info("Starting BattMon...")
-                subprocess.Popen([sys.executable, str(INSTALL_DIR / 'battmon.py')], 
-                               cwd=str(INSTALL_DIR))
+                # Hand off to the shell; the launcher already changes to INSTALL_DIR
+                os.startfile(str(BATTMON_BAT))
         except KeyboardInterrupt:
             print_warning("\nStartup skipped")
         
@@ -15,15 +15,19 @@ the Free Software Foundation; either version 2 of the License, or
 
 import sys
 import os
+import copy
 import json
 import platform
+import functools
+import re
+from types import MappingProxyType
 
 try:
     from PyQt6.QtWidgets import (QApplication, QDialog, QVBoxLayout, QHBoxLayout, 
                                  QLabel, QPushButton, QLineEdit, QCheckBox, 
                                  QSpinBox, QGroupBox, QFormLayout, QScrollArea,
-                                 QWidget, QMessageBox, QFrame, QTextEdit)
-    from PyQt6.QtCore import Qt, QSize
+                                 QWidget, QMessageBox)
+    from PyQt6.QtCore import Qt, QSize, QThreadPool, pyqtSignal
     from PyQt6.QtGui import QIcon, QFont, QPixmap, QPainter, QColor, QBrush
     QT6_AVAILABLE = True
 except ImportError:
@@ -34,20 +38,246 @@ except ImportError:
         print("  sudo apt install python3-pyqt6")
     sys.exit(1)
 
+# Optional faster JSON backend; the stdlib json module is the fallback
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
 VERSION = '0.5.12'
 CURRENT_OS = platform.system()
 IS_WINDOWS = CURRENT_OS == "Windows"
 
+# Read-only info lines shown in the Advanced Settings group
+_VERSION_LINE = f"BattMon Version: {VERSION}"
+_PLATFORM_LINE = f"Platform: {CURRENT_OS}"
+
+# Default profile, frozen once; get_default_profile() hands out copies
+_DEFAULT_MILESTONES = (90, 80, 70, 60, 50, 40, 30, 20, 10)
+_DEFAULT_CHARGING = (25, 50, 75, 90, 100)
+_DEFAULT_PROFILE = MappingProxyType({
+    'notifications_enabled': True,
+    'notification_timeout': 5000,
+    'play_sound': True,
+    'sleep_notifications_enabled': True,
+    'sleep_threshold': 300,
+    'version': VERSION
+})
+
+# Parsed profiles keyed by path: (st_mtime_ns, profile dict)
+_PROFILE_CACHE = {}
+
+def _loads(data):
+    """Parse profile JSON from bytes"""
+    if ORJSON_AVAILABLE:
+        return orjson.loads(data)
+    return json.loads(data)
+
+def _dumps(data):
+    """Serialize profile data to indented JSON bytes"""
+    if ORJSON_AVAILABLE:
+        return orjson.dumps(data, option=orjson.OPT_INDENT_2)
+    return json.dumps(data, indent=2).encode('utf-8')
+
+# A comma-separated entry that is a plain integer from 0 to 100 (leading zeros allowed)
+_THRESHOLD_RE = re.compile(r'(?:^|,)\s*0*(100|\d{1,2})\s*(?=,|$)')
+
+def _parse_thresholds(text):
+    """Parse comma-separated percentages into a descending, deduplicated list"""
+    # The regex engine does the scan and the 0-100 range check in one pass
+    return sorted({int(match) for match in _THRESHOLD_RE.findall(text)}, reverse=True)
+
+# Dark theme for the editor dialog, shared by every instance
+PROFILE_EDITOR_QSS = """
+    QDialog {
+        background-color: #2b2b2b;
+        color: #e0e0e0;
+        font-family: 'Segoe UI', Arial, sans-serif;
+        font-size: 14px;
+    }
+    QGroupBox {
+        font-weight: bold;
+        font-size: 16px;
+        border: 2px solid #555555;
+        border-radius: 8px;
+        margin-top: 10px;
+        padding-top: 10px;
+        background-color: #363636;
+    }
+    QGroupBox::title {
+        subcontrol-origin: margin;
+        left: 10px;
+        padding: 0 5px 0 5px;
+        color: #ffffff;
+        background-color: #363636;
+    }
+    QLabel {
+        color: #e0e0e0;
+        font-size: 14px;
+    }
+    QLineEdit, QSpinBox, QTextEdit {
+        background-color: #404040;
+        color: #ffffff;
+        border: 2px solid #606060;
+        border-radius: 6px;
+        padding: 8px;
+        font-size: 14px;
+        min-height: 20px;
+    }
+    QLineEdit:focus, QSpinBox:focus, QTextEdit:focus {
+        border-color: #0078d4;
+        background-color: #454545;
+    }
+    QCheckBox {
+        color: #e0e0e0;
+        font-size: 14px;
+        spacing: 8px;
+    }
+    QCheckBox::indicator {
+        width: 20px;
+        height: 20px;
+        border-radius: 4px;
+        border: 2px solid #606060;
+        background-color: #404040;
+    }
+    QCheckBox::indicator:checked {
+        background-color: #0078d4;
+        border-color: #0078d4;
+    }
+    QCheckBox::indicator:checked:hover {
+        background-color: #106ebe;
+    }
+    QPushButton {
+        background-color: #0078d4;
+        color: #ffffff;
+        border: none;
+        border-radius: 6px;
+        padding: 12px 24px;
+        font-weight: bold;
+        font-size: 14px;
+        min-height: 20px;
+    }
+    QPushButton:hover {
+        background-color: #106ebe;
+    }
+    QPushButton:pressed {
+        background-color: #005a9e;
+    }
+    QPushButton:disabled {
+        background-color: #555555;
+        color: #888888;
+    }
+    QScrollArea {
+        border: 1px solid #555555;
+        border-radius: 8px;
+        background-color: #2b2b2b;
+    }
+    QFrame {
+        border: none;
+    }
+    QLabel#title {
+        color: #ffffff;
+        margin-bottom: 10px;
+    }
+    QLabel#profilePath {
+        color: #b0b0b0;
+        font-size: 12px;
+        margin-bottom: 15px;
+    }
+    QLabel#sectionLabel {
+        font-size: 14px;
+        font-weight: bold;
+        color: #ffffff;
+        margin-bottom: 5px;
+    }
+    QLabel#helpLabel {
+        font-size: 12px;
+        color: #b0b0b0;
+        margin-bottom: 8px;
+    }
+    QLabel#infoLabel {
+        color: #b0b0b0;
+        font-size: 12px;
+    }
+    QLabel#status {
+        color: #888888;
+        font-size: 12px;
+        margin-top: 5px;
+    }
+    QPushButton#resetButton {
+        background-color: #d83b01;
+        color: white;
+    }
+    QPushButton#cancelButton {
+        background-color: #666666;
+        color: white;
+    }
+"""
+
+@functools.lru_cache(maxsize=1)
+def _settings_icon():
+    """Create the settings icon for the window (once; needs a QApplication)"""
+    try:
+        # Create a simple settings icon
+        pixmap = QPixmap(32, 32)
+        pixmap.fill(Qt.GlobalColor.transparent)
+        
+        painter = QPainter(pixmap)
+        painter.setRenderHint(QPainter.RenderHint.Antialiasing)
+        
+        # Draw gear icon
+        painter.setBrush(QBrush(QColor("#0078d4")))
+        painter.drawEllipse(8, 8, 16, 16)
+        
+        # Draw inner circle
+        painter.setBrush(QBrush(QColor("#ffffff")))
+        painter.drawEllipse(12, 12, 8, 8)
+        
+        painter.end()
+        
+        return QIcon(pixmap)
+    except:
+        return QIcon()  # Return empty icon on failure
+
+@functools.lru_cache(maxsize=4)
+def _title_font(point_size, bold):
+    """Build a title font once per (size, weight) and share it"""
+    font = QFont()
+    font.setPointSize(point_size)
+    font.setBold(bold)
+    return font
+
+@functools.lru_cache(maxsize=1)
+def _default_profile_path():
+    """Resolve the default profile path based on OS (once per process)"""
+    if IS_WINDOWS:
+        config_base = os.environ.get('APPDATA', os.path.expanduser('~'))
+        config_dir = os.path.join(config_base, 'BattMon')
+    else:
+        config_base = os.environ.get('XDG_CONFIG_HOME', os.path.expanduser('~/.config'))
+        config_dir = os.path.join(config_base, 'battmon')
+    
+    return os.path.join(config_dir, 'profile.json')
+
 class ProfileEditor(QDialog):
     """Profile Editor GUI for BattMon settings"""
     
+    # Emitted from the loader thread with (profile data, status text)
+    profile_loaded = pyqtSignal(object, str)
+    
     def __init__(self, parent=None, profile_path=None):
         super().__init__(parent)
-        self.profile_path = profile_path or self.get_default_profile_path()
-        self.profile_data = {}
+        self.profile_path = profile_path or _default_profile_path()
+        self.profile_data = self.get_default_profile()
+        self._threshold_text = {}  # key -> (last threshold list, joined text)
         
+        # Show the dialog with defaults right away and read the file off the GUI thread
         self.init_ui()
-        self.load_profile()
+        self.update_ui_from_profile()
+        self.status_label.setText("⏳ Loading profile...")
+        self.profile_loaded.connect(self.apply_profile)
+        QThreadPool.globalInstance().start(self.load_profile_in_background)
         
     def init_ui(self):
         """Initialize the user interface"""
@@ -55,98 +285,14 @@ class ProfileEditor(QDialog):
         self.setMinimumSize(QSize(600, 700))
         self.resize(QSize(650, 750))
         
+        # Hold off repaints until the whole widget tree is built
+        self.setUpdatesEnabled(False)
+        
         # Set window icon (create a simple settings icon)
-        self.setWindowIcon(self.create_settings_icon())
+        self.setWindowIcon(_settings_icon())
         
         # Apply dark theme styling
-        self.setStyleSheet("""
-            QDialog {
-                background-color: #2b2b2b;
-                color: #e0e0e0;
-                font-family: 'Segoe UI', Arial, sans-serif;
-                font-size: 14px;
-            }
-            QGroupBox {
-                font-weight: bold;
-                font-size: 16px;
-                border: 2px solid #555555;
-                border-radius: 8px;
-                margin-top: 10px;
-                padding-top: 10px;
-                background-color: #363636;
-            }
-            QGroupBox::title {
-                subcontrol-origin: margin;
-                left: 10px;
-                padding: 0 5px 0 5px;
-                color: #ffffff;
-                background-color: #363636;
-            }
-            QLabel {
-                color: #e0e0e0;
-                font-size: 14px;
-            }
-            QLineEdit, QSpinBox, QTextEdit {
-                background-color: #404040;
-                color: #ffffff;
-                border: 2px solid #606060;
-                border-radius: 6px;
-                padding: 8px;
-                font-size: 14px;
-                min-height: 20px;
-            }
-            QLineEdit:focus, QSpinBox:focus, QTextEdit:focus {
-                border-color: #0078d4;
-                background-color: #454545;
-            }
-            QCheckBox {
-                color: #e0e0e0;
-                font-size: 14px;
-                spacing: 8px;
-            }
-            QCheckBox::indicator {
-                width: 20px;
-                height: 20px;
-                border-radius: 4px;
-                border: 2px solid #606060;
-                background-color: #404040;
-            }
-            QCheckBox::indicator:checked {
-                background-color: #0078d4;
-                border-color: #0078d4;
-            }
-            QCheckBox::indicator:checked:hover {
-                background-color: #106ebe;
-            }
-            QPushButton {
-                background-color: #0078d4;
-                color: #ffffff;
-                border: none;
-                border-radius: 6px;
-                padding: 12px 24px;
-                font-weight: bold;
-                font-size: 14px;
-                min-height: 20px;
-            }
-            QPushButton:hover {
-                background-color: #106ebe;
-            }
-            QPushButton:pressed {
-                background-color: #005a9e;
-            }
-            QPushButton:disabled {
-                background-color: #555555;
-                color: #888888;
-            }
-            QScrollArea {
-                border: 1px solid #555555;
-                border-radius: 8px;
-                background-color: #2b2b2b;
-            }
-            QFrame {
-                border: none;
-            }
-        """)
+        self.setStyleSheet(PROFILE_EDITOR_QSS)
         
         # Create main layout
         main_layout = QVBoxLayout()
@@ -155,17 +301,14 @@ class ProfileEditor(QDialog):
         
         # Title label
         title_label = QLabel("🔧 BattMon Profile Editor")
-        title_font = QFont()
-        title_font.setPointSize(18)
-        title_font.setBold(True)
-        title_label.setFont(title_font)
+        title_label.setFont(_title_font(18, True))
         title_label.setAlignment(Qt.AlignmentFlag.AlignCenter)
-        title_label.setStyleSheet("color: #ffffff; margin-bottom: 10px;")
+        title_label.setObjectName("title")
         main_layout.addWidget(title_label)
         
         # Profile path info
         path_label = QLabel(f"📁 Profile Path: {self.profile_path}")
-        path_label.setStyleSheet("color: #b0b0b0; font-size: 12px; margin-bottom: 15px;")
+        path_label.setObjectName("profilePath")
         path_label.setWordWrap(True)
         main_layout.addWidget(path_label)
         
@@ -173,6 +316,7 @@ class ProfileEditor(QDialog):
         scroll_area = QScrollArea()
         scroll_widget = QWidget()
         scroll_layout = QVBoxLayout(scroll_widget)
+        scroll_widget.setUpdatesEnabled(False)
         
         # Notification Settings Group
         self.create_notification_settings_group(scroll_layout)
@@ -182,6 +326,7 @@ class ProfileEditor(QDialog):
         
         # Advanced Settings Group
         self.create_advanced_settings_group(scroll_layout)
+        scroll_widget.setUpdatesEnabled(True)
         
         scroll_area.setWidget(scroll_widget)
         scroll_area.setWidgetResizable(True)
@@ -194,7 +339,7 @@ class ProfileEditor(QDialog):
         # Reset to defaults button
         reset_button = QPushButton("🔄 Reset to Defaults")
         reset_button.clicked.connect(self.reset_to_defaults)
-        reset_button.setStyleSheet("background-color: #d83b01; color: white;")
+        reset_button.setObjectName("resetButton")
         reset_button.setToolTip("Reset all settings to default values")
         button_layout.addWidget(reset_button)
         
@@ -203,7 +348,7 @@ class ProfileEditor(QDialog):
         # Cancel button
         cancel_button = QPushButton("Cancel")
         cancel_button.clicked.connect(self.reject)
-        cancel_button.setStyleSheet("background-color: #666666; color: white;")
+        cancel_button.setObjectName("cancelButton")
         button_layout.addWidget(cancel_button)
         
         # Save button
@@ -216,10 +361,11 @@ class ProfileEditor(QDialog):
         
         # Status label
         self.status_label = QLabel("")
-        self.status_label.setStyleSheet("color: #888888; font-size: 12px; margin-top: 5px;")
+        self.status_label.setObjectName("status")
         main_layout.addWidget(self.status_label)
         
         self.setLayout(main_layout)
+        self.setUpdatesEnabled(True)
         
     def create_notification_settings_group(self, parent_layout):
         """Create notification settings group"""
@@ -269,11 +415,11 @@ class ProfileEditor(QDialog):
         
         # Discharge thresholds
         discharge_label = QLabel("📉 <b>Discharge Alert Levels:</b>")
-        discharge_label.setStyleSheet("font-size: 14px; font-weight: bold; color: #ffffff; margin-bottom: 5px;")
+        discharge_label.setObjectName("sectionLabel")
         layout.addWidget(discharge_label)
         
         discharge_help = QLabel("Comma-separated percentage values (e.g., 90, 80, 70, 60, 50, 40, 30, 20, 10)")
-        discharge_help.setStyleSheet("font-size: 12px; color: #b0b0b0; margin-bottom: 8px;")
+        discharge_help.setObjectName("helpLabel")
         layout.addWidget(discharge_help)
         
         self.milestone_thresholds = QLineEdit()
@@ -286,11 +432,11 @@ class ProfileEditor(QDialog):
         
         # Charging thresholds
         charging_label = QLabel("📈 <b>Charging Alert Levels:</b>")
-        charging_label.setStyleSheet("font-size: 14px; font-weight: bold; color: #ffffff; margin-bottom: 5px;")
+        charging_label.setObjectName("sectionLabel")
         layout.addWidget(charging_label)
         
         charging_help = QLabel("Comma-separated percentage values (e.g., 25, 50, 75, 90, 100)")
-        charging_help.setStyleSheet("font-size: 12px; color: #b0b0b0; margin-bottom: 8px;")
+        charging_help.setObjectName("helpLabel")
         layout.addWidget(charging_help)
         
         self.charging_milestones = QLineEdit()
@@ -308,132 +454,124 @@ class ProfileEditor(QDialog):
         layout.setSpacing(12)
         
         # Version info (read-only)
-        version_label = QLabel(f"BattMon Version: {VERSION}")
-        version_label.setStyleSheet("color: #b0b0b0; font-size: 12px;")
+        version_label = QLabel(_VERSION_LINE)
+        version_label.setObjectName("infoLabel")
         layout.addRow("", version_label)
         
         # Platform info (read-only)
-        platform_label = QLabel(f"Platform: {CURRENT_OS}")
-        platform_label.setStyleSheet("color: #b0b0b0; font-size: 12px;")
+        platform_label = QLabel(_PLATFORM_LINE)
+        platform_label.setObjectName("infoLabel")
         layout.addRow("", platform_label)
         
         group.setLayout(layout)
         parent_layout.addWidget(group)
         
-    def create_settings_icon(self):
-        """Create a settings icon for the window"""
-        try:
-            # Create a simple settings icon
-            pixmap = QPixmap(32, 32)
-            pixmap.fill(Qt.GlobalColor.transparent)
-            
-            painter = QPainter(pixmap)
-            painter.setRenderHint(QPainter.RenderHint.Antialiasing)
-            
-            # Draw gear icon
-            painter.setBrush(QBrush(QColor("#0078d4")))
-            painter.drawEllipse(8, 8, 16, 16)
-            
-            # Draw inner circle
-            painter.setBrush(QBrush(QColor("#ffffff")))
-            painter.drawEllipse(12, 12, 8, 8)
-            
-            painter.end()
-            
-            return QIcon(pixmap)
-        except:
-            return QIcon()  # Return empty icon on failure
-    
     def get_default_profile_path(self):
         """Get the default profile path based on OS"""
-        if IS_WINDOWS:
-            config_base = os.environ.get('APPDATA', os.path.expanduser('~'))
-            config_dir = os.path.join(config_base, 'BattMon')
-        else:
-            config_base = os.environ.get('XDG_CONFIG_HOME', os.path.expanduser('~/.config'))
-            config_dir = os.path.join(config_base, 'battmon')
-        
-        return os.path.join(config_dir, 'profile.json')
+        return _default_profile_path()
     
     def get_default_profile(self):
         """Get default profile settings"""
         return {
-            'milestone_thresholds': [90, 80, 70, 60, 50, 40, 30, 20, 10],
-            'charging_milestones': [25, 50, 75, 90, 100],
-            'notifications_enabled': True,
-            'notification_timeout': 5000,
-            'play_sound': True,
-            'sleep_notifications_enabled': True,
-            'sleep_threshold': 300,
-            'version': VERSION
+            'milestone_thresholds': list(_DEFAULT_MILESTONES),
+            'charging_milestones': list(_DEFAULT_CHARGING),
+            **_DEFAULT_PROFILE
         }
     
+    def load_profile_in_background(self):
+        """Read the profile on a pool thread and hand it to the GUI thread"""
+        result = self.read_profile()
+        try:
+            self.profile_loaded.emit(*result)
+        except RuntimeError:
+            pass  # Dialog was closed before the profile finished loading
+    
+    def apply_profile(self, profile_data, status):
+        """Show loaded profile data in the UI"""
+        self.profile_data = profile_data
+        self.status_label.setText(status)
+        self.update_ui_from_profile()
+    
     def load_profile(self):
         """Load profile from file"""
+        self.apply_profile(*self.read_profile())
+    
+    def read_profile(self):
+        """Read the profile file, returning (profile data, status text)"""
         try:
             if os.path.exists(self.profile_path):
-                with open(self.profile_path, 'r', encoding='utf-8') as f:
-                    self.profile_data = json.load(f)
-                self.status_label.setText(f"✅ Profile loaded from: {os.path.basename(self.profile_path)}")
-            else:
-                self.profile_data = self.get_default_profile()
-                self.status_label.setText("📄 Using default profile (file will be created on save)")
+                mtime = os.stat(self.profile_path).st_mtime_ns
+                cached = _PROFILE_CACHE.get(self.profile_path)
+                if cached is None or cached[0] != mtime:
+                    with open(self.profile_path, 'rb') as f:
+                        cached = (mtime, _loads(f.read()))
+                    _PROFILE_CACHE[self.profile_path] = cached
+                # Copy so edits in the dialog never leak into the cache
+                return (copy.deepcopy(cached[1]),
+                        f"✅ Profile loaded from: {os.path.basename(self.profile_path)}")
             
-            self.update_ui_from_profile()
+            return (self.get_default_profile(),
+                    "📄 Using default profile (file will be created on save)")
             
         except Exception as e:
-            self.status_label.setText(f"❌ Error loading profile: {str(e)}")
-            self.profile_data = self.get_default_profile()
-            self.update_ui_from_profile()
+            return self.get_default_profile(), f"❌ Error loading profile: {str(e)}"
     
     def update_ui_from_profile(self):
         """Update UI elements from loaded profile data"""
+        # Fill any missing keys from the frozen defaults in one merge
+        profile = {'milestone_thresholds': _DEFAULT_MILESTONES,
+                   'charging_milestones': _DEFAULT_CHARGING,
+                   **_DEFAULT_PROFILE, **self.profile_data}
+        
         # Notification settings
-        self.notifications_enabled.setChecked(self.profile_data.get('notifications_enabled', True))
-        self.play_sound.setChecked(self.profile_data.get('play_sound', True))
-        self.notification_timeout.setValue(self.profile_data.get('notification_timeout', 5000))
-        self.sleep_notifications_enabled.setChecked(self.profile_data.get('sleep_notifications_enabled', True))
-        self.sleep_threshold.setValue(self.profile_data.get('sleep_threshold', 300))
+        self.notifications_enabled.setChecked(profile['notifications_enabled'])
+        self.play_sound.setChecked(profile['play_sound'])
+        self.notification_timeout.setValue(profile['notification_timeout'])
+        self.sleep_notifications_enabled.setChecked(profile['sleep_notifications_enabled'])
+        self.sleep_threshold.setValue(profile['sleep_threshold'])
         
         # Threshold settings
-        milestone_thresholds = self.profile_data.get('milestone_thresholds', [90, 80, 70, 60, 50, 40, 30, 20, 10])
-        self.milestone_thresholds.setText(', '.join(map(str, milestone_thresholds)))
-        
-        charging_milestones = self.profile_data.get('charging_milestones', [25, 50, 75, 90, 100])
-        self.charging_milestones.setText(', '.join(map(str, charging_milestones)))
+        self.milestone_thresholds.setText(
+            self.format_threshold_list('milestone_thresholds', profile['milestone_thresholds']))
+        self.charging_milestones.setText(
+            self.format_threshold_list('charging_milestones', profile['charging_milestones']))
+    
+    def format_threshold_list(self, key, values):
+        """Join a threshold list for display, reusing the last text when unchanged"""
+        values = tuple(values)  # Snapshot, so later edits to the list can't go unnoticed
+        last = self._threshold_text.get(key)
+        if last is not None and last[0] == values:
+            return last[1]
+        
+        text = ', '.join(map(str, values))
+        self._threshold_text[key] = (values, text)
+        return text
     
     def parse_threshold_list(self, text):
         """Parse comma-separated threshold list from text"""
         try:
-            # Split by comma and clean up whitespace
-            values = [int(x.strip()) for x in text.split(',') if x.strip().isdigit()]
-            # Filter valid percentages (0-100) and remove duplicates
-            values = sorted(list(set([v for v in values if 0 <= v <= 100])), reverse=True)
-            return values
+            return _parse_thresholds(text)
         except:
             return []
     
-    def validate_settings(self):
-        """Validate settings before saving"""
+    @staticmethod
+    def validate_settings(discharge_thresholds, charging_thresholds, timeout, sleep_threshold):
+        """Validate already-parsed settings before saving"""
         errors = []
         
         # Validate discharge thresholds
-        discharge_thresholds = self.parse_threshold_list(self.milestone_thresholds.text())
         if not discharge_thresholds:
             errors.append("Discharge alert levels: Must contain at least one valid percentage (0-100)")
         
         # Validate charging thresholds
-        charging_thresholds = self.parse_threshold_list(self.charging_milestones.text())
         if not charging_thresholds:
             errors.append("Charging alert levels: Must contain at least one valid percentage (0-100)")
         
         # Validate notification timeout
-        timeout = self.notification_timeout.value()
         if timeout < 1000 or timeout > 30000:
             errors.append("Notification duration: Must be between 1000 and 30000 milliseconds")
         
         # Validate sleep threshold
-        sleep_threshold = self.sleep_threshold.value()
         if sleep_threshold < 60 or sleep_threshold > 3600:
             errors.append("Sleep detection threshold: Must be between 60 and 3600 seconds")
         
@@ -442,8 +580,15 @@ class ProfileEditor(QDialog):
     def save_profile(self):
         """Save profile to file"""
         try:
+            # Read and parse the UI values once for validation and saving
+            discharge_thresholds = self.parse_threshold_list(self.milestone_thresholds.text())
+            charging_thresholds = self.parse_threshold_list(self.charging_milestones.text())
+            timeout = self.notification_timeout.value()
+            sleep_threshold = self.sleep_threshold.value()
+            
             # Validate settings first
-            errors = self.validate_settings()
+            errors = self.validate_settings(discharge_thresholds, charging_thresholds,
+                                            timeout, sleep_threshold)
             if errors:
                 error_msg = "Please fix the following errors:\n\n" + "\n".join(f"• {error}" for error in errors)
                 QMessageBox.warning(self, "Validation Errors", error_msg)
@@ -453,20 +598,27 @@ class ProfileEditor(QDialog):
             self.profile_data.update({
                 'notifications_enabled': self.notifications_enabled.isChecked(),
                 'play_sound': self.play_sound.isChecked(),
-                'notification_timeout': self.notification_timeout.value(),
+                'notification_timeout': timeout,
                 'sleep_notifications_enabled': self.sleep_notifications_enabled.isChecked(),
-                'sleep_threshold': self.sleep_threshold.value(),
-                'milestone_thresholds': self.parse_threshold_list(self.milestone_thresholds.text()),
-                'charging_milestones': self.parse_threshold_list(self.charging_milestones.text()),
+                'sleep_threshold': sleep_threshold,
+                'milestone_thresholds': discharge_thresholds,
+                'charging_milestones': charging_thresholds,
                 'version': VERSION
             })
             
             # Ensure directory exists
             os.makedirs(os.path.dirname(self.profile_path), exist_ok=True)
             
-            # Save to file
-            with open(self.profile_path, 'w', encoding='utf-8') as f:
-                json.dump(self.profile_data, f, indent=2)
+            # Save to a temp file in one write, then swap it in atomically so a
+            # crash mid-save never leaves a truncated profile behind
+            tmp_path = self.profile_path + '.tmp'
+            with open(tmp_path, 'wb') as f:
+                f.write(_dumps(self.profile_data))
+                f.flush()
+                os.fsync(f.fileno())
+            os.replace(tmp_path, self.profile_path)
+            _PROFILE_CACHE[self.profile_path] = (os.stat(self.profile_path).st_mtime_ns,
+                                                 copy.deepcopy(self.profile_data))
             
             self.status_label.setText(f"✅ Profile saved successfully to: {os.path.basename(self.profile_path)}")
             
@@ -2,29 +2,74 @@
 """
 Test script to verify custom icon functionality works
 """
-import gi
-gi.require_version('Gtk', '3.0')
-gi.require_version('Gdk', '3.0')
-gi.require_version('GdkPixbuf', '2.0')
-from gi.repository import Gtk, Gdk, GdkPixbuf
 import cairo
+import functools
 import os
 
+# Reusable ARGB32 surfaces keyed by (width, height)
+_SURFACE_POOL = {}
+
+def acquire_surface(width, height):
+    """Check out a cleared ARGB32 surface, reusing a pooled one if available"""
+    pool = _SURFACE_POOL.get((width, height))
+    if not pool:
+        # New surfaces start out transparent
+        return cairo.ImageSurface(cairo.FORMAT_ARGB32, width, height)
+    
+    surface = pool.pop()
+    ctx = cairo.Context(surface)
+    ctx.set_operator(cairo.OPERATOR_CLEAR)
+    ctx.paint()
+    return surface
+
+def release_surface(surface):
+    """Return a surface to the pool for reuse"""
+    surface.flush()
+    key = (surface.get_width(), surface.get_height())
+    _SURFACE_POOL.setdefault(key, []).append(surface)
+
+@functools.lru_cache(maxsize=8)
+def _load_icon_surface(icon_path, mtime_ns):
+    """Decode an icon template once per (path, mtime)"""
+    try:
+        print(f"Loading base icon: {icon_path}")
+        # Decode the PNG straight into an ARGB32 surface (no GdkPixbuf
+        # decode + copy-paint into a second surface)
+        return cairo.ImageSurface.create_from_png(icon_path)
+    except Exception as e:
+        print(f"Could not load base icon {icon_path}: {e}")
+    return None
+
+@functools.lru_cache(maxsize=128)
+def render_text_label(text, width, height, text_x, text_y):
+    """Rasterize outlined label text once into a transparent overlay surface"""
+    surface = cairo.ImageSurface(cairo.FORMAT_ARGB32, width, height)
+    ctx = cairo.Context(surface)
+    ctx.select_font_face("Arial", cairo.FONT_SLANT_NORMAL, cairo.FONT_WEIGHT_BOLD)
+    ctx.set_font_size(11)
+    
+    ctx.move_to(text_x, text_y)
+    ctx.text_path(text)
+    
+    # Black outline
+    ctx.set_line_width(3)
+    ctx.set_source_rgba(0.0, 0.0, 0.0, 1.0)
+    ctx.stroke_preserve()
+    
+    # White text fill
+    ctx.set_source_rgba(1.0, 1.0, 1.0, 1.0)
+    ctx.fill()
+    surface.flush()
+    return surface
+
 def load_base_icon(icon_path):
     """Load a base icon template from file"""
     try:
         if os.path.exists(icon_path):
-            print(f"Loading base icon: {icon_path}")
-            pixbuf = GdkPixbuf.Pixbuf.new_from_file(icon_path)
-            # Convert pixbuf to cairo surface
-            surface = cairo.ImageSurface(cairo.FORMAT_ARGB32, 
-                                        pixbuf.get_width(), 
-                                        pixbuf.get_height())
-            ctx = cairo.Context(surface)
-            Gdk.cairo_set_source_pixbuf(ctx, pixbuf, 0, 0)
-            ctx.paint()
-            return surface
-    except Exception as e:
+            # Surfaces are only used as paint sources, so cached ones are shared
+            return _load_icon_surface(os.path.abspath(icon_path),
+                                      os.stat(icon_path).st_mtime_ns)
+    except OSError as e:
         print(f"Could not load base icon {icon_path}: {e}")
     return None
 
@@ -58,9 +103,9 @@ def test_icon_creation():
     
     # Test creating a combined icon
     print("\nTesting icon combination...")
+    surface = acquire_surface(24, 24)
     try:
-        # Create a test surface
-        surface = cairo.ImageSurface(cairo.FORMAT_ARGB32, 24, 24)
+        # Fresh context on the (cleared) test surface; operator defaults to OVER
         ctx = cairo.Context(surface)
         
         # Load base icon if available
@@ -74,11 +119,15 @@ def test_icon_creation():
         percentage = 75
         battery_x, battery_y = 2, 8
         battery_width, battery_height = 18, 8
-        fill_width = int((battery_width * percentage) / 100)
+        fill_width = battery_width * percentage // 100
         
+        # Pixel-aligned box: skip the antialiasing rasterizer so pixman
+        # composites it as a plain integer rectangle
+        ctx.set_antialias(cairo.ANTIALIAS_NONE)
         ctx.set_source_rgba(0.2, 0.7, 0.2, 0.7)  # Green
         ctx.rectangle(battery_x, battery_y, fill_width, battery_height)
         ctx.fill()
+        ctx.set_antialias(cairo.ANTIALIAS_DEFAULT)
         print(f"✓ Added {percentage}% battery fill")
         
         # Add charging indicator
@@ -88,23 +137,10 @@ def test_icon_creation():
             ctx.paint()
             print("✓ Applied charging indicator")
         
-        # Add percentage text
+        # Add percentage text (outline + fill rasterized once per label)
         text = f"{percentage}"
-        ctx.select_font_face("Arial", cairo.FONT_SLANT_NORMAL, cairo.FONT_WEIGHT_BOLD)
-        ctx.set_font_size(11)
-        text_x, text_y = 6, 22
-        
-        ctx.move_to(text_x, text_y)
-        ctx.text_path(text)
-        
-        # Black outline
-        ctx.set_line_width(3)
-        ctx.set_source_rgba(0.0, 0.0, 0.0, 1.0)
-        ctx.stroke_preserve()
-        
-        # White text fill
-        ctx.set_source_rgba(1.0, 1.0, 1.0, 1.0)
-        ctx.fill()
+        ctx.set_source_surface(render_text_label(text, 24, 24, 6, 22), 0, 0)
+        ctx.paint()
         print("✓ Added percentage text with outline")
         
         # Save test result
@@ -117,6 +153,8 @@ def test_icon_creation():
     except Exception as e:
         print(f"✗ Test failed: {e}")
         return False
+    finally:
+        release_surface(surface)
 
 if __name__ == "__main__":
     print("BattMon Custom Icon Test")
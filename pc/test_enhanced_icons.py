@@ -5,6 +5,7 @@ Test script to generate sample battery icons showing enhanced color coding
 
 import sys
 import os
+from concurrent.futures import ThreadPoolExecutor
 
 # Add current directory to path to import from battmon_qt6
 sys.path.insert(0, '.')
@@ -19,6 +20,11 @@ except ImportError:
     print("PyQt6 or battmon_qt6 not available")
     sys.exit(1)
 
+def save_image(task):
+    """Encode one (QImage, filename) pair to PNG; safe to run off the GUI thread"""
+    image, output_file = task
+    return image.save(output_file)
+
 def generate_sample_icons():
     """Generate sample icons at different battery levels"""
     
@@ -45,14 +51,22 @@ def generate_sample_icons():
     
     print("Generating sample battery icons with enhanced color coding...")
     
+    # Render on the GUI thread; QPixmap is GUI-only but QImage is not.
+    # Each case is a distinct (percentage, charging) pair and BattMonQt6 already
+    # memoizes icons per (percentage, charging, size), so nothing is rendered twice.
+    tasks = []
     for percentage, is_charging, filename in test_cases:
         # Generate icon at larger size for better visibility
         icon = battmon.create_battery_icon(percentage, is_charging, 64)
-        pixmap = icon.pixmap(64, 64)
-        
-        # Save as PNG file
-        output_file = f"sample_icons_{filename}.png"
-        if pixmap.save(output_file):
+        image = icon.pixmap(64, 64).toImage()
+        tasks.append((image, f"sample_icons_{filename}.png"))
+    
+    # PNG encoding releases the GIL, so save all the files in parallel
+    with ThreadPoolExecutor(max_workers=os.cpu_count()) as executor:
+        results = list(executor.map(save_image, tasks))
+    
+    for (percentage, is_charging, _), (_, output_file), saved in zip(test_cases, tasks, results):
+        if saved:
             print(f"✓ Generated: {output_file} ({percentage}%, charging: {is_charging})")
         else:
             print(f"✗ Failed to generate: {output_file}")